@@ -0,0 +1,85 @@
+"""
+Response compression benchmark.
+
+Compares the Lilya `GZipMiddleware`, compressing every response at level 9, with the
+`CompressionMiddleware` picking the level by body size, without and with its cache of
+compressed bodies, when sending JSON responses of 10 KB, 100 KB and 1 MB to a client
+accepting gzip.
+
+Usage:
+
+    python -m benchmarks.compression
+"""
+
+import asyncio
+import json
+import time
+from typing import Any, Dict, List
+
+from lilya.middleware.compression import GZipMiddleware
+from lilya.types import ASGIApp, Message, Receive, Scope, Send
+
+from esmerald.middleware.compression import CompressionMiddleware
+
+SIZES = (10_000, 100_000, 1_000_000)
+NUMBER = 50
+
+
+def build_app(body: bytes) -> ASGIApp:
+    async def app(scope: Scope, receive: Receive, send: Send) -> None:
+        await send(
+            {
+                "type": "http.response.start",
+                "status": 200,
+                "headers": [
+                    (b"content-type", b"application/json"),
+                    (b"content-length", str(len(body)).encode()),
+                ],
+            }
+        )
+        await send({"type": "http.response.body", "body": body})
+
+    return app
+
+
+def build_body(size: int) -> bytes:
+    items: List[Dict[str, Any]] = []
+    length = 0
+    while length < size:
+        number = len(items)
+        items.append({"id": number, "name": f"item-{number}", "price": number * 1.5})
+        length += len(json.dumps(items[-1])) + 2
+    return json.dumps(items).encode()
+
+
+async def measure(app: ASGIApp) -> float:
+    scope = {
+        "type": "http",
+        "method": "GET",
+        "path": "/",
+        "headers": [(b"accept-encoding", b"gzip")],
+    }
+
+    async def receive() -> Message:
+        return {"type": "http.request", "body": b""}
+
+    async def send(message: Message) -> None: ...
+
+    start = time.perf_counter()
+    for _ in range(NUMBER):
+        await app(scope, receive, send)
+    return (time.perf_counter() - start) / NUMBER
+
+
+async def run() -> None:
+    print(f"{'size':>9} {'gzip 9 (us)':>12} {'levels (us)':>12} {'cached (us)':>12}")
+    for size in SIZES:
+        app = build_app(build_body(size))
+        lilya = await measure(GZipMiddleware(app))
+        levels = await measure(CompressionMiddleware(app, encodings=["gzip"], cache_size=0))
+        cached = await measure(CompressionMiddleware(app, encodings=["gzip"]))
+        print(f"{size:>9} {lilya * 1e6:>12.1f} {levels * 1e6:>12.1f} {cached * 1e6:>12.1f}")
+
+
+if __name__ == "__main__":
+    asyncio.run(run())
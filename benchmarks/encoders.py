@@ -0,0 +1,104 @@
+"""
+Encoder dispatch benchmark.
+
+Compares the lookup of the encoder of each object by calling `is_type()` on every
+registered encoder with the lookup cached per type, with 2 and with 10 encoders
+registered ahead of the Lilya ones, when serializing a list of models, dataclasses
+and enums with `json_encoder`, used by `Response.transform`.
+
+Usage:
+
+    python -m benchmarks.encoders
+"""
+
+import timeit
+from dataclasses import dataclass
+from enum import Enum
+from functools import partial
+from typing import Any, Callable, List
+
+from pydantic import BaseModel
+
+from esmerald.encoders import (
+    ENCODER_TYPES,
+    Encoder,
+    MsgSpecEncoder,
+    PydanticEncoder,
+    encoder_cache,
+    json_encoder,
+)
+
+ENCODER_COUNTS = (2, 10)
+NUMBER = 200
+
+
+class Status(str, Enum):
+    ACTIVE = "active"
+
+
+class User(BaseModel):
+    name: str
+
+
+@dataclass
+class Item:
+    name: str
+
+
+def build_encoder(number: int) -> Encoder:
+    """
+    An encoder of a type the serialized objects never are, for instance attrs classes
+    or numpy arrays.
+    """
+    kind = type(f"Kind{number}", (), {})
+
+    class KindEncoder(Encoder):
+        def is_type(self, value: Any) -> bool:
+            return isinstance(value, kind)
+
+        def serialize(self, obj: Any) -> Any:
+            return str(obj)
+
+    KindEncoder.__name__ = f"Kind{number}Encoder"
+    return KindEncoder()
+
+
+def linear_encoder(value: Any) -> Any:
+    for encoder in ENCODER_TYPES:
+        if encoder.is_type(value):
+            return encoder.serialize(value)
+    raise ValueError(f"Object of type '{type(value).__name__}' is not JSON serializable.")
+
+
+def serialize(encode: Callable[[Any], Any], values: List[Any]) -> None:
+    for value in values:
+        encode(value)
+
+
+def run() -> None:
+    values = [User(name="esmerald"), Item(name="item"), Status.ACTIVE] * 100
+    defaults = list(ENCODER_TYPES)
+
+    print(f"{'encoders':>8} {'linear (us)':>14} {'cached (us)':>14}")
+    for count in ENCODER_COUNTS:
+        # The registered encoders come first, like with `register_encoder`.
+        registered = [build_encoder(number) for number in range(count - 2)]
+        ENCODER_TYPES.clear()
+        ENCODER_TYPES.extend([*registered, PydanticEncoder(), MsgSpecEncoder(), *defaults])
+        encoder_cache.clear()
+
+        assert [linear_encoder(value) for value in values] == [
+            json_encoder(value) for value in values
+        ]
+
+        before = timeit.timeit(partial(serialize, linear_encoder, values), number=NUMBER)
+        after = timeit.timeit(partial(serialize, json_encoder, values), number=NUMBER)
+        print(f"{count:>8} {before / NUMBER * 1e6:>14.1f} {after / NUMBER * 1e6:>14.1f}")
+
+    ENCODER_TYPES.clear()
+    ENCODER_TYPES.extend(defaults)
+    encoder_cache.clear()
+
+
+if __name__ == "__main__":
+    run()
@@ -0,0 +1,101 @@
+"""
+Request parameters extraction benchmark.
+
+Compares the cost per parameter of inspecting the annotation of every parameter
+on each request against the extraction plan compiled by the `TransformerModel`.
+
+Usage:
+
+    python -m benchmarks.params
+"""
+
+import timeit
+from functools import partial
+from typing import Any, Dict, List, Optional, Set, Union, get_args, get_origin
+
+from lilya.datastructures import URL, QueryParam
+
+from esmerald.params import Query
+from esmerald.transformers.utils import (
+    ParamSetting,
+    compile_request_params,
+    extract_request_params,
+)
+from esmerald.utils.helpers import is_class_and_subclass, is_union
+
+PARAM_COUNTS = (1, 5, 20)
+NUMBER = 20000
+
+ANNOTATIONS: List[Any] = [int, str, Optional[int], List[str], Union[str, None], Dict[str, str]]
+
+
+def build_params(count: int) -> Set[ParamSetting]:
+    params = set()
+    for number in range(count):
+        annotation = ANNOTATIONS[number % len(ANNOTATIONS)]
+        field_info = Query(default=None)
+        field_info.annotation = annotation
+        params.add(
+            ParamSetting(
+                default_value=None,
+                field_alias=f"param{number}",
+                field_name=f"param{number}",
+                is_required=False,
+                param_type=field_info.in_,
+                field_info=field_info,
+            )
+        )
+    return params
+
+
+def uncompiled(params: Any, expected: Set[ParamSetting], url: URL) -> Dict[str, Any]:
+    """
+    The extraction inspecting the annotations on every request.
+    """
+    missing = [param.field_alias for param in expected if param.is_required]
+    assert not [alias for alias in missing if alias not in params]
+
+    values: Dict[str, Any] = {}
+    for param in expected:
+        annotation = param.field_info.annotation
+        if not is_union(annotation):
+            origin = get_origin(annotation) or annotation
+            if is_class_and_subclass(origin, (list, tuple)):
+                values[param.field_name] = params.values()
+            elif is_class_and_subclass(origin, dict):
+                values[param.field_name] = dict(params.items()) if params else None
+            else:
+                values[param.field_name] = params.get(param.field_alias, param.default_value)
+        else:
+            arguments = get_args(annotation)
+            if any(is_class_and_subclass(origin, (list, tuple)) for origin in arguments):
+                values[param.field_name] = params.values()
+            elif any(is_class_and_subclass(origin, dict) for origin in arguments):
+                values[param.field_name] = dict(params.items()) if params else None
+            else:
+                values[param.field_name] = params.get(param.field_alias, param.default_value)
+    return values
+
+
+def run() -> None:
+    url = URL("/items")
+    print(f"{'params':>8} {'uncompiled (ns/param)':>24} {'compiled (ns/param)':>22}")
+    for count in PARAM_COUNTS:
+        expected = build_params(count)
+        params = QueryParam("&".join(f"param{number}={number}" for number in range(count)))
+        plan = compile_request_params(expected)
+
+        assert (
+            uncompiled(params, expected, url).keys()
+            == extract_request_params(params, plan, url).keys()
+        )
+
+        before = timeit.timeit(partial(uncompiled, params, expected, url), number=NUMBER)
+        after = timeit.timeit(partial(extract_request_params, params, plan, url), number=NUMBER)
+
+        per_param = NUMBER * count / 1e9
+        print(f"{count:>8} {before / per_param:>24.1f} {after / per_param:>22.1f}")
+
+
+if __name__ == "__main__":
+    run()
@@ -0,0 +1,80 @@
+"""
+Route lookup benchmark.
+
+Compares the cost of finding the last declared route of an application using
+the linear scan of the Lilya router against the Esmerald `RouteIndex`.
+
+Usage:
+
+    python -m benchmarks.routing
+"""
+
+import timeit
+from functools import partial
+from typing import List
+
+from lilya.enums import Match
+
+from esmerald import Gateway, Include, Request, get
+from esmerald.routing._index import RouteIndex
+
+ROUTE_COUNTS = (10, 100, 1000, 3000)
+NUMBER = 2000
+
+
+def build_routes(count: int) -> List[Gateway]:
+    @get()
+    async def handler(request: Request) -> str:
+        return "ok"
+
+    per_include = 100
+    routes: List[Gateway] = []
+    for position in range(0, count, per_include):
+        routes.append(
+            Include(
+                f"/section-{position}",
+                routes=[
+                    Gateway(f"/items/{{item_id:int}}/detail-{number}", handler=handler)
+                    for number in range(min(per_include, count - position))
+                ],
+            )
+        )
+        routes.extend(
+            Gateway(f"/static-{position}-{number}", handler=handler)
+            for number in range(min(per_include, count - position))
+        )
+    return routes
+
+
+def linear(routes: List[Gateway], scope: dict) -> None:
+    for route in routes:
+        match, _ = route.search(scope)
+        if match == Match.FULL:
+            return
+
+
+def indexed(index: RouteIndex, scope: dict) -> None:
+    for route in index.candidates(scope["path"]):
+        match, _ = route.search(scope)
+        if match == Match.FULL:
+            return
+
+
+def run() -> None:
+    print(f"{'routes':>8} {'linear (us)':>14} {'indexed (us)':>14}")
+    for count in ROUTE_COUNTS:
+        routes = build_routes(count)
+        index = RouteIndex(routes)
+        last = routes[-1]
+        scope = {"type": "http", "method": "GET", "path": last.path_format, "root_path": ""}
+
+        linear_time = timeit.timeit(partial(linear, routes, scope), number=NUMBER)
+        indexed_time = timeit.timeit(partial(indexed, index, scope), number=NUMBER)
+
+        print(
+            f"{count:>8} {linear_time / NUMBER * 1e6:>14.2f} {indexed_time / NUMBER * 1e6:>14.2f}"
+        )
+
+
+if __name__ == "__main__":
+    run()
@@ -0,0 +1,80 @@
+"""
+Signature engines benchmark.
+
+Compares the validation of a JSON payload of dataclasses, with a few query
+parameters, by the signature model of the handler (the `pydantic` engine) and by
+the `msgspec` engine.
+
+Usage:
+
+    python -m benchmarks.signatures
+"""
+
+import timeit
+from dataclasses import dataclass
+from functools import partial
+from typing import Any, Dict, List, Optional
+
+from esmerald import Gateway, Router, post
+from esmerald.transformers.engines import MsgSpecSignature
+
+ITEM_COUNTS = (1, 10, 100)
+NUMBER = 2000
+
+
+@dataclass
+class Tag:
+    name: str
+    weight: float
+
+
+@dataclass
+class Item:
+    id: int
+    name: str
+    price: float
+    tags: List[Tag]
+    description: Optional[str] = None
+
+
+@post("/items")
+async def create_items(data: List[Item], limit: int = 10, q: Optional[str] = None) -> None:
+    """Creates the items."""
+
+
+def build_kwargs(count: int) -> Dict[str, Any]:
+    data = [
+        {
+            "id": number,
+            "name": f"item{number}",
+            "price": number * 1.5,
+            "tags": [{"name": "tag", "weight": 1.0}, {"name": "other", "weight": 2}],
+        }
+        for number in range(count)
+    ]
+    return {"data": data, "limit": "5", "q": "search"}
+
+
+def run() -> None:
+    Router(routes=[Gateway(handler=create_items)])
+    signature_model = create_items.signature_model
+    engine = MsgSpecSignature(signature_model)
+
+    print(f"{'items':>8} {'pydantic (us)':>16} {'msgspec (us)':>16}")
+    for count in ITEM_COUNTS:
+        kwargs = build_kwargs(count)
+        assert signature_model.parse_values_for_connection(
+            None, **kwargs
+        ) == engine.parse_values_for_connection(None, **kwargs)
+
+        before = timeit.timeit(
+            partial(signature_model.parse_values_for_connection, None, **kwargs), number=NUMBER
+        )
+        after = timeit.timeit(
+            partial(engine.parse_values_for_connection, None, **kwargs), number=NUMBER
+        )
+        print(f"{count:>8} {before / NUMBER * 1e6:>16.1f} {after / NUMBER * 1e6:>16.1f}")
+
+
+if __name__ == "__main__":
+    run()
@@ -0,0 +1,16 @@
+from esmerald import Esmerald
+from esmerald.middleware import CompressionMiddleware
+from lilya.middleware import DefineMiddleware as LilyaMiddleware
+
+routes = [...]
+
+middleware = [
+    LilyaMiddleware(
+        CompressionMiddleware,
+        minimum_size=1000,
+        minimum_sizes={"/api/reports": 10_000},
+        levels={"gzip": [(0, 6), (100_000, 1)]},
+    )
+]
+
+app = Esmerald(routes=routes, middleware=middleware)
@@ -0,0 +1,35 @@
+from typing import List
+
+from pydantic import BaseModel
+
+from esmerald import Esmerald, Gateway, ResponseCache, get, post
+from esmerald.responses.cache import FileCacheBackend
+
+
+class Product(BaseModel):
+    name: str
+    price: float
+
+
+catalog_cache = ResponseCache(ttl=60, query_params=["page"], vary=["accept-language"])
+
+
+@get(path="/catalog", cache=catalog_cache)
+async def catalog(page: int = 1) -> List[Product]:
+    return [Product(name=f"product{page}", price=9.99)]
+
+
+@post(path="/catalog")
+async def create_product(data: Product) -> Product:
+    await catalog_cache.invalidate("/catalog")
+    return data
+
+
+@get(path="/config", cache=ResponseCache(ttl=300, backend=FileCacheBackend("/var/cache/esmerald")))
+async def config() -> dict:
+    return {"maintenance": False}
+
+
+app = Esmerald(
+    routes=[Gateway(handler=catalog), Gateway(handler=create_product), Gateway(handler=config)]
+)
@@ -0,0 +1,17 @@
+from pydantic import BaseModel
+
+from esmerald import Coalesce, Esmerald, Gateway, get
+
+
+class Report(BaseModel):
+    year: int
+    total: float
+
+
+@get(path="/reports", coalesce=Coalesce(query_params=["year"], timeout=5, max_waiters=500))
+async def reports(year: int) -> Report:
+    # An expensive aggregation, run once for the identical requests in flight.
+    return Report(year=year, total=1_000_000)
+
+
+app = Esmerald(routes=[Gateway(handler=reports)])
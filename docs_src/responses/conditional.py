@@ -0,0 +1,32 @@
+from datetime import datetime
+
+from pydantic import BaseModel
+
+from esmerald import Conditional, Esmerald, Gateway, Request, get
+
+
+class Document(BaseModel):
+    id: int
+    title: str
+    updated_at: datetime
+
+
+async def get_updated_at(request: Request) -> datetime:
+    # A cheap query, for instance `SELECT updated_at FROM documents WHERE id = :id`.
+    return datetime(2024, 1, 1)
+
+
+@get(path="/documents/{id}", conditional=Conditional(last_modified=get_updated_at))
+async def document(id: int) -> Document:
+    return Document(id=id, title="Esmerald", updated_at=datetime(2024, 1, 1))
+
+
+@get(path="/settings")
+async def settings() -> dict:
+    return {"theme": "dark"}
+
+
+app = Esmerald(
+    routes=[Gateway(handler=document), Gateway(handler=settings)],
+    conditional=Conditional(),
+)
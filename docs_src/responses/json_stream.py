@@ -0,0 +1,24 @@
+from typing import AsyncIterator
+
+from pydantic import BaseModel
+
+from esmerald import Esmerald, Gateway, get
+from esmerald.datastructures import JSONStream
+
+
+class User(BaseModel):
+    id: int
+    name: str
+
+
+async def get_users() -> AsyncIterator[User]:
+    for number in range(500_000):
+        yield User(id=number, name=f"user{number}")
+
+
+@get(path="/users")
+async def users() -> JSONStream:
+    return JSONStream(iterator=get_users(), ndjson=True, batch_size=500)
+
+
+app = Esmerald(routes=[Gateway(handler=users)])
@@ -0,0 +1,16 @@
+from esmerald import Esmerald, Gateway, get
+
+VERSION = "1.0.0"
+
+
+@get(path="/health", static=True)
+async def health() -> dict:
+    return {"status": "ok"}
+
+
+@get(path="/version", static=True)
+def version() -> dict:
+    return {"version": VERSION}
+
+
+app = Esmerald(routes=[Gateway(handler=health), Gateway(handler=version)])
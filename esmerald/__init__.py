@@ -6,12 +6,12 @@ from lilya import status
 from esmerald.conf import __lazy_settings__, settings
 from esmerald.conf.global_settings import EsmeraldAPISettings
 from esmerald.context import Context
-from esmerald.injector import Factory, Inject
+from esmerald.injector import CachePolicy, Factory, Inject
 
 from .applications import ChildEsmerald, Esmerald
 from .background import BackgroundTask, BackgroundTasks
 from .config import CORSConfig, CSRFConfig, OpenAPIConfig, SessionConfig, StaticFilesConfig
-from .datastructures import JSON, Redirect, Stream, Template, UploadFile
+from .datastructures import JSON, JSONStream, Redirect, Stream, Template, UploadFile
 from .exceptions import (
     HTTPException,
     ImproperlyConfigured,
@@ -30,6 +30,9 @@ from .pluggables import Extension, Pluggable
 from .protocols import AsyncDAOProtocol, DaoProtocol, MiddlewareProtocol
 from .requests import Request
 from .responses import JSONResponse, Response, TemplateResponse
+from .responses.cache import ResponseCache
+from .responses.coalesce import Coalesce
+from .responses.conditional import Conditional
 from .routing.apis import APIView, SimpleAPIView
 from .routing.gateways import Gateway, WebhookGateway, WebSocketGateway
 from .routing.handlers import delete, get, head, options, patch, post, put, route, trace, websocket
@@ -55,6 +58,9 @@ __all__ = [
     "BackgroundTasks",
     "Body",
     "BasePermission",
+    "CachePolicy",
+    "Coalesce",
+    "Conditional",
     "ChildEsmerald",
     "Context",
     "CORSConfig",
@@ -78,6 +84,7 @@ __all__ = [
     "Injects",
     "ImproperlyConfigured",
     "JSON",
+    "JSONStream",
     "JSONResponse",
     "MethodNotAllowed",
     "MiddlewareProtocol",
@@ -92,6 +99,7 @@ __all__ = [
     "Redirect",
     "Request",
     "Response",
+    "ResponseCache",
     "Router",
     "ServiceUnavailable",
     "SessionConfig",
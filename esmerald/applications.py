@@ -27,6 +27,7 @@ from esmerald.config import CORSConfig, CSRFConfig, SessionConfig
 from esmerald.config.openapi import OpenAPIConfig
 from esmerald.config.static_files import StaticFilesConfig
 from esmerald.contrib.schedulers.base import SchedulerConfig
+from esmerald.core.di.singletons import SingletonProviders
 from esmerald.datastructures import State
 from esmerald.encoders import Encoder, MsgSpecEncoder, PydanticEncoder, register_esmerald_encoder
 from esmerald.exception_handlers import (
@@ -69,6 +70,8 @@ from esmerald.utils.helpers import is_class_and_subclass
 if TYPE_CHECKING:  # pragma: no cover
     from esmerald.conf import EsmeraldLazySettings
     from esmerald.datastructures import Secret
+    from esmerald.executors import SyncExecutorType
+    from esmerald.responses.conditional import Conditional
     from esmerald.types import SettingsType, TemplateConfig
 
 AppType = TypeVar("AppType", bound="Esmerald")
@@ -138,6 +141,11 @@ class Application(Lilya):
         "title",
         "version",
         "encoders",
+        "singletons",
+        "sync_executor",
+        "signature_engine",
+        "json_offload_threshold",
+        "conditional",
     )
 
     def __init__(
@@ -1446,6 +1454,80 @@ class Application(Lilya):
                 """
             ),
         ] = None,
+        sync_executor: Annotated[
+            Optional["SyncExecutorType"],
+            Doc(
+                """
+                How the sync handlers and dependencies of the application run. One of
+                `"inline"`, `"thread"`, `"process"` or a `esmerald.executors.SyncExecutor`
+                instance. The `Include` and the handlers can declare their own.
+
+                By default, the sync handlers and dependencies run inline, in the event loop.
+
+                **Example**
+
+                ```python
+                from esmerald import Esmerald
+                from esmerald.executors import ThreadExecutor
+
+                app = Esmerald(sync_executor=ThreadExecutor("default", total_tokens=40))
+                ```
+                """
+            ),
+        ] = None,
+        signature_engine: Annotated[
+            Optional[str],
+            Doc(
+                """
+                The engine validating the parameters of the handlers of the application.
+                One of `"pydantic"` or `"msgspec"`. The `Include` can declare its own.
+
+                **Example**
+
+                ```python
+                from esmerald import Esmerald
+
+                app = Esmerald(signature_engine="msgspec")
+                ```
+                """
+            ),
+        ] = None,
+        json_offload_threshold: Annotated[
+            Optional[int],
+            Doc(
+                """
+                The size, in bytes, from which the JSON request bodies are decoded and the
+                JSON responses encoded in worker threads instead of in the event loop.
+
+                **Example**
+
+                ```python
+                from esmerald import Esmerald
+
+                app = Esmerald(json_offload_threshold=1024 * 1024)
+                ```
+                """
+            ),
+        ] = None,
+        conditional: Annotated[
+            Optional["Conditional"],
+            Doc(
+                """
+                How the `GET` and `HEAD` requests of the application are answered with a
+                `304 Not Modified` when the `If-None-Match` or `If-Modified-Since` of the
+                request still match. The `Include`, `Gateway`, `APIView` and the handlers
+                can declare their own.
+
+                **Example**
+
+                ```python
+                from esmerald import Conditional, Esmerald
+
+                app = Esmerald(conditional=Conditional())
+                ```
+                """
+            ),
+        ] = None,
     ) -> None:
         self.settings_module = None
 
@@ -1529,6 +1611,12 @@ class Application(Lilya):
             "redirect_slashes", redirect_slashes, is_boolean=True
         )
         self.pluggables = self.load_settings_value("pluggables", pluggables)
+        self.sync_executor = self.load_settings_value("sync_executor", sync_executor)
+        self.signature_engine = self.load_settings_value("signature_engine", signature_engine)
+        self.json_offload_threshold = self.load_settings_value(
+            "json_offload_threshold", json_offload_threshold
+        )
+        self.conditional = self.load_settings_value("conditional", conditional)
 
         # OpenAPI Related
         self.root_path_in_servers = self.load_settings_value(
@@ -1575,6 +1663,8 @@ class Application(Lilya):
             security=security,
             redirect_slashes=self.redirect_slashes,
         )
+        self.singletons = SingletonProviders(self.router)
+        self.router.lifespan_context = self.singletons.lifespan(self.router.lifespan_context)
         self.get_default_exception_handlers()
         self.user_middleware = self.build_user_middleware_stack()
         self.middleware_stack = self.build_middleware_stack()
@@ -2237,6 +2327,8 @@ class Application(Lilya):
                         routes=cast("Sequence[Union[APIGateHandler, Include]]", route.routes),
                         parent=self.router,
                         security=route.security,
+                        cache=route.cache,
+                        conditional=route.conditional,
                     )
                 )
                 continue
@@ -2246,6 +2338,15 @@ class Application(Lilya):
                 if not isinstance(route.handler, WebSocketHandler)
                 else gateways.WebSocketGateway
             )
+            options: Dict[str, Any] = (
+                {
+                    "cache": route.cache,
+                    "conditional": route.conditional,
+                    "coalesce": route.coalesce,
+                }
+                if gateway is gateways.Gateway
+                else {}
+            )
 
             if self.on_startup:
                 self.on_startup.extend(router.on_startup)
@@ -2264,6 +2365,7 @@ class Application(Lilya):
                     handler=route.handler,
                     parent=self.router,
                     is_from_router=True,
+                    **options,
                 )
             )
 
@@ -2516,6 +2618,8 @@ class Application(Lilya):
 
     async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
         if scope["type"] == "lifespan":
+            # The application is built, the handlers can be compiled.
+            self.router.freeze()
             await self.router.lifespan(scope, receive, send)
             return
 
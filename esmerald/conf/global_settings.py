@@ -1,3 +1,4 @@
+from concurrent.futures import Executor
 from functools import cached_property
 from typing import TYPE_CHECKING, Any, Dict, List, Optional, Sequence, Union
 
@@ -29,6 +30,8 @@ from esmerald.types import (
 )
 
 if TYPE_CHECKING:
+    from esmerald.executors import SyncExecutorType  # pragma: no cover
+    from esmerald.responses.conditional import Conditional  # pragma: no cover
     from esmerald.routing.router import Include  # pragma: no cover
     from esmerald.types import TemplateConfig  # pragma: no cover
 
@@ -385,6 +388,78 @@ class EsmeraldAPISettings(BaseSettings):
             """
         ),
     ] = True
+    singleton_permissions: Annotated[
+        bool,
+        Doc(
+            """
+            Boolean flag indicating if the permissions and interceptors should be
+            instantiated only once, when the application starts, instead of on every
+            request.
+
+            When enabled, the permissions (including the ones combined with `&`, `|`
+            and `~`) and the interceptors of each handler are compiled into a single
+            chain calling `has_permission` and `intercept` directly. The sync
+            `has_permission` run inline unless a `permissions_executor` is provided.
+
+            !!! Warning
+                The same permission and interceptor instances are shared between
+                requests, which means they should not keep any request state.
+            """
+        ),
+    ] = False
+    signature_engine: Annotated[
+        str,
+        Doc(
+            """
+            The engine validating the parameters of the handlers. One of `"pydantic"`
+            or `"msgspec"`. The `Include` can declare its own.
+
+            The `"msgspec"` engine converts the parameters msgspec supports, such as
+            the primitives, the dataclasses or the `msgspec.Struct`, with
+            `msgspec.convert` and falls back to Pydantic for the others, for instance
+            the Pydantic models or the parameters with constraints.
+            """
+        ),
+    ] = "pydantic"
+    strict_responses: Annotated[
+        bool,
+        Doc(
+            """
+            Boolean flag indicating if the content returned by the handlers should be
+            validated against their return annotation.
+
+            The serializer of each handler is built once from its return annotation.
+            When enabled, a content not matching the annotation results in a
+            `500 Internal Server Error` instead of being serialized as it is.
+            """
+        ),
+    ] = False
+    json_offload_threshold: Annotated[
+        Optional[int],
+        Doc(
+            """
+            The size, in bytes, from which the JSON request bodies are decoded and the
+            JSON responses encoded in worker threads instead of in the event loop.
+
+            The size of a request body is its length and the size of a response is
+            estimated from its content, before encoding it. When `None`, the JSON is
+            always encoded and decoded in the event loop.
+
+            How often the offload triggers is available via
+            `esmerald.executors.get_json_offload_metrics()`.
+
+            **Example**
+
+            ```python
+            from esmerald import EsmeraldAPISettings
+
+
+            class AppSettings(EsmeraldAPISettings):
+                json_offload_threshold: int = 1024 * 1024
+            ```
+            """
+        ),
+    ] = None
     enable_scheduler: Annotated[
         bool,
         Doc(
@@ -1052,6 +1127,80 @@ class EsmeraldAPISettings(BaseSettings):
         """
         return []
 
+    @property
+    def permissions_executor(self) -> Optional[Executor]:
+        """
+        The executor used to run the sync `has_permission` of the permissions when
+        `singleton_permissions` is enabled.
+
+        When `None`, the sync `has_permission` run inline, in the event loop.
+
+        **Example**
+
+        ```python
+        from concurrent.futures import ThreadPoolExecutor
+
+        from esmerald import EsmeraldAPISettings
+
+        executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix="permissions")
+
+
+        class AppSettings(EsmeraldAPISettings):
+            singleton_permissions: bool = True
+
+            @property
+            def permissions_executor(self) -> ThreadPoolExecutor:
+                return executor
+        ```
+        """
+        return None
+
+    @property
+    def sync_executor(self) -> Optional["SyncExecutorType"]:
+        """
+        How the sync handlers and dependencies run. One of `"inline"`, `"thread"`,
+        `"process"` or a `esmerald.executors.SyncExecutor` instance.
+
+        When `None`, the sync handlers and dependencies run inline, in the event loop.
+
+        **Example**
+
+        ```python
+        from esmerald import EsmeraldAPISettings
+        from esmerald.executors import SyncExecutorType
+
+
+        class AppSettings(EsmeraldAPISettings):
+            @property
+            def sync_executor(self) -> SyncExecutorType:
+                return "thread"
+        ```
+        """
+        return None
+
+    @property
+    def conditional(self) -> Optional["Conditional"]:
+        """
+        How the `GET` and `HEAD` requests are answered with a `304 Not Modified` when
+        the `If-None-Match` or `If-Modified-Since` of the request still match the
+        `ETag` or `Last-Modified` of the response.
+
+        When `None`, the validators of the requests are ignored.
+
+        **Example**
+
+        ```python
+        from esmerald import Conditional, EsmeraldAPISettings
+
+
+        class AppSettings(EsmeraldAPISettings):
+            @property
+            def conditional(self) -> Conditional:
+                return Conditional()
+        ```
+        """
+        return None
+
     @property
     def scheduler_config(self) -> Any:
         """
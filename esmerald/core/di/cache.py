@@ -0,0 +1,254 @@
+"""
+Caching policies for the values returned by the dependency providers.
+"""
+
+import asyncio
+import math
+import time
+from collections import OrderedDict
+from contextlib import suppress
+from typing import Any, Awaitable, Callable, Dict, Hashable, NamedTuple, Optional, Set, Tuple
+
+import anyio
+
+from esmerald.exceptions import ImproperlyConfigured
+
+Provider = Callable[[], Awaitable[Any]]
+
+
+class CacheInfo(NamedTuple):
+    """
+    The statistics of a provider cache.
+
+    The `misses` count the calls to the provider, the `hits` the values served from
+    the cache, including the ones awaiting a call already in flight, and the
+    `stale_hits` the stale values served while being revalidated.
+    """
+
+    hits: int
+    misses: int
+    stale_hits: int
+    maxsize: Optional[int]
+    currsize: int
+
+
+class CachePolicy:
+    """
+    How the values of a provider are cached.
+
+    Args:
+        ttl: The seconds a value is fresh. When `None`, the values never expire.
+        maxsize: The maximum number of values kept, evicting the least recently used.
+            When `None`, the cache is unbounded.
+        stale_while_revalidate: The seconds an expired value is still served while
+            a new value is fetched in the background. Requires a `ttl`. The background
+            refresh needs the asyncio event loop, elsewhere the expired values are
+            fetched again before being served.
+
+    The values are cached per resolved arguments of the provider. Concurrent misses
+    for the same arguments trigger a single call to the provider. With a `ttl`, the
+    expired values are purged when new values are stored, at most once per `ttl`, so
+    the cache does not grow with arguments that are never requested again.
+
+    **Example**
+
+    ```python
+    from esmerald import CachePolicy, Inject
+
+    dependencies = {"jwks": Inject(get_jwks, cache=CachePolicy(ttl=300, stale_while_revalidate=60))}
+    ```
+    """
+
+    __slots__ = ("ttl", "maxsize", "stale_while_revalidate")
+
+    def __init__(
+        self,
+        ttl: Optional[float] = None,
+        maxsize: Optional[int] = None,
+        stale_while_revalidate: Optional[float] = None,
+    ) -> None:
+        if ttl is not None and ttl <= 0:
+            raise ImproperlyConfigured("The ttl of a cache policy must be positive.")
+        if maxsize is not None and maxsize <= 0:
+            raise ImproperlyConfigured("The maxsize of a cache policy must be positive.")
+        if stale_while_revalidate is not None:
+            if ttl is None:
+                raise ImproperlyConfigured("The stale_while_revalidate requires a ttl.")
+            if stale_while_revalidate < 0:
+                raise ImproperlyConfigured(
+                    "The stale_while_revalidate of a cache policy cannot be negative."
+                )
+
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self.stale_while_revalidate = stale_while_revalidate or 0.0
+
+    def __repr__(self) -> str:
+        return (
+            f"{self.__class__.__name__}(ttl={self.ttl!r}, maxsize={self.maxsize!r}, "
+            f"stale_while_revalidate={self.stale_while_revalidate!r})"
+        )
+
+
+def _in_asyncio_loop() -> bool:
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return False
+    return True
+
+
+class _Flight:
+    """
+    A call to the provider in flight, awaited by the concurrent misses.
+    """
+
+    __slots__ = ("event", "error")
+
+    def __init__(self) -> None:
+        self.event = anyio.Event()
+        self.error: Optional[Exception] = None
+
+
+class ProviderCache:
+    """
+    The values of a provider cached according to a `CachePolicy`.
+    """
+
+    def __init__(self, policy: CachePolicy) -> None:
+        self.policy = policy
+        self.entries: "OrderedDict[Hashable, Tuple[Any, float]]" = OrderedDict()
+        self.flights: Dict[Hashable, _Flight] = {}
+        self.tasks: Set["asyncio.Task[None]"] = set()
+        self.hits = 0
+        self.misses = 0
+        self.stale_hits = 0
+        self.purge_at = 0.0
+
+    @staticmethod
+    def make_key(kwargs: Dict[str, Any]) -> Optional[Hashable]:
+        """
+        Returns the key of the given provider arguments or `None` if not hashable.
+        """
+        key = tuple(sorted(kwargs.items()))
+        try:
+            hash(key)
+        except TypeError:
+            return None
+        return key
+
+    def cache_info(self) -> CacheInfo:
+        return CacheInfo(
+            hits=self.hits,
+            misses=self.misses,
+            stale_hits=self.stale_hits,
+            maxsize=self.policy.maxsize,
+            currsize=len(self.entries),
+        )
+
+    def cache_clear(self) -> None:
+        self.entries.clear()
+        self.hits = self.misses = self.stale_hits = 0
+
+    async def get(self, kwargs: Dict[str, Any], provider: Provider) -> Any:
+        """
+        Returns the cached value for the provider arguments, calling the provider on
+        a miss.
+
+        Args:
+            kwargs (Dict[str, Any]): The resolved arguments of the provider.
+            provider (Provider): Calls the provider with the arguments.
+
+        Returns:
+            Any: The value of the provider.
+        """
+        key = self.make_key(kwargs)
+        if key is None:
+            self.misses += 1
+            return await provider()
+
+        while True:
+            entry = self.entries.get(key)
+            if entry is not None:
+                value, expires_at = entry
+                now = time.monotonic()
+                if now < expires_at:
+                    self.hits += 1
+                    self.entries.move_to_end(key)
+                    return value
+                if now < expires_at + self.policy.stale_while_revalidate and _in_asyncio_loop():
+                    self.stale_hits += 1
+                    self.entries.move_to_end(key)
+                    if key not in self.flights:
+                        self.revalidate(key, provider)
+                    return value
+
+            flight = self.flights.get(key)
+            if flight is None:
+                break
+
+            await flight.event.wait()
+            if flight.error is not None:
+                raise flight.error
+            if key in self.entries:
+                self.hits += 1
+                self.entries.move_to_end(key)
+                return self.entries[key][0]
+
+        self.misses += 1
+        return await self.load(key, provider, self.flights.setdefault(key, _Flight()))
+
+    async def load(self, key: Hashable, provider: Provider, flight: _Flight) -> Any:
+        try:
+            value = await provider()
+            self.store(key, value)
+        except Exception as exc:
+            flight.error = exc
+            raise
+        finally:
+            del self.flights[key]
+            flight.event.set()
+        return value
+
+    def store(self, key: Hashable, value: Any) -> None:
+        ttl = self.policy.ttl
+        now = time.monotonic()
+        if ttl is not None and now >= self.purge_at:
+            self.purge(now)
+            self.purge_at = now + ttl
+
+        self.entries[key] = (value, math.inf if ttl is None else now + ttl)
+        self.entries.move_to_end(key)
+
+        maxsize = self.policy.maxsize
+        while maxsize is not None and len(self.entries) > maxsize:
+            self.entries.popitem(last=False)
+
+    def purge(self, now: float) -> None:
+        """
+        Removes the values no longer served, expired and past the stale window.
+        """
+        stale_while_revalidate = self.policy.stale_while_revalidate
+        expired = [
+            key
+            for key, (_, expires_at) in self.entries.items()
+            if now >= expires_at + stale_while_revalidate
+        ]
+        for key in expired:
+            del self.entries[key]
+
+    def revalidate(self, key: Hashable, provider: Provider) -> None:
+        """
+        Fetches a new value for the key in the background, keeping the stale value
+        if the provider fails.
+        """
+        flight = self.flights[key] = _Flight()
+
+        async def refresh() -> None:
+            self.misses += 1
+            with suppress(Exception):
+                await self.load(key, provider, flight)
+
+        task = asyncio.get_running_loop().create_task(refresh())
+        self.tasks.add(task)
+        task.add_done_callback(self.tasks.discard)
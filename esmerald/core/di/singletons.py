@@ -0,0 +1,77 @@
+"""
+The lifespan of the singleton dependencies of an application.
+"""
+
+from contextlib import AsyncExitStack, asynccontextmanager
+from typing import TYPE_CHECKING, Any, AsyncIterator, Callable, Dict, List
+
+import anyio
+
+from esmerald.utils.sync import unwrap_exception_group
+
+if TYPE_CHECKING:  # pragma: no cover
+    from esmerald.injector import Inject
+    from esmerald.routing.router import Router
+
+
+class SingletonProviders:
+    """
+    Builds the `Inject(singleton=True)` dependencies of the routes of a router when
+    the application starts and closes them when it shuts down.
+
+    The singletons are built concurrently and before the startup events, meaning
+    the application is only ready once every singleton is built.
+    """
+
+    __slots__ = ("router", "injects")
+
+    def __init__(self, router: "Router") -> None:
+        self.router = router
+        self.injects: List["Inject"] = []
+
+    def collect(self) -> List["Inject"]:
+        """
+        Returns the singleton dependencies declared at any level of the routes.
+        """
+        injects: Dict[int, "Inject"] = {}
+        for handler in self.router.iter_handlers(self.router.routes):
+            for inject in handler.get_dependencies().values():
+                if getattr(inject, "singleton", False):
+                    injects.setdefault(id(inject), inject)
+        return list(injects.values())
+
+    async def startup(self) -> None:
+        self.injects = self.collect()
+        if not self.injects:
+            return
+
+        try:
+            async with anyio.create_task_group() as group:
+                for inject in self.injects:
+                    group.start_soon(inject.warm_up)
+        except Exception as exc:
+            await self.shutdown()
+            raise unwrap_exception_group(exc) from None
+
+    async def shutdown(self) -> None:
+        injects, self.injects = self.injects, []
+        async with AsyncExitStack() as exit_stack:
+            for inject in injects:
+                exit_stack.push_async_callback(inject.close)
+
+    def lifespan(self, lifespan_context: Callable[[Any], Any]) -> Callable[[Any], Any]:
+        """
+        Wraps the lifespan of the application with the build and the close of the
+        singletons.
+        """
+
+        @asynccontextmanager
+        async def lifespan(app: Any) -> AsyncIterator[Any]:
+            await self.startup()
+            try:
+                async with lifespan_context(app) as state:
+                    yield state
+            finally:
+                await self.shutdown()
+
+        return lifespan
@@ -15,7 +15,7 @@ from .base import (
 from .file import File
 from .json import JSON
 from .redirect import Redirect
-from .stream import Stream
+from .stream import JSONStream, Stream
 from .template import Template
 
 __all__ = [
@@ -25,6 +25,7 @@ __all__ = [
     "FormData",
     "Header",
     "JSON",
+    "JSONStream",
     "QueryParam",
     "Redirect",
     "ResponseContainer",
@@ -9,15 +9,21 @@ from typing import (
     Generator,
     Iterable,
     Iterator,
+    List,
+    Optional,
     Type,
     Union,
 )
 
 from lilya.responses import StreamingResponse  # noqa
+from orjson import OPT_OMIT_MICROSECONDS, OPT_SERIALIZE_NUMPY, dumps
+from pydantic import PositiveInt
 from typing_extensions import Annotated, Doc
 
 from esmerald.datastructures.base import ResponseContainer  # noqa
+from esmerald.encoders import encode_json
 from esmerald.enums import MediaType
+from esmerald.responses import Response
 
 if TYPE_CHECKING:  # pragma: no cover
     from esmerald.applications import Esmerald
@@ -57,3 +63,175 @@ class Stream(ResponseContainer[StreamingResponse]):
             media_type=media_type,
             status_code=status_code,
         )
+
+
+class JSONChunker:
+    """
+    Encodes the items of a JSON stream and groups them into chunks of at most
+    `batch_size` items or, roughly, `chunk_size` bytes.
+
+    The chunks of a JSON array are the parts of a single array, the chunks of a
+    newline delimited JSON stream one line per item.
+    """
+
+    def __init__(self, ndjson: bool, batch_size: int, chunk_size: int) -> None:
+        self.ndjson = ndjson
+        self.batch_size = batch_size
+        self.chunk_size = chunk_size
+        self.parts: List[bytes] = []
+        self.size = 0
+        self.started = False
+
+    @staticmethod
+    def encode(item: Any) -> bytes:
+        """
+        Encodes an item with the registered encoders, like a JSON response.
+        """
+        body = encode_json(item)
+        if body is not None:
+            return body
+        return dumps(
+            item, default=Response.transform, option=OPT_SERIALIZE_NUMPY | OPT_OMIT_MICROSECONDS
+        )
+
+    def add(self, item: Any) -> Optional[bytes]:
+        """
+        Adds an item and returns a chunk when the current one is full.
+        """
+        body = self.encode(item)
+        self.parts.append(body)
+        self.size += len(body)
+        if len(self.parts) >= self.batch_size or self.size >= self.chunk_size:
+            return self.flush()
+        return None
+
+    def flush(self) -> bytes:
+        if self.ndjson:
+            chunk = b"\n".join(self.parts) + b"\n"
+        else:
+            chunk = (b"," if self.started else b"[") + b",".join(self.parts)
+        self.started = True
+        self.parts = []
+        self.size = 0
+        return chunk
+
+    def close(self) -> bytes:
+        """
+        Returns the last chunk of the stream.
+        """
+        chunk = self.flush() if self.parts else b""
+        if self.ndjson:
+            return chunk
+        return chunk + b"]" if self.started else b"[]"
+
+
+class JSONStream(ResponseContainer[StreamingResponse]):
+    """
+    Streams the items of an iterator, for instance the rows of a query, as a JSON
+    array or as newline delimited JSON (NDJSON), without building the whole content.
+
+    The items can be Pydantic models, `msgspec.Struct`, dicts or anything the
+    registered encoders serialize. They are encoded and sent in chunks of at most
+    `batch_size` items or about `chunk_size` bytes. The next chunk is only built once
+    the previous one was sent, meaning the memory stays flat whatever the number of
+    items.
+
+    The sync iterators are consumed in a thread pool, one chunk at a time, and the
+    async ones in the event loop.
+
+    **Example**
+
+    ```python
+    from esmerald import get
+    from esmerald.datastructures import JSONStream
+
+
+    @get("/users")
+    async def users() -> JSONStream:
+        return JSONStream(iterator=User.query.all(), ndjson=True)
+    ```
+    """
+
+    iterator: Annotated[
+        Union[
+            Iterable[Any],
+            AsyncIterable[Any],
+            Callable[[], Iterable[Any]],
+            Callable[[], AsyncIterable[Any]],
+        ],
+        Doc(
+            """
+            The iterable of the items or a function returning it.
+            """
+        ),
+    ]
+    ndjson: Annotated[
+        bool,
+        Doc(
+            """
+            Streams one JSON document per line, with the `application/x-ndjson` media
+            type, instead of a JSON array.
+            """
+        ),
+    ] = False
+    batch_size: Annotated[
+        PositiveInt,
+        Doc(
+            """
+            The maximum number of items of a chunk.
+            """
+        ),
+    ] = 100
+    chunk_size: Annotated[
+        PositiveInt,
+        Doc(
+            """
+            The size, in bytes, from which a chunk is sent before reaching the
+            `batch_size`.
+            """
+        ),
+    ] = 64 * 1024
+
+    def get_chunker(self) -> JSONChunker:
+        return JSONChunker(self.ndjson, self.batch_size, self.chunk_size)
+
+    def iterate_chunks(self, iterable: Iterable[Any]) -> Iterator[bytes]:
+        chunker = self.get_chunker()
+        for item in iterable:
+            chunk = chunker.add(item)
+            if chunk is not None:
+                yield chunk
+        yield chunker.close()
+
+    async def aiterate_chunks(self, iterable: AsyncIterable[Any]) -> AsyncIterator[bytes]:
+        chunker = self.get_chunker()
+        async for item in iterable:
+            chunk = chunker.add(item)
+            if chunk is not None:
+                yield chunk
+        yield chunker.close()
+
+    def to_response(
+        self,
+        headers: Dict[str, Any],
+        media_type: Union["MediaType", str],
+        status_code: int,
+        app: Type["Esmerald"],
+    ) -> StreamingResponse:
+        iterable = (
+            self.iterator
+            if isinstance(self.iterator, (Iterable, AsyncIterable))
+            else self.iterator()
+        )
+        content: Union[Iterator[bytes], AsyncIterator[bytes]] = (
+            self.aiterate_chunks(iterable)
+            if isinstance(iterable, AsyncIterable)
+            else self.iterate_chunks(iterable)
+        )
+        return StreamingResponse(
+            background=self.background,
+            content=content,
+            headers=headers,
+            media_type=MediaType.NDJSON if self.ndjson else MediaType.JSON,
+            status_code=status_code,
+        )
@@ -1,14 +1,16 @@
 from __future__ import annotations
 
-from typing import Any, TypeVar, get_args
+import weakref
+from enum import Enum
+from typing import Any, Dict, Literal, Optional, Set, TypeVar, cast, get_args, get_origin
+from uuid import UUID
 
 import msgspec
-from lilya._internal._encoders import json_encoder as json_encoder  # noqa
 from lilya._utils import is_class_and_subclass
 from lilya.encoders import (
     ENCODER_TYPES as ENCODER_TYPES,  # noqa
     Encoder as LilyaEncoder,  # noqa
-    register_encoder as register_encoder,  # noqa
+    register_encoder as lilya_register_encoder,
 )
 from msgspec import Struct
 from pydantic import BaseModel
@@ -41,6 +43,15 @@ class Encoder(LilyaEncoder[T]):
         """
         raise NotImplementedError("All Esmerald encoders must implement encode() method.")
 
+    def serialize_json(self, obj: Any) -> Optional[bytes]:
+        """
+        Optional function that transforms a data structure straight into
+        JSON bytes, without building the serializable object first.
+
+        When `None` is returned, the object is serialized with `serialize()`.
+        """
+        return None
+
 
 class MsgSpecEncoder(Encoder):
 
@@ -55,8 +66,13 @@ class MsgSpecEncoder(Encoder):
         return msgspec.json.decode(msgspec.json.encode(obj))
 
     def encode(self, annotation: Any, value: Any) -> Any:
+        if isinstance(annotation, type) and isinstance(value, annotation):
+            return value
         return msgspec.json.decode(msgspec.json.encode(value), type=annotation)
 
+    def serialize_json(self, obj: Any) -> Optional[bytes]:
+        return msgspec.json.encode(obj)
+
 
 class PydanticEncoder(Encoder):
 
@@ -71,6 +87,109 @@ class PydanticEncoder(Encoder):
             return value
         return annotation(**value)
 
+    def serialize_json(self, obj: BaseModel) -> Optional[bytes]:
+        """
+        Only the models with JSON native fields are serialized straight into bytes,
+        the others, for instance with dates, render differently than with `serialize()`.
+        """
+        if not is_json_native_model(type(obj)):
+            return None
+        return obj.__pydantic_serializer__.to_json(obj)
+
+
+class EncoderCache:
+    """
+    The encoders of the values and of the annotations, looked up once per type.
+
+    Looking up an encoder calls `is_type()` on every registered encoder until one
+    matches. The encoders check the type of the values, meaning the first matching
+    encoder is the same for all the values of the same concrete type and is cached
+    by type.
+
+    The cache is cleared when an encoder is registered and when the registered
+    encoders change in number.
+    """
+
+    __slots__ = ("values", "annotations", "registry", "size")
+
+    def __init__(self) -> None:
+        self.values: Dict[type, Optional[LilyaEncoder]] = {}
+        self.annotations: Dict[Any, Optional[LilyaEncoder]] = {}
+        self.registry: Any = None
+        self.size = 0
+
+    def clear(self) -> None:
+        self.values.clear()
+        self.annotations.clear()
+        self.registry = ENCODER_TYPES
+        self.size = len(ENCODER_TYPES)
+
+    def _check(self) -> None:
+        if ENCODER_TYPES is not self.registry or len(ENCODER_TYPES) != self.size:
+            self.clear()
+
+    def get(self, value: Any) -> Optional[LilyaEncoder]:
+        """
+        Returns the first registered encoder of the value or `None`.
+        """
+        if isinstance(value, type):
+            return self.get_for_annotation(value)
+
+        self._check()
+        try:
+            return self.values[type(value)]
+        except KeyError:
+            encoder = _find_encoder(value)
+            self.values[type(value)] = encoder
+            return encoder
+
+    def get_for_annotation(self, annotation: Any) -> Optional[LilyaEncoder]:
+        """
+        Returns the first registered encoder of the annotation, for instance a class,
+        or `None`.
+        """
+        self._check()
+        try:
+            return self.annotations[annotation]
+        except KeyError:
+            encoder = _find_encoder(annotation)
+            self.annotations[annotation] = encoder
+            return encoder
+        except TypeError:
+            # Unhashable annotations are not cached.
+            return _find_encoder(annotation)
+
+
+def _find_encoder(value: Any) -> Optional[LilyaEncoder]:
+    for encoder in ENCODER_TYPES:
+        if encoder.is_type(value):
+            return encoder
+    return None
+
+
+encoder_cache = EncoderCache()
+
+
+def register_encoder(encoder: LilyaEncoder[Any] | type[LilyaEncoder[Any]]) -> None:
+    """
+    Registers an encoder into the Lilya encoders and clears the encoder cache.
+    """
+    lilya_register_encoder(encoder)
+    encoder_cache.clear()
+
+
+def json_encoder(value: Any) -> Any:
+    """
+    Encodes a value into a JSON compatible format with its first registered encoder.
+
+    Raises:
+        ValueError: If no encoder serializes the value.
+    """
+    encoder = encoder_cache.get(value)
+    if encoder is None:
+        raise ValueError(f"Object of type '{type(value).__name__}' is not JSON serializable.")
+    return encoder.serialize(value)
+
 
 def register_esmerald_encoder(encoder: Encoder[Any]) -> None:
     """
@@ -89,11 +208,162 @@ def is_body_encoder(value: Any) -> bool:
     Function that checks if the value is a body encoder.
     """
     if not is_union(value):
-        return any(encoder.is_type(value) for encoder in ENCODER_TYPES)
+        return encoder_cache.get_for_annotation(value) is not None
 
     union_arguments = get_args(value)
     if not union_arguments:
         return False
     return any(
-        any(encoder.is_type(argument) for encoder in ENCODER_TYPES) for argument in union_arguments
+        encoder_cache.get_for_annotation(argument) is not None for argument in union_arguments
+    )
+
+
+# The types rendered the same by Pydantic and by the JSON response.
+JSON_NATIVE_TYPES = (str, int, float, bool, type(None), UUID)
+
+# The types serialized by the JSON response without any encoder.
+JSON_TYPES = (dict, list, str, int, float, bool, type(None))
+
+_json_native_models: weakref.WeakKeyDictionary[Any, bool] = weakref.WeakKeyDictionary()
+
+
+def _is_json_native(annotation: Any, seen: Set[Any]) -> bool:
+    if annotation in JSON_NATIVE_TYPES:
+        return True
+    if is_class_and_subclass(annotation, BaseModel):
+        return _is_json_native_model(annotation, seen)
+    if is_class_and_subclass(annotation, Enum):
+        return all(isinstance(member.value, JSON_NATIVE_TYPES) for member in annotation)
+
+    origin = get_origin(annotation)
+    if origin is Literal:
+        return all(isinstance(argument, JSON_NATIVE_TYPES) for argument in get_args(annotation))
+    if origin in (list, tuple, dict) or is_union(annotation):
+        arguments = [argument for argument in get_args(annotation) if argument is not Ellipsis]
+        return bool(arguments) and all(_is_json_native(argument, seen) for argument in arguments)
+    return False
+
+
+def _is_json_native_model(model: type[BaseModel], seen: Set[Any]) -> bool:
+    if model in _json_native_models:
+        return _json_native_models[model]
+    if model in seen:
+        return True
+    seen.add(model)
+
+    decorators = model.__pydantic_decorators__
+    is_native = (
+        model.model_config.get("extra") != "allow"
+        and not model.model_computed_fields
+        and not decorators.field_serializers
+        and not decorators.model_serializers
+        and all(_is_json_native(field.annotation, seen) for field in model.model_fields.values())
     )
+    _json_native_models[model] = is_native
+    return is_native
+
+
+def is_json_native_type(annotation: Any) -> bool:
+    """
+    Checks if the values of the annotation are rendered by Pydantic exactly like by
+    the JSON response.
+    """
+    return _is_json_native(annotation, set())
+
+
+def is_json_native_model(model: type[BaseModel]) -> bool:
+    """
+    Checks if all the fields of a Pydantic model, the nested models included, are
+    rendered by Pydantic exactly like by the JSON response, meaning the model can be
+    serialized straight into bytes.
+    """
+    return _is_json_native_model(model, set())
+
+
+def get_json_encoder(value: Any) -> Optional[Encoder]:
+    """
+    Returns the encoder of the value when it serializes the value straight into bytes.
+
+    The first encoder of the value is looked up, like when serializing it. Encoders
+    overriding `serialize()` without `serialize_json()` keep serializing the value.
+    """
+    encoder = encoder_cache.get(value)
+    if encoder is None or not _serializes_json(type(encoder)):
+        return None
+    return cast(Encoder, encoder)
+
+
+_json_serializers: weakref.WeakKeyDictionary[type, bool] = weakref.WeakKeyDictionary()
+
+
+def _serializes_json(cls: type) -> bool:
+    serializes = _json_serializers.get(cls)
+    if serializes is None:
+        serialize = _get_owner(cls, "serialize")
+        serializes = (
+            issubclass(cls, Encoder)
+            and serialize is not Encoder
+            and serialize is _get_owner(cls, "serialize_json")
+        )
+        _json_serializers[cls] = serializes
+    return serializes
+
+
+def _get_owner(cls: type, name: str) -> Optional[type]:
+    for klass in cls.__mro__:
+        if name in vars(klass):
+            return klass
+    return None
+
+
+def encode_json(content: Any) -> Optional[bytes]:
+    """
+    Serializes a model or a list of models straight into JSON bytes.
+
+    Returns:
+        Optional[bytes]: The JSON bytes or `None` when the content must be serialized
+            with the JSON encoder.
+    """
+    if type(content) is list:
+        if not content or type(content[0]) in JSON_TYPES:
+            return None
+        parts = []
+        for item in content:
+            encoder = get_json_encoder(item)
+            body = encoder.serialize_json(item) if encoder is not None else None
+            if body is None:
+                return None
+            parts.append(body)
+        return b"[" + b",".join(parts) + b"]"
+
+    if type(content) in JSON_TYPES:
+        return None
+    encoder = get_json_encoder(content)
+    return encoder.serialize_json(content) if encoder is not None else None
+
+
+def estimate_json_size(content: Any, depth: int = 4) -> int:
+    """
+    Estimates the size of the JSON of a content, in bytes, without serializing it.
+
+    The collections are estimated from their first item, the contents of the same
+    collection being expected to have the same shape.
+    """
+    if isinstance(content, (str, bytes)):
+        return len(content) + 2
+    if depth <= 0:
+        return 8
+    if isinstance(content, BaseModel):
+        return estimate_json_size(content.__dict__, depth)
+    if isinstance(content, Struct):
+        return estimate_json_size(msgspec.structs.asdict(content), depth)
+    if isinstance(content, dict):
+        if not content:
+            return 2
+        key, value = next(iter(content.items()))
+        return len(content) * (len(str(key)) + 4 + estimate_json_size(value, depth - 1))
+    if isinstance(content, (list, tuple, set, frozenset)):
+        if not content:
+            return 2
+        return len(content) * (estimate_json_size(next(iter(content)), depth - 1) + 1)
+    return 8
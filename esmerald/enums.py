@@ -22,6 +22,7 @@ class HttpMethod(StrEnum, Enum):
 
 class MediaType(StrEnum, Enum):
     JSON = "application/json"
+    NDJSON = "application/x-ndjson"
     HTML = "text/html"
     TEXT = "text/plain"
     MESSAGE_PACK = "application/x-msgpack"
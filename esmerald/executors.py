@@ -0,0 +1,370 @@
+"""
+Execution policies for the sync handlers and dependencies.
+
+By default, the sync callables run inline, in the event loop. A blocking call there
+stalls every other connection served by the worker, which is why an `Esmerald`
+application, an `Include` or a handler can declare a `sync_executor` instead.
+"""
+
+import weakref
+from functools import partial
+from importlib import import_module
+from typing import Any, Callable, Dict, NamedTuple, Optional, Union
+
+import anyio
+from anyio import to_process, to_thread
+
+from esmerald.exceptions import ImproperlyConfigured
+
+
+class ExecutorMetrics(NamedTuple):
+    """
+    The statistics of a `SyncExecutor`.
+
+    The `running` callables are the ones holding a token of the executor and the
+    `queued` ones the callables waiting for a token.
+    """
+
+    name: str
+    kind: str
+    capacity: Optional[int]
+    running: int
+    queued: int
+    completed: int
+
+    @property
+    def saturation(self) -> float:
+        """
+        The ratio of the capacity in use, from `0.0` to `1.0`.
+        """
+        if not self.capacity:
+            return 0.0
+        return self.running / self.capacity
+
+
+_executors: "weakref.WeakValueDictionary[str, SyncExecutor]" = weakref.WeakValueDictionary()
+
+
+class SyncExecutor:
+    """
+    Runs the sync callables inline, in the event loop.
+
+    This is the default behaviour and the base of the other executors.
+    """
+
+    kind = "inline"
+
+    def __init__(self, name: str = "inline") -> None:
+        self.name = name
+        self.running = 0
+        self.completed = 0
+        _executors[name] = self
+
+    @property
+    def capacity(self) -> Optional[int]:
+        return None
+
+    @property
+    def queued(self) -> int:
+        return 0
+
+    async def run(self, fn: Callable[..., Any], **kwargs: Any) -> Any:
+        """
+        Runs the sync callable with the given keyword arguments.
+        """
+        self.running += 1
+        try:
+            return await self.execute(fn, kwargs)
+        finally:
+            self.running -= 1
+            self.completed += 1
+
+    async def execute(self, fn: Callable[..., Any], kwargs: Dict[str, Any]) -> Any:
+        return fn(**kwargs)
+
+    def metrics(self) -> ExecutorMetrics:
+        return ExecutorMetrics(
+            name=self.name,
+            kind=self.kind,
+            capacity=self.capacity,
+            running=self.running,
+            queued=self.queued,
+            completed=self.completed,
+        )
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(name={self.name!r}, capacity={self.capacity!r})"
+
+
+class _LimitedExecutor(SyncExecutor):
+    def __init__(self, name: str, total_tokens: int) -> None:
+        if total_tokens <= 0:
+            raise ImproperlyConfigured("The total_tokens of an executor must be positive.")
+        super().__init__(name=name)
+        self.total_tokens = total_tokens
+        self._limiter: Optional[anyio.CapacityLimiter] = None
+
+    @property
+    def limiter(self) -> anyio.CapacityLimiter:
+        """
+        The named capacity limiter of the executor, created on first use.
+        """
+        if self._limiter is None:
+            self._limiter = anyio.CapacityLimiter(self.total_tokens)
+        return self._limiter
+
+    @property
+    def capacity(self) -> Optional[int]:
+        return self.total_tokens
+
+    @property
+    def queued(self) -> int:
+        if self._limiter is None:
+            return 0
+        return int(self._limiter.statistics().tasks_waiting)
+
+    async def run(self, fn: Callable[..., Any], **kwargs: Any) -> Any:
+        try:
+            return await self.execute(fn, kwargs)
+        finally:
+            self.completed += 1
+
+    def metrics(self) -> ExecutorMetrics:
+        running = 0 if self._limiter is None else int(self._limiter.borrowed_tokens)
+        return super().metrics()._replace(running=running)
+
+
+class ThreadExecutor(_LimitedExecutor):
+    """
+    Runs the sync callables in worker threads, at most `total_tokens` at once.
+
+    **Example**
+
+    ```python
+    from esmerald import Esmerald, Include
+    from esmerald.executors import ThreadExecutor
+
+    database = ThreadExecutor("database", total_tokens=10)
+
+    app = Esmerald(routes=[Include("/orders", routes=[...], sync_executor=database)])
+    ```
+    """
+
+    kind = "thread"
+
+    def __init__(self, name: str = "default", total_tokens: int = 40) -> None:
+        super().__init__(name=name, total_tokens=total_tokens)
+
+    async def execute(self, fn: Callable[..., Any], kwargs: Dict[str, Any]) -> Any:
+        return await to_thread.run_sync(partial(fn, **kwargs), limiter=self.limiter)
+
+
+def _import_function(module: str, qualname: str) -> Any:
+    """
+    Imports a function by name.
+
+    The handler decorators replace the function of a module by its handler, which is
+    why the function is taken from the handler when needed.
+    """
+    target: Any = import_module(module)
+    for name in qualname.split("."):
+        target = getattr(target, name)
+    return getattr(target, "fn", target)
+
+
+def _run_in_process(module: str, qualname: str, kwargs: Dict[str, Any]) -> Any:
+    """
+    Imports and calls a function in a worker process.
+    """
+    return _import_function(module, qualname)(**kwargs)
+
+
+class ProcessExecutor(_LimitedExecutor):
+    """
+    Runs the sync callables in worker processes, at most `total_tokens` at once.
+    Meant for CPU bound handlers.
+
+    The callables must be module level functions and their arguments and return values
+    must be picklable. The methods of the views, the closures and the lambdas cannot be
+    imported by the worker processes and raise an `ImproperlyConfigured` when the
+    handler is compiled. The sync dependencies of the handler run in the event loop.
+
+    **Example**
+
+    ```python
+    from esmerald import get
+    from esmerald.executors import ProcessExecutor
+
+
+    @get("/report", sync_executor=ProcessExecutor("reports", total_tokens=4))
+    def report(year: int) -> dict: ...
+    ```
+    """
+
+    kind = "process"
+
+    def __init__(self, name: str = "processes", total_tokens: int = 4) -> None:
+        super().__init__(name=name, total_tokens=total_tokens)
+
+    def validate(self, fn: Callable[..., Any]) -> None:
+        """
+        Checks that the function can be imported by name in a worker process.
+
+        Raises:
+            ImproperlyConfigured: If the function is not a module level function.
+        """
+        module = getattr(fn, "__module__", None)
+        qualname = getattr(fn, "__qualname__", "<unknown>")
+        target = None
+        if module is not None and "<" not in qualname:
+            try:
+                target = _import_function(module, qualname)
+            except (ImportError, AttributeError):
+                target = None
+
+        if target is not fn:
+            raise ImproperlyConfigured(
+                f"The process executor {self.name!r} can only run module level functions, "
+                f"{fn!r} cannot be imported by a worker process."
+            )
+
+    async def execute(self, fn: Callable[..., Any], kwargs: Dict[str, Any]) -> Any:
+        return await to_process.run_sync(
+            _run_in_process, fn.__module__, fn.__qualname__, kwargs, limiter=self.limiter
+        )
+
+
+SyncExecutorType = Union[SyncExecutor, str]
+
+_defaults: Dict[str, Callable[[], SyncExecutor]] = {
+    "inline": SyncExecutor,
+    "thread": ThreadExecutor,
+    "process": ProcessExecutor,
+}
+_default_executors: Dict[str, SyncExecutor] = {}
+
+
+def get_sync_executor(value: Optional[SyncExecutorType]) -> Optional[SyncExecutor]:
+    """
+    Returns the executor of a `sync_executor` value.
+
+    The values `"inline"`, `"thread"` and `"process"` return the default executor of
+    each kind, shared by the whole application.
+
+    Args:
+        value: A `SyncExecutor`, the name of a kind of executor or `None`.
+
+    Returns:
+        Optional[SyncExecutor]: The executor or `None` when the value is `None`.
+    """
+    if value is None or isinstance(value, SyncExecutor):
+        return value
+    if value not in _defaults:
+        raise ImproperlyConfigured(
+            f"Unknown sync_executor {value!r}. Use one of {', '.join(_defaults)} or an executor."
+        )
+
+    if value not in _default_executors:
+        _default_executors[value] = _defaults[value]()
+    return _default_executors[value]
+
+
+def get_executor_metrics() -> Dict[str, ExecutorMetrics]:
+    """
+    Returns the metrics of every executor alive, by name.
+
+    **Example**
+
+    ```python
+    from esmerald.executors import get_executor_metrics
+
+    for name, metrics in get_executor_metrics().items():
+        print(name, metrics.queued, metrics.saturation)
+    ```
+    """
+    return {name: executor.metrics() for name, executor in list(_executors.items())}
+
+
+class JSONOffloadMetrics(NamedTuple):
+    """
+    The statistics of the JSON offload.
+
+    The `inline` payloads were encoded or decoded in the event loop and the
+    `offloaded` ones, from the threshold, in the worker threads of the `executor`.
+    """
+
+    inline: int
+    offloaded: int
+    executor: ExecutorMetrics
+
+    @property
+    def ratio(self) -> float:
+        """
+        The ratio of the payloads offloaded, from `0.0` to `1.0`.
+        """
+        total = self.inline + self.offloaded
+        if not total:
+            return 0.0
+        return self.offloaded / total
+
+
+class JSONOffload:
+    """
+    Runs the JSON encoding and decoding of the large payloads in worker threads.
+
+    Encoding or decoding a payload of a few megabytes takes tens of milliseconds,
+    stalling every other connection of the worker. From the `json_offload_threshold`
+    setting, in bytes, the work runs in the threads of the `"json"` executor instead.
+    The smaller payloads stay in the event loop, where a thread hop costs more than
+    the work itself.
+    """
+
+    def __init__(self, executor: Optional[SyncExecutor] = None) -> None:
+        self._executor = executor
+        self.inline = 0
+        self.offloaded = 0
+
+    @property
+    def executor(self) -> SyncExecutor:
+        """
+        The executor of the offloaded payloads, created on first use.
+        """
+        if self._executor is None:
+            self._executor = ThreadExecutor("json")
+        return self._executor
+
+    async def run(self, fn: Callable[..., Any], *args: Any, size: int, threshold: int) -> Any:
+        """
+        Calls the function with the arguments, in a worker thread when the size of the
+        payload reaches the threshold.
+        """
+        if size < threshold:
+            self.inline += 1
+            return fn(*args)
+        self.offloaded += 1
+        return await self.executor.run(partial(fn, *args))
+
+    def metrics(self) -> JSONOffloadMetrics:
+        return JSONOffloadMetrics(
+            inline=self.inline, offloaded=self.offloaded, executor=self.executor.metrics()
+        )
+
+
+json_offload = JSONOffload()
+
+
+def get_json_offload_metrics() -> JSONOffloadMetrics:
+    """
+    Returns how many JSON payloads were encoded or decoded inline and in worker
+    threads.
+
+    **Example**
+
+    ```python
+    from esmerald.executors import get_json_offload_metrics
+
+    metrics = get_json_offload_metrics()
+    print(metrics.offloaded, metrics.ratio, metrics.executor.queued)
+    ```
+    """
+    return json_offload.metrics()
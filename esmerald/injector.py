@@ -1,6 +1,14 @@
+import inspect
+from contextlib import AsyncExitStack
+from functools import partial
 from typing import TYPE_CHECKING, Any, Dict, Optional, Tuple, Type, Union
 
+import anyio
+
+from esmerald.core.di.cache import CacheInfo, CachePolicy, ProviderCache
 from esmerald.core.di.provider import load_provider
+from esmerald.exceptions import ImproperlyConfigured
+from esmerald.executors import SyncExecutor
 from esmerald.parsers import ArbitraryHashableBaseModel
 from esmerald.transformers.signature import SignatureModel
 from esmerald.typing import Void
@@ -11,14 +19,27 @@ if TYPE_CHECKING:  # pragma: no cover
 
 
 class Factory:
-    def __init__(self, provides: Union["AnyCallable", str], *args: Any) -> None:
+    def __init__(
+        self,
+        provides: Union["AnyCallable", str],
+        *args: Any,
+        cache: Optional[CachePolicy] = None,
+        singleton: bool = False,
+    ) -> None:
         """
         The provider can be passed in separate ways. Via direct callable
         or via string value where it will be automatically imported by the application.
+
+        The values provided can be cached according to a `CachePolicy`.
+
+        A `singleton` factory injected via `Inject` is provided once, when the
+        application starts, and reused afterwards.
         """
         self.__args: Tuple[Any, ...] = ()
         self.set_args(*args)
         self.is_nested: bool = False
+        self.cache: Optional[ProviderCache] = ProviderCache(cache) if cache else None
+        self.singleton = singleton
 
         if isinstance(provides, str):
             self.provides, self.is_nested = load_provider(provides)
@@ -42,6 +63,17 @@ class Factory:
             1. MyClass.func
             2. MyClass.AnotherClass.func
         """
+        if self.cache is not None:
+            return await self.cache.get({}, self.provide)
+        return await self.provide()
+
+    def cache_info(self) -> Optional[CacheInfo]:
+        """
+        The statistics of the cache, if the factory has a cache policy.
+        """
+        return self.cache.cache_info() if self.cache is not None else None
+
+    async def provide(self) -> Any:
         if self.is_nested:
             self.provides = self.provides()
 
@@ -53,19 +85,143 @@ class Factory:
 
 
 class Inject(ArbitraryHashableBaseModel):
-    def __init__(self, dependency: "AnyCallable", use_cache: bool = False, **kwargs: Any):
+    def __init__(
+        self,
+        dependency: "AnyCallable",
+        use_cache: bool = False,
+        concurrent: bool = True,
+        request_cache: bool = True,
+        cache: Optional[CachePolicy] = None,
+        singleton: bool = False,
+        **kwargs: Any,
+    ):
+        """
+        The `concurrent` flag allows the dependency to be resolved concurrently with
+        the other dependencies of the same level. Set it to `False` for dependencies
+        that must run one after another, for instance when reading the request body.
+
+        The `request_cache` flag resolves the dependency once per request, sharing the
+        value between all its dependants. Set it to `False` to resolve it for every
+        dependant.
+
+        The `cache` policy caches the values of the dependency across requests, per
+        resolved arguments, with an optional TTL, LRU eviction and stale-while-revalidate
+        refresh. Unlike `use_cache`, which keeps the first value forever.
+
+        A `singleton` dependency is built once, without arguments, concurrently with
+        the other singletons when the application starts and closed when it shuts
+        down. When the dependency returns an async context manager, the value entered
+        is injected and the context manager exits on shutdown. The singletons are
+        built on the first injection when the lifespan of the application does not run.
+        A singleton dependency cannot take arguments, nor depend on other dependencies,
+        or an `ImproperlyConfigured` is raised.
+        """
         super().__init__(**kwargs)
         self.dependency = dependency
         self.signature_model: Optional["Type[SignatureModel]"] = None
         self.use_cache = use_cache
+        self.concurrent = concurrent
+        self.request_cache = request_cache
+        self.cache: Optional[ProviderCache] = ProviderCache(cache) if cache else None
+        self.singleton: bool = singleton or getattr(dependency, "singleton", False)
+        if self.singleton:
+            self.check_singleton()
+        self.instance: Any = Void
+        self.exit_stack: Optional[AsyncExitStack] = None
+        self.warming: Optional[anyio.Event] = None
         self.value: Any = Void
 
     async def __call__(self, **kwargs: Dict[str, Any]) -> Any:
+        return await self.resolve(kwargs)
+
+    async def resolve(
+        self, kwargs: Dict[str, Any], executor: Optional[SyncExecutor] = None
+    ) -> Any:
+        """
+        Resolves the value of the dependency.
+
+        Args:
+            kwargs (Dict[str, Any]): The resolved arguments of the dependency.
+            executor (Optional[SyncExecutor]): The executor running a sync dependency.
+                When `None`, the sync dependency runs inline.
+
+        Returns:
+            Any: The value of the dependency.
+        """
+        if self.singleton:
+            return await self.warm_up()
+        if self.cache is not None:
+            return await self.cache.get(kwargs, partial(self.provide, kwargs, executor))
+        return await self.provide(kwargs, executor)
+
+    def cache_info(self) -> Optional[CacheInfo]:
+        """
+        The statistics of the cache, if the dependency has a cache policy.
+        """
+        return self.cache.cache_info() if self.cache is not None else None
+
+    def check_singleton(self) -> None:
+        """
+        Checks that the singleton dependency can be built without arguments.
+
+        Raises:
+            ImproperlyConfigured: If the dependency declares parameters.
+        """
+        try:
+            parameters = inspect.signature(self.dependency).parameters
+        except (TypeError, ValueError):  # pragma: no cover
+            return
+        if parameters:
+            raise ImproperlyConfigured(
+                f"The singleton dependency {self.dependency!r} is built once, without "
+                f"arguments, and cannot declare parameters: {', '.join(parameters)}."
+            )
+
+    async def warm_up(self) -> Any:
+        """
+        Builds the instance of a singleton dependency, if not built yet.
+
+        Returns:
+            Any: The instance of the singleton.
+        """
+        while self.instance is Void and self.warming is not None:
+            await self.warming.wait()
+        if self.instance is not Void:
+            return self.instance
+
+        warming = self.warming = anyio.Event()
+        try:
+            exit_stack = AsyncExitStack()
+            instance = await self.provide({})
+            if hasattr(instance, "__aenter__") and hasattr(instance, "__aexit__"):
+                instance = await exit_stack.enter_async_context(instance)
+            self.exit_stack = exit_stack
+            self.instance = instance
+        finally:
+            self.warming = None
+            warming.set()
+        return instance
+
+    async def close(self) -> None:
+        """
+        Exits the context manager of a singleton dependency, if any, and discards the
+        instance.
+        """
+        exit_stack, self.exit_stack = self.exit_stack, None
+        self.instance = Void
+        if exit_stack is not None:
+            await exit_stack.aclose()
+
+    async def provide(
+        self, kwargs: Dict[str, Any], executor: Optional[SyncExecutor] = None
+    ) -> Any:
         if self.use_cache and self.value is not Void:
             return self.value
 
         if is_async_callable(self.dependency):
             value = await self.dependency(**kwargs)
+        elif executor is not None:
+            value = await executor.run(self.dependency, **kwargs)
         else:
             value = self.dependency(**kwargs)
 
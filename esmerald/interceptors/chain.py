@@ -0,0 +1,38 @@
+from typing import TYPE_CHECKING, Any, Awaitable, Callable, Sequence, Tuple
+
+if TYPE_CHECKING:  # pragma: no cover
+    from lilya.types import Receive, Scope, Send
+
+
+class InterceptorChain:
+    """
+    A sequence of interceptors instantiated once and called in order on every
+    connection, before reaching the handler.
+
+    **Example**
+
+    ```python
+    from esmerald.interceptors.chain import InterceptorChain
+
+    chain = InterceptorChain([LoggingInterceptor, CookieInterceptor])
+    await chain(scope, receive, send)
+    ```
+    """
+
+    __slots__ = ("interceptors",)
+
+    def __init__(self, interceptors: Sequence[Any]) -> None:
+        self.interceptors: Tuple[Callable[..., Awaitable[None]], ...] = tuple(
+            (interceptor() if isinstance(interceptor, type) else interceptor).intercept
+            for interceptor in interceptors
+        )
+
+    def __bool__(self) -> bool:
+        return bool(self.interceptors)
+
+    def __len__(self) -> int:
+        return len(self.interceptors)
+
+    async def __call__(self, scope: "Scope", receive: "Receive", send: "Send") -> None:
+        for intercept in self.interceptors:
+            await intercept(scope, receive, send)
@@ -1,6 +1,7 @@
 from .asyncexitstack import AsyncExitStackMiddleware
 from .authentication import BaseAuthMiddleware
 from .clickjacking import XFrameOptionsMiddleware
+from .compression import CompressionMiddleware
 from .cors import CORSMiddleware
 from .csrf import CSRFMiddleware
 from .gzip import GZipMiddleware
@@ -13,6 +14,7 @@ from .trustedhost import TrustedHostMiddleware
 __all__ = [
     "AsyncExitStackMiddleware",
     "BaseAuthMiddleware",
+    "CompressionMiddleware",
     "CORSMiddleware",
     "CSRFMiddleware",
     "GZipMiddleware",
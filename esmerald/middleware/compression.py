@@ -0,0 +1,371 @@
+"""
+Content negotiating compression of the responses with gzip, brotli and zstd.
+"""
+
+import gzip
+import hashlib
+import zlib
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import Dict, List, Mapping, Optional, Sequence, Tuple, Type
+
+from lilya.protocols.middleware import MiddlewareProtocol
+from lilya.types import ASGIApp, Message, Receive, Scope, Send
+
+from esmerald.exceptions import ImproperlyConfigured
+from esmerald.responses.static import weaken
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover
+    brotli = None
+
+try:
+    import zstandard
+except ImportError:  # pragma: no cover
+    zstandard = None
+
+RawHeaders = List[Tuple[bytes, bytes]]
+
+# The levels per encoding, by body size: each `(size, level)` applies from `size` bytes.
+# The larger bodies, and the streams, trade some ratio for a lot less CPU.
+DEFAULT_LEVELS: Dict[str, Tuple[Tuple[int, int], ...]] = {
+    "br": ((0, 5), (64 * 1024, 4), (1024 * 1024, 1)),
+    "zstd": ((0, 6), (64 * 1024, 3), (1024 * 1024, 1)),
+    "gzip": ((0, 6), (64 * 1024, 4), (1024 * 1024, 1)),
+}
+
+
+class Compressor(ABC):
+    """
+    Compresses a body, at once with `compress` or chunk by chunk with an instance.
+    """
+
+    __slots__ = ()
+
+    encoding: str = ""
+
+    @abstractmethod
+    def __init__(self, level: int) -> None: ...
+
+    @classmethod
+    @abstractmethod
+    def compress(cls, body: bytes, level: int) -> bytes: ...
+
+    @abstractmethod
+    def process(self, chunk: bytes) -> bytes:
+        """
+        Returns the compressed chunk, flushed to be decoded by the client right away.
+        """
+
+    @abstractmethod
+    def finish(self) -> bytes: ...
+
+
+class GZipCompressor(Compressor):
+    __slots__ = ("compressor",)
+
+    encoding = "gzip"
+
+    def __init__(self, level: int) -> None:
+        self.compressor = zlib.compressobj(level, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+
+    @classmethod
+    def compress(cls, body: bytes, level: int) -> bytes:
+        return gzip.compress(body, compresslevel=level, mtime=0)
+
+    def process(self, chunk: bytes) -> bytes:
+        return self.compressor.compress(chunk) + self.compressor.flush(zlib.Z_SYNC_FLUSH)
+
+    def finish(self) -> bytes:
+        return self.compressor.flush(zlib.Z_FINISH)
+
+
+class BrotliCompressor(Compressor):
+    __slots__ = ("compressor",)
+
+    encoding = "br"
+
+    def __init__(self, level: int) -> None:
+        self.compressor = brotli.Compressor(quality=level)
+
+    @classmethod
+    def compress(cls, body: bytes, level: int) -> bytes:
+        return brotli.compress(body, quality=level)  # type: ignore[no-any-return]
+
+    def process(self, chunk: bytes) -> bytes:
+        return self.compressor.process(chunk) + self.compressor.flush()  # type: ignore[no-any-return]
+
+    def finish(self) -> bytes:
+        return self.compressor.finish()  # type: ignore[no-any-return]
+
+
+class ZstdCompressor(Compressor):
+    __slots__ = ("compressor",)
+
+    encoding = "zstd"
+
+    def __init__(self, level: int) -> None:
+        self.compressor = zstandard.ZstdCompressor(level=level).compressobj()
+
+    @classmethod
+    def compress(cls, body: bytes, level: int) -> bytes:
+        return zstandard.ZstdCompressor(level=level).compress(body)  # type: ignore[no-any-return]
+
+    def process(self, chunk: bytes) -> bytes:
+        return self.compressor.compress(chunk) + self.compressor.flush(  # type: ignore[no-any-return]
+            zstandard.COMPRESSOBJ_FLUSH_BLOCK
+        )
+
+    def finish(self) -> bytes:
+        return self.compressor.flush()  # type: ignore[no-any-return]
+
+
+COMPRESSORS: Dict[str, Type[Compressor]] = {"gzip": GZipCompressor}
+if brotli is not None:
+    COMPRESSORS["br"] = BrotliCompressor
+if zstandard is not None:
+    COMPRESSORS["zstd"] = ZstdCompressor
+
+
+def negotiate_encoding(scope: Scope, encodings: Sequence[str]) -> Optional[str]:
+    """
+    Returns the encoding of `encodings` with the highest quality in the `Accept-Encoding`
+    of the request, the first one of `encodings` for the same quality, or `None`.
+    """
+    qualities: Dict[str, float] = {}
+    for name, value in scope["headers"]:
+        if name != b"accept-encoding":
+            continue
+        for coding in value.decode("latin-1").lower().split(","):
+            token, _, params = coding.partition(";")
+            quality = 1.0
+            params = params.strip()
+            if params.startswith("q="):
+                try:
+                    quality = float(params[2:])
+                except ValueError:
+                    quality = 0.0
+            qualities[token.strip()] = quality
+
+    best: Optional[str] = None
+    best_quality = 0.0
+    for encoding in encodings:
+        quality = qualities.get(encoding, qualities.get("*", 0.0))
+        if quality > best_quality:
+            best, best_quality = encoding, quality
+    return best
+
+
+class CompressionMiddleware(MiddlewareProtocol):
+    """
+    Compresses the responses with the encoding of the `Accept-Encoding` of the request,
+    brotli and zstd when installed and gzip.
+
+    The bodies of at least `minimum_size` bytes are compressed with the level of their
+    size in `levels` and the streaming responses, like `Stream`, chunk by chunk. The
+    compressed bodies are kept in a LRU cache keyed by the hash of the body, so the
+    repeated payloads are compressed once.
+
+    Args:
+        app: The 'next' ASGI app to call.
+        minimum_size: The minimum size, in bytes, of the compressed bodies.
+        minimum_sizes: The minimum sizes of the paths starting with a prefix, the longest
+            prefix first, for instance `{"/api/reports": 10_000}`.
+        encodings: The supported encodings, by order of preference. The ones not
+            installed are skipped.
+        levels: The `(size, level)` of the encodings, replacing the `DEFAULT_LEVELS`.
+        cache_size: The maximum number of compressed bodies cached. `0` disables it.
+
+    The responses already encoded are left untouched.
+
+    **Example**
+
+    ```python
+    from lilya.middleware import DefineMiddleware
+
+    from esmerald import Esmerald
+    from esmerald.middleware import CompressionMiddleware
+
+    app = Esmerald(
+        routes=[...],
+        middleware=[DefineMiddleware(CompressionMiddleware, minimum_size=1000)],
+    )
+    ```
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        minimum_size: int = 500,
+        minimum_sizes: Optional[Mapping[str, int]] = None,
+        encodings: Sequence[str] = ("br", "zstd", "gzip"),
+        levels: Optional[Mapping[str, Sequence[Tuple[int, int]]]] = None,
+        cache_size: int = 256,
+    ) -> None:
+        unknown = set(encodings).difference(DEFAULT_LEVELS)
+        if unknown:
+            raise ImproperlyConfigured(
+                f"Unsupported compression encodings: {', '.join(sorted(unknown))}."
+            )
+
+        self.app = app
+        self.minimum_size = minimum_size
+        self.minimum_sizes = sorted(
+            (minimum_sizes or {}).items(), key=lambda item: len(item[0]), reverse=True
+        )
+        self.encodings = tuple(encoding for encoding in encodings if encoding in COMPRESSORS)
+        self.levels = {
+            encoding: tuple(sorted(value))
+            for encoding, value in {**DEFAULT_LEVELS, **(levels or {})}.items()
+        }
+        self.cache_size = cache_size
+        self.cache: "OrderedDict[Tuple[str, bytes], bytes]" = OrderedDict()
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] == "http":
+            encoding = negotiate_encoding(scope, self.encodings)
+            if encoding is not None:
+                responder = CompressionResponder(
+                    self, encoding, self.get_minimum_size(scope["path"]), send
+                )
+                await self.app(scope, receive, responder)
+                return
+        await self.app(scope, receive, send)
+
+    def get_minimum_size(self, path: str) -> int:
+        for prefix, minimum_size in self.minimum_sizes:
+            if path.startswith(prefix):
+                return minimum_size
+        return self.minimum_size
+
+    def get_level(self, encoding: str, size: Optional[int] = None) -> int:
+        """
+        Returns the level of the body of `size` bytes, the level of the largest bodies for
+        the streams.
+        """
+        levels = self.levels[encoding]
+        if size is None:
+            return levels[-1][1]
+
+        level = levels[0][1]
+        for minimum, value in levels:
+            if size < minimum:
+                break
+            level = value
+        return level
+
+    def compress(self, encoding: str, body: bytes) -> bytes:
+        """
+        Returns the compressed body, from the cache when the same body was compressed
+        before.
+
+        The cache is keyed by the digest of the body and not by the `ETag`, the same
+        `ETag` can tag different resources.
+        """
+        compressor = COMPRESSORS[encoding]
+        level = self.get_level(encoding, len(body))
+        if not self.cache_size:
+            return compressor.compress(body, level)
+
+        key = (encoding, hashlib.blake2b(body, digest_size=16).digest())
+
+        compressed = self.cache.get(key)
+        if compressed is not None:
+            self.cache.move_to_end(key)
+            return compressed
+
+        compressed = compressor.compress(body, level)
+        self.cache[key] = compressed
+        if len(self.cache) > self.cache_size:
+            self.cache.popitem(last=False)
+        return compressed
+
+
+def add_vary(headers: RawHeaders) -> RawHeaders:
+    """
+    Returns the headers varying by `Accept-Encoding`.
+    """
+    values = [value for name, value in headers if name.lower() == b"vary"]
+    if any(b"accept-encoding" in value.lower() or value == b"*" for value in values):
+        return headers
+    vary = b", ".join([*values, b"Accept-Encoding"])
+    return [(name, value) for name, value in headers if name.lower() != b"vary"] + [
+        (b"vary", vary)
+    ]
+
+
+class CompressionResponder:
+    """
+    Compresses the response of a request, sent through the `send` of the application.
+    """
+
+    __slots__ = (
+        "middleware",
+        "encoding",
+        "minimum_size",
+        "send",
+        "initial_message",
+        "compressor",
+        "started",
+    )
+
+    def __init__(
+        self, middleware: CompressionMiddleware, encoding: str, minimum_size: int, send: Send
+    ) -> None:
+        self.middleware = middleware
+        self.encoding = encoding
+        self.minimum_size = minimum_size
+        self.send = send
+        self.initial_message: Optional[Message] = None
+        self.compressor: Optional[Compressor] = None
+        self.started = False
+
+    async def __call__(self, message: Message) -> None:
+        if message["type"] == "http.response.start":
+            self.initial_message = message
+            return
+        if message["type"] != "http.response.body" or self.started:
+            await self.send_body(message)
+            return
+
+        self.started = True
+        body = message.get("body", b"")
+        more_body = message.get("more_body", False)
+        headers: RawHeaders = list(self.initial_message["headers"])
+        names = {name.lower() for name, _ in headers}
+
+        if b"content-encoding" in names or (not more_body and len(body) < self.minimum_size):
+            await self.send(self.initial_message)
+            await self.send(message)
+            return
+
+        headers = [
+            (name, weaken(value) if name.lower() == b"etag" else value)
+            for name, value in add_vary(headers)
+            if name.lower() != b"content-length"
+        ]
+        headers.append((b"content-encoding", self.encoding.encode()))
+
+        if more_body:
+            compressor = COMPRESSORS[self.encoding]
+            self.compressor = compressor(self.middleware.get_level(self.encoding))
+            body = self.compressor.process(body)
+        else:
+            body = self.middleware.compress(self.encoding, body)
+            headers.append((b"content-length", str(len(body)).encode()))
+
+        self.initial_message["headers"] = headers
+        await self.send(self.initial_message)
+        await self.send({**message, "body": body})
+
+    async def send_body(self, message: Message) -> None:
+        if not self.started:
+            self.started = True
+            await self.send(self.initial_message)
+        if self.compressor is not None and message["type"] == "http.response.body":
+            body = self.compressor.process(message.get("body", b""))
+            if not message.get("more_body", False):
+                body += self.compressor.finish()
+            message = {**message, "body": body}
+        await self.send(message)
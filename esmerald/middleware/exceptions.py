@@ -124,7 +124,7 @@ class EsmeraldAPIExceptionMiddleware:  # pragma: no cover
         if isinstance(exc, (HTTPException, LilyaException)):
             content = ResponseContent(detail=exc.detail, status_code=exc.status_code)
             if isinstance(exc, HTTPException):
-                extra = exc.extra.get("extra", {})
+                extra = exc.extra.get("extra", {}) if isinstance(exc.extra, dict) else exc.extra
                 if extra:
                     content.extra = extra
         else:
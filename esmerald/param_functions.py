@@ -1,5 +1,6 @@
 from typing import Any, Callable, Optional
 
+from esmerald.core.di.cache import CachePolicy
 from esmerald.params import DirectInject
 
 
@@ -8,9 +9,12 @@ def DirectInjects(
     *,
     use_cache: bool = True,
     allow_none: bool = True,
+    cache: Optional[CachePolicy] = None,
 ) -> Any:
     """
     This function should be only called if Inject/Injects is not used in the dependencies.
     This is a simple wrapper of the classic Inject().
     """
-    return DirectInject(dependency=dependency, use_cache=use_cache, allow_none=allow_none)
+    return DirectInject(
+        dependency=dependency, use_cache=use_cache, allow_none=allow_none, cache=cache
+    )
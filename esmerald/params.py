@@ -1,5 +1,5 @@
 # from dataclasses import dataclass
-from typing import Any, Callable, Dict, List, Optional, Union
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Union
 
 from pydantic.dataclasses import dataclass
 from pydantic.fields import AliasChoices, AliasPath, FieldInfo
@@ -8,6 +8,9 @@ from esmerald.enums import EncodingType, ParamType
 from esmerald.typing import Undefined
 from esmerald.utils.constants import IS_DEPENDENCY, SKIP_VALIDATION
 
+if TYPE_CHECKING:  # pragma: no cover
+    from esmerald.core.di.cache import CachePolicy
+
 _PyUndefined: Any = Undefined
 
 
@@ -637,10 +640,12 @@ class DirectInject:  # pragma: no cover
         *,
         use_cache: bool = True,
         allow_none: bool = True,
+        cache: Optional["CachePolicy"] = None,
     ) -> None:
         self.dependency = dependency
         self.use_cache = use_cache
         self.allow_none = allow_none
+        self.cache = cache
 
     def __hash__(self) -> int:
         values: Dict[str, Any] = {}
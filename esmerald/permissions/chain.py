@@ -0,0 +1,202 @@
+import asyncio
+from abc import ABC, abstractmethod
+from concurrent.futures import Executor
+from functools import partial
+from typing import TYPE_CHECKING, Any, Optional, Sequence, Tuple
+
+from esmerald.permissions.base import AND, NOT, OR, OperandHolder, SingleOperand
+from esmerald.permissions.utils import permission_denied
+from esmerald.utils.helpers import is_async_callable
+
+if TYPE_CHECKING:  # pragma: no cover
+    from esmerald.requests import Request
+    from esmerald.types import APIGateHandler
+
+
+class CompiledPermission(ABC):
+    """
+    The base of a permission compiled into a `PermissionChain`.
+
+    A compiled permission is `is_async` when evaluating it requires awaiting, either
+    because the `has_permission` is a coroutine or because a sync `has_permission`
+    runs on an executor. Otherwise it is evaluated inline via `check()`.
+    """
+
+    __slots__ = ("is_async", "message")
+
+    def __init__(self, is_async: bool, message: Optional[str] = None) -> None:
+        self.is_async = is_async
+        self.message = message
+
+    @abstractmethod
+    def check(self, request: "Request", apiview: "APIGateHandler") -> bool:
+        """
+        Evaluates the permission inline.
+        """
+
+    @abstractmethod
+    async def acheck(self, request: "Request", apiview: "APIGateHandler") -> bool:
+        """
+        Evaluates the permission, awaiting the coroutines and the executor.
+        """
+
+
+class PermissionLeaf(CompiledPermission):
+    """
+    A single permission instance.
+    """
+
+    __slots__ = ("permission", "has_permission", "is_coroutine", "executor", "keywords")
+
+    def __init__(
+        self, permission: Any, executor: Optional[Executor] = None, keywords: bool = True
+    ) -> None:
+        self.permission = permission
+        self.has_permission = permission.has_permission
+        self.is_coroutine = is_async_callable(self.has_permission)
+        self.executor = executor
+        self.keywords = keywords
+        super().__init__(
+            is_async=self.is_coroutine or executor is not None,
+            message=getattr(permission, "message", None),
+        )
+
+    def check(self, request: "Request", apiview: "APIGateHandler") -> bool:
+        if self.keywords:
+            return bool(self.has_permission(request=request, apiview=apiview))
+        return bool(self.has_permission(request, apiview))
+
+    async def acheck(self, request: "Request", apiview: "APIGateHandler") -> bool:
+        if self.is_coroutine:
+            if self.keywords:
+                return bool(await self.has_permission(request=request, apiview=apiview))
+            return bool(await self.has_permission(request, apiview))
+
+        if self.executor is not None:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self.executor, partial(self.check, request, apiview))
+        return self.check(request, apiview)
+
+
+class PermissionAnd(CompiledPermission):
+    __slots__ = ("op1", "op2")
+
+    def __init__(self, op1: CompiledPermission, op2: CompiledPermission) -> None:
+        self.op1 = op1
+        self.op2 = op2
+        super().__init__(is_async=op1.is_async or op2.is_async)
+
+    def check(self, request: "Request", apiview: "APIGateHandler") -> bool:
+        return self.op1.check(request, apiview) and self.op2.check(request, apiview)
+
+    async def acheck(self, request: "Request", apiview: "APIGateHandler") -> bool:
+        return await self.op1.acheck(request, apiview) and await self.op2.acheck(request, apiview)
+
+
+class PermissionOr(CompiledPermission):
+    __slots__ = ("op1", "op2")
+
+    def __init__(self, op1: CompiledPermission, op2: CompiledPermission) -> None:
+        self.op1 = op1
+        self.op2 = op2
+        super().__init__(is_async=op1.is_async or op2.is_async)
+
+    def check(self, request: "Request", apiview: "APIGateHandler") -> bool:
+        return self.op1.check(request, apiview) or self.op2.check(request, apiview)
+
+    async def acheck(self, request: "Request", apiview: "APIGateHandler") -> bool:
+        return await self.op1.acheck(request, apiview) or await self.op2.acheck(request, apiview)
+
+
+class PermissionNot(CompiledPermission):
+    __slots__ = ("op1",)
+
+    def __init__(self, op1: CompiledPermission) -> None:
+        self.op1 = op1
+        super().__init__(is_async=op1.is_async)
+
+    def check(self, request: "Request", apiview: "APIGateHandler") -> bool:
+        return not self.op1.check(request, apiview)
+
+    async def acheck(self, request: "Request", apiview: "APIGateHandler") -> bool:
+        return not await self.op1.acheck(request, apiview)
+
+
+OPERATORS = {AND: PermissionAnd, OR: PermissionOr}
+
+
+def compile_permission(
+    permission: Any, executor: Optional[Executor] = None, keywords: bool = True
+) -> CompiledPermission:
+    """
+    Compiles a permission class, instance or `AND`/`OR`/`NOT` operand holder into
+    a `CompiledPermission`, instantiating every permission class once.
+
+    Args:
+        permission: The permission to compile.
+        executor: The executor used to run the sync `has_permission`. When `None`,
+            the sync `has_permission` runs inline.
+        keywords: If the `has_permission` is called with keyword arguments. The
+            operands of `AND`/`OR`/`NOT` are called with positional arguments.
+
+    Returns:
+        CompiledPermission: The compiled permission.
+    """
+    if isinstance(permission, OperandHolder) and permission.operator_class in OPERATORS:
+        return OPERATORS[permission.operator_class](
+            compile_permission(permission.op1_class, executor, keywords=False),
+            compile_permission(permission.op2_class, executor, keywords=False),
+        )
+
+    if isinstance(permission, SingleOperand) and permission.operator_class is NOT:
+        return PermissionNot(compile_permission(permission.op1_class, executor, keywords=False))
+
+    if isinstance(permission, type):
+        permission = permission()
+    return PermissionLeaf(permission, executor=executor, keywords=keywords)
+
+
+class PermissionChain:
+    """
+    A sequence of permissions instantiated once and evaluated in order on every
+    connection.
+
+    Sync `has_permission` are evaluated inline, without going through a thread,
+    unless an `executor` is provided.
+
+    **Example**
+
+    ```python
+    from esmerald.permissions import AllowAny, DenyAll
+    from esmerald.permissions.chain import PermissionChain
+
+    chain = PermissionChain([AllowAny, ~DenyAll])
+    await chain(request, handler)
+    ```
+    """
+
+    __slots__ = ("permissions",)
+
+    def __init__(self, permissions: Sequence[Any], executor: Optional[Executor] = None) -> None:
+        self.permissions: Tuple[CompiledPermission, ...] = tuple(
+            compile_permission(permission, executor) for permission in permissions
+        )
+
+    def __bool__(self) -> bool:
+        return bool(self.permissions)
+
+    def __len__(self) -> int:
+        return len(self.permissions)
+
+    async def __call__(self, request: "Request", apiview: "APIGateHandler") -> None:
+        """
+        Raises a `PermissionDenied` for the first permission not allowing the connection.
+        """
+        for permission in self.permissions:
+            if permission.is_async:
+                allowed = await permission.acheck(request, apiview)
+            else:
+                allowed = permission.check(request, apiview)
+
+            if not allowed:
+                permission_denied(request, message=permission.message)
@@ -1,4 +1,4 @@
-from typing import TYPE_CHECKING, Any, cast
+from typing import TYPE_CHECKING, Any, Callable, cast
 
 from lilya._internal._connection import Connection as Connection  # noqa: F401
 from lilya.datastructures import URL  # noqa
@@ -11,6 +11,7 @@ from lilya.requests import (
 from lilya.types import Receive, Scope, Send
 from orjson import loads
 
+from esmerald.executors import json_offload
 from esmerald.typing import Void
 
 if TYPE_CHECKING:  # pragma: no cover
@@ -57,15 +58,35 @@ class Request(LilyaRequest):
         ), "RequestSettingsMiddleware must be added to the middlewares"
         return cast("EsmeraldAPISettings", self.scope["app_settings"])
 
+    async def json_body(self) -> bytes:
+        """
+        The raw JSON body of the request, `null` when the body is empty.
+
+        The body is read once and shared by the requests of the same connection.
+        """
+        if "_body" in self.scope:
+            return cast("bytes", self.scope["_body"])
+        body = self.scope["_body"] = await self.body() or b"null"
+        return body
+
     async def json(self) -> Any:
         if self._json is Void:
-            if "_body" in self.scope:
-                body = self.scope["_body"]
-            else:
-                body = self.scope["_body"] = await self.body() or b"null"
-            self._json = loads(body)
+            self._json = await self.decode_json(loads)
         return self._json
 
+    async def decode_json(self, decoder: Callable[[bytes], Any]) -> Any:
+        """
+        Decodes the raw JSON body with the decoder.
+
+        From the `json_offload_threshold` of the application, the body is decoded in
+        a worker thread instead of in the event loop.
+        """
+        body = await self.json_body()
+        threshold = getattr(self.scope.get("app"), "json_offload_threshold", None)
+        if threshold is None:
+            return decoder(body)
+        return await json_offload.run(decoder, body, size=len(body), threshold=threshold)
+
     def path_for(self, __name: str, **path_params: Any) -> Any:
         url: URL = super().path_for(__name, **path_params)
         return str(url)
@@ -1,6 +1,7 @@
 from typing import (
     TYPE_CHECKING,
     Any,
+    Callable,
     Dict,
     Generic,
     NoReturn,
@@ -26,7 +27,7 @@ from lilya.responses import (
 from orjson import OPT_OMIT_MICROSECONDS, OPT_SERIALIZE_NUMPY, dumps
 from typing_extensions import Annotated, Doc
 
-from esmerald.encoders import Encoder, json_encoder
+from esmerald.encoders import Encoder, encode_json, json_encoder
 from esmerald.enums import MediaType
 from esmerald.exceptions import ImproperlyConfigured
 
@@ -162,8 +163,19 @@ class Response(LilyaResponse, Generic[T]):
                 """
             ),
         ] = None,
-    ) -> None:
+        serializer: Annotated[
+            Optional[Callable[[Any], Optional[bytes]]],
+            Doc(
+                """
+                A callable serializing the JSON content straight into bytes, for instance
+                the serializer built from the return annotation of a handler.
 
+                When it returns `None`, the content is serialized the usual way.
+                """
+            ),
+        ] = None,
+    ) -> None:
+        self.serializer = serializer
         super().__init__(
             content=content,
             status_code=status_code,
@@ -196,6 +208,12 @@ class Response(LilyaResponse, Generic[T]):
             ):
                 return b""
             if self.media_type == MediaType.JSON:
+                # Models and lists of models are serialized straight into bytes.
+                body = self.serializer(content) if self.serializer is not None else None
+                if body is None:
+                    body = encode_json(content)
+                if body is not None:
+                    return body
                 return dumps(
                     content,
                     default=self.transform,
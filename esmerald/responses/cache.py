@@ -0,0 +1,435 @@
+"""
+Caching of the responses of the handlers.
+"""
+
+import contextlib
+import hashlib
+import json
+import math
+import os
+import shutil
+import tempfile
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import TYPE_CHECKING, AbstractSet, List, NamedTuple, Optional, Sequence, Tuple
+from urllib.parse import parse_qsl, urlencode
+
+import anyio
+
+from esmerald.exceptions import ImproperlyConfigured
+
+if TYPE_CHECKING:  # pragma: no cover
+    from lilya.responses import Response as LilyaResponse
+    from lilya.types import Receive, Scope, Send
+
+    from esmerald.requests import Request
+
+DEFAULT_MAXSIZE = 1024
+CACHEABLE_METHODS = frozenset({"GET", "HEAD"})
+RawHeaders = Tuple[Tuple[bytes, bytes], ...]
+
+
+class CachedResponse(NamedTuple):
+    """
+    The serialized response stored in a cache backend.
+    """
+
+    status_code: int
+    headers: RawHeaders
+    body: bytes
+
+    async def __call__(self, scope: "Scope", receive: "Receive", send: "Send") -> None:
+        await send(
+            {
+                "type": "http.response.start",
+                "status": self.status_code,
+                "headers": list(self.headers),
+            }
+        )
+        await send({"type": "http.response.body", "body": self.body})
+
+    @property
+    def encoded_headers(self) -> List[Tuple[bytes, bytes]]:
+        return list(self.headers)
+
+
+def make_request_key(
+    request: "Request", query_params: Optional[AbstractSet[str]], headers: Sequence[str]
+) -> str:
+    """
+    Returns the key of a request, built from its method, the query parameters, all of
+    them when `query_params` is `None`, and the values of the given headers.
+    """
+    query = [
+        (name, value)
+        for name, value in parse_qsl(
+            request.scope.get("query_string", b"").decode("latin-1"), keep_blank_values=True
+        )
+        if query_params is None or name in query_params
+    ]
+    key = f"{request.method} {urlencode(sorted(query))}"
+    for name in headers:
+        key += f"\n{name}: {request.headers.get(name, '')}"
+    return key
+
+
+def serialize_response(response: "LilyaResponse") -> Optional[CachedResponse]:
+    """
+    Returns the serialized response or `None` when it has no body, for instance a
+    streaming response, or sets cookies.
+    """
+    body = getattr(response, "body", None)
+    if not isinstance(body, (bytes, str)):
+        return None
+
+    headers = tuple(response.encoded_headers)
+    if any(name.lower() == b"set-cookie" for name, _ in headers):
+        return None
+    if isinstance(body, str):
+        body = body.encode(response.charset)
+    return CachedResponse(response.status_code, headers, body)
+
+
+class CacheBackend(ABC):
+    """
+    The storage of the cached responses.
+
+    The responses are stored per path and per key, the key identifying the variant
+    of the response for the query parameters and the `Vary` headers of the request.
+    """
+
+    __slots__ = ()
+
+    @abstractmethod
+    async def get(self, path: str, key: str) -> Optional[CachedResponse]:
+        """
+        Returns the response stored for the key, if any and not expired.
+        """
+
+    @abstractmethod
+    async def set(
+        self, path: str, key: str, response: CachedResponse, ttl: Optional[float]
+    ) -> None:
+        """
+        Stores the response for the key, for `ttl` seconds or forever if `None`.
+        """
+
+    @abstractmethod
+    async def delete(self, path: str) -> None:
+        """
+        Removes all the responses stored for the path.
+        """
+
+    @abstractmethod
+    async def clear(self) -> None:
+        """
+        Removes all the stored responses.
+        """
+
+
+class MemoryCacheBackend(CacheBackend):
+    """
+    Stores the responses in the memory of the process.
+
+    Args:
+        maxsize: The maximum number of responses kept, evicting the least recently used.
+    """
+
+    __slots__ = ("maxsize", "entries")
+
+    def __init__(self, maxsize: int = DEFAULT_MAXSIZE) -> None:
+        if maxsize <= 0:
+            raise ImproperlyConfigured("The maxsize of a cache backend must be positive.")
+
+        self.maxsize = maxsize
+        self.entries: "OrderedDict[Tuple[str, str], Tuple[CachedResponse, float]]" = OrderedDict()
+
+    async def get(self, path: str, key: str) -> Optional[CachedResponse]:
+        entry = self.entries.get((path, key))
+        if entry is None:
+            return None
+
+        response, expires_at = entry
+        if time.monotonic() >= expires_at:
+            del self.entries[(path, key)]
+            return None
+
+        self.entries.move_to_end((path, key))
+        return response
+
+    async def set(
+        self, path: str, key: str, response: CachedResponse, ttl: Optional[float]
+    ) -> None:
+        self.entries[(path, key)] = (
+            response,
+            math.inf if ttl is None else time.monotonic() + ttl,
+        )
+        self.entries.move_to_end((path, key))
+
+        while len(self.entries) > self.maxsize:
+            self.entries.popitem(last=False)
+
+    async def delete(self, path: str) -> None:
+        for entry in [entry for entry in self.entries if entry[0] == path]:
+            del self.entries[entry]
+
+    async def clear(self) -> None:
+        self.entries.clear()
+
+
+class FileCacheBackend(CacheBackend):
+    """
+    Stores the responses in a directory, shared by the processes of the application.
+
+    Each path has its own directory and each variant of the response its own file,
+    both named after a digest. The files are read and written in a worker thread.
+
+    Args:
+        directory: The directory of the cache, created if missing.
+        maxsize: The maximum number of responses kept, evicting the least recently used.
+            When `None`, the cache is unbounded. The responses written by the process
+            are counted and the directory is only scanned when the count goes over
+            `maxsize`, evicting a tenth of the responses at once.
+    """
+
+    __slots__ = ("directory", "maxsize", "count", "lock")
+
+    def __init__(self, directory: str, maxsize: Optional[int] = None) -> None:
+        if maxsize is not None and maxsize <= 0:
+            raise ImproperlyConfigured("The maxsize of a cache backend must be positive.")
+
+        self.directory = directory
+        self.maxsize = maxsize
+        # The number of stored responses, approximated between two scans of the directory.
+        self.count: Optional[int] = None
+        self.lock = threading.Lock()
+
+    def get_path(self, path: str, key: Optional[str] = None) -> str:
+        location = os.path.join(self.directory, hashlib.sha256(path.encode()).hexdigest())
+        if key is None:
+            return location
+        return os.path.join(location, hashlib.sha256(key.encode()).hexdigest())
+
+    def read(self, location: str) -> Optional[CachedResponse]:
+        try:
+            with open(location, "rb") as cached:
+                header, body = cached.read().split(b"\n", 1)
+            metadata = json.loads(header)
+            if metadata["expires_at"] is not None and time.time() >= metadata["expires_at"]:
+                os.remove(location)
+                return None
+            # Touched so the least recently used responses are evicted first.
+            os.utime(location)
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+
+        headers = tuple(
+            (name.encode("latin-1"), value.encode("latin-1"))
+            for name, value in metadata["headers"]
+        )
+        return CachedResponse(metadata["status_code"], headers, body)
+
+    def write(self, location: str, response: CachedResponse, ttl: Optional[float]) -> None:
+        metadata = {
+            "status_code": response.status_code,
+            "headers": [
+                [name.decode("latin-1"), value.decode("latin-1")]
+                for name, value in response.headers
+            ],
+            "expires_at": None if ttl is None else time.time() + ttl,
+        }
+        # Written to a unique temporary file first so concurrent readers never read a
+        # partial file and concurrent writers of the same response never share a file.
+        # Storing is best effort, a failure, like a concurrent `delete()`, is ignored.
+        try:
+            os.makedirs(os.path.dirname(location), exist_ok=True)
+            descriptor, temporary = tempfile.mkstemp(dir=os.path.dirname(location), suffix=".tmp")
+        except OSError:
+            return
+        try:
+            with os.fdopen(descriptor, "wb") as cached:
+                cached.write(json.dumps(metadata).encode() + b"\n" + response.body)
+            created = not os.path.exists(location)
+            os.replace(temporary, location)
+        except OSError:
+            with contextlib.suppress(OSError):
+                os.remove(temporary)
+            return
+
+        if self.maxsize is None:
+            return
+        with self.lock:
+            if self.count is None:
+                self.evict(self.maxsize)
+            elif created:
+                self.count += 1
+                if self.count > self.maxsize:
+                    self.evict(self.maxsize - self.maxsize // 10)
+
+    def evict(self, maxsize: int) -> None:
+        """
+        Removes the least recently used responses over `maxsize`, scanning the directory.
+        """
+        entries: List[Tuple[float, str]] = []
+        with os.scandir(self.directory) as paths:
+            for path in paths:
+                if not path.is_dir():
+                    continue
+                # The files can be removed concurrently, by another writer or a `delete()`.
+                with contextlib.suppress(OSError), os.scandir(path.path) as files:
+                    for file in files:
+                        if file.name.endswith(".tmp"):
+                            continue
+                        with contextlib.suppress(OSError):
+                            entries.append((file.stat().st_mtime, file.path))
+
+        entries.sort()
+        for _, location in entries[: max(len(entries) - maxsize, 0)]:
+            try:
+                os.remove(location)
+            except OSError:  # pragma: no cover
+                continue
+        self.count = min(len(entries), maxsize)
+
+    async def get(self, path: str, key: str) -> Optional[CachedResponse]:
+        return await anyio.to_thread.run_sync(self.read, self.get_path(path, key))
+
+    async def set(
+        self, path: str, key: str, response: CachedResponse, ttl: Optional[float]
+    ) -> None:
+        await anyio.to_thread.run_sync(self.write, self.get_path(path, key), response, ttl)
+
+    async def delete(self, path: str) -> None:
+        await anyio.to_thread.run_sync(
+            lambda: shutil.rmtree(self.get_path(path), ignore_errors=True)
+        )
+        self.count = None
+
+    async def clear(self) -> None:
+        await anyio.to_thread.run_sync(lambda: shutil.rmtree(self.directory, ignore_errors=True))
+        self.count = 0
+
+
+class ResponseCache:
+    """
+    How the responses of the `GET` and `HEAD` handlers are cached.
+
+    A cached response is sent as is, without resolving the dependencies nor calling
+    the handler. Only the responses with a body, a cacheable status code, no cookies
+    and no `Cache-Control: private` or `no-store` are stored. The permissions and the
+    interceptors still run for every request.
+
+    Args:
+        ttl: The seconds a response is fresh. When `None`, the responses never expire.
+        maxsize: The maximum number of responses kept in memory, evicting the least
+            recently used. Defaults to 1024. Only used without a `backend`.
+        query_params: The names of the query parameters the responses vary with. When
+            `None`, all of them.
+        vary: The names of the request headers the responses vary with, added to the
+            `Vary` header of the responses.
+        status_codes: The status codes of the responses stored.
+        backend: Where the responses are stored. Defaults to a `MemoryCacheBackend`.
+
+    **Example**
+
+    ```python
+    from esmerald import ResponseCache, get
+
+    catalog_cache = ResponseCache(ttl=60, query_params=["page"], vary=["accept-language"])
+
+
+    @get("/catalog", cache=catalog_cache)
+    async def catalog(page: int = 1) -> List[Product]: ...
+
+
+    # When the catalog changes.
+    await catalog_cache.invalidate("/catalog")
+    ```
+    """
+
+    __slots__ = ("ttl", "query_params", "vary", "status_codes", "backend")
+
+    def __init__(
+        self,
+        ttl: Optional[float] = None,
+        maxsize: Optional[int] = None,
+        query_params: Optional[Sequence[str]] = None,
+        vary: Sequence[str] = (),
+        status_codes: Sequence[int] = (200,),
+        backend: Optional[CacheBackend] = None,
+    ) -> None:
+        if ttl is not None and ttl <= 0:
+            raise ImproperlyConfigured("The ttl of a response cache must be positive.")
+        if backend is not None and maxsize is not None:
+            raise ImproperlyConfigured("The maxsize of a custom backend is set on the backend.")
+
+        self.ttl = ttl
+        self.query_params = None if query_params is None else frozenset(query_params)
+        self.vary = tuple(sorted({name.lower() for name in vary}))
+        self.status_codes = frozenset(status_codes)
+        self.backend = (
+            backend if backend is not None else MemoryCacheBackend(maxsize or DEFAULT_MAXSIZE)
+        )
+
+    def __repr__(self) -> str:
+        return (
+            f"{self.__class__.__name__}(ttl={self.ttl!r}, vary={list(self.vary)!r}, "
+            f"backend={self.backend.__class__.__name__})"
+        )
+
+    def make_key(self, request: "Request") -> str:
+        """
+        Returns the key of the variant of the response for the request.
+        """
+        return make_request_key(request, self.query_params, self.vary)
+
+    async def get(self, request: "Request") -> Optional[CachedResponse]:
+        """
+        Returns the cached response for the request, if any.
+        """
+        if request.method not in CACHEABLE_METHODS:
+            return None
+        return await self.backend.get(request.url.path, self.make_key(request))
+
+    async def store(self, request: "Request", response: "LilyaResponse") -> None:
+        """
+        Stores the response of the request, when cacheable, adding the `Vary` header.
+        """
+        if (
+            request.method not in CACHEABLE_METHODS
+            or response.status_code not in self.status_codes
+        ):
+            return
+
+        for name, value in response.encoded_headers:
+            lowered = name.lower()
+            if lowered == b"cache-control" and any(
+                directive in value.lower() for directive in (b"private", b"no-store")
+            ):
+                return
+            if lowered == b"vary":
+                # The key of the response must vary with every header it varies with.
+                names = {item.strip().lower() for item in value.decode("latin-1").split(",")}
+                if not names <= set(self.vary):
+                    return
+
+        if self.vary:
+            response.headers["vary"] = ", ".join(self.vary)
+
+        cached = serialize_response(response)
+        if cached is not None:
+            await self.backend.set(request.url.path, self.make_key(request), cached, self.ttl)
+
+    async def invalidate(self, path: str) -> None:
+        """
+        Removes all the cached responses of the path, for instance `/catalog`.
+        """
+        await self.backend.delete(path)
+
+    async def clear(self) -> None:
+        """
+        Removes all the cached responses.
+        """
+        await self.backend.clear()
@@ -0,0 +1,152 @@
+"""
+Coalescing of the identical requests in flight.
+"""
+
+from typing import TYPE_CHECKING, Awaitable, Callable, Dict, Optional, Sequence, Union
+
+import anyio
+
+from esmerald.exceptions import ImproperlyConfigured
+from esmerald.responses.cache import CachedResponse, make_request_key, serialize_response
+
+if TYPE_CHECKING:  # pragma: no cover
+    from lilya.responses import Response as LilyaResponse
+
+    from esmerald.requests import Request
+
+COALESCED_METHODS = frozenset({"GET", "HEAD"})
+AnyResponse = Union["LilyaResponse", CachedResponse]
+ResponseBuilder = Callable[[], Awaitable[AnyResponse]]
+
+
+class _Flight:
+    """
+    A response in flight, awaited by the identical requests.
+    """
+
+    __slots__ = ("event", "response", "error", "waiters")
+
+    def __init__(self) -> None:
+        self.event = anyio.Event()
+        self.response: Optional[CachedResponse] = None
+        self.error: Optional[Exception] = None
+        self.waiters = 0
+
+
+class Coalesce:
+    """
+    How the identical `GET` and `HEAD` requests in flight are coalesced.
+
+    The first request builds the response while the identical ones, with the same
+    path, query parameters and `headers`, wait for it and get a copy of its serialized
+    body and headers. The waiters get the same error if building the response fails.
+    The permissions and the interceptors still run for every request.
+
+    Args:
+        query_params: The names of the query parameters identifying the requests. When
+            `None`, all of them.
+        headers: The names of the request headers identifying the requests, for
+            instance `authorization` when the responses depend on the user.
+        timeout: The seconds a request waits for the response in flight before building
+            its own. When `None`, it waits until the response is built.
+        max_waiters: The maximum number of requests waiting for the same response. The
+            following ones build their own. When `None`, unbounded.
+
+    The responses without a body, like the streaming responses, or setting cookies
+    are not shared and each waiter builds its own.
+
+    **Example**
+
+    ```python
+    from esmerald import Coalesce, get
+
+
+    @get("/reports", coalesce=Coalesce(timeout=5, max_waiters=500))
+    async def reports(year: int) -> Report: ...
+    ```
+    """
+
+    __slots__ = ("query_params", "headers", "timeout", "max_waiters", "flights")
+
+    def __init__(
+        self,
+        query_params: Optional[Sequence[str]] = None,
+        headers: Sequence[str] = (),
+        timeout: Optional[float] = None,
+        max_waiters: Optional[int] = None,
+    ) -> None:
+        if timeout is not None and timeout <= 0:
+            raise ImproperlyConfigured("The timeout of a coalesce must be positive.")
+        if max_waiters is not None and max_waiters <= 0:
+            raise ImproperlyConfigured("The max_waiters of a coalesce must be positive.")
+
+        self.query_params = None if query_params is None else frozenset(query_params)
+        self.headers = tuple(sorted({name.lower() for name in headers}))
+        self.timeout = timeout
+        self.max_waiters = max_waiters
+        self.flights: Dict[str, _Flight] = {}
+
+    def __repr__(self) -> str:
+        return (
+            f"{self.__class__.__name__}(headers={list(self.headers)!r}, "
+            f"timeout={self.timeout!r}, max_waiters={self.max_waiters!r})"
+        )
+
+    def make_key(self, request: "Request") -> str:
+        return f"{request.url.path}\n{make_request_key(request, self.query_params, self.headers)}"
+
+    async def run(self, request: "Request", build: ResponseBuilder) -> AnyResponse:
+        """
+        Returns the response of the request, built once for the identical requests in
+        flight.
+
+        Args:
+            request (Request): The request.
+            build (ResponseBuilder): Builds the response of the request.
+
+        Returns:
+            AnyResponse: The built response or the response shared by the identical
+                request in flight.
+        """
+        if request.method not in COALESCED_METHODS:
+            return await build()
+
+        key = self.make_key(request)
+        flight = self.flights.get(key)
+        if flight is None:
+            return await self.lead(key, build, self.flights.setdefault(key, _Flight()))
+
+        if self.max_waiters is not None and flight.waiters >= self.max_waiters:
+            return await build()
+
+        flight.waiters += 1
+        try:
+            with anyio.move_on_after(self.timeout):
+                await flight.event.wait()
+        finally:
+            flight.waiters -= 1
+
+        if not flight.event.is_set():
+            return await build()
+        if flight.error is not None:
+            raise flight.error
+        if flight.response is None:
+            return await build()
+        return flight.response
+
+    async def lead(self, key: str, build: ResponseBuilder, flight: _Flight) -> AnyResponse:
+        try:
+            response = await build()
+            if flight.waiters:
+                flight.response = (
+                    response
+                    if isinstance(response, CachedResponse)
+                    else serialize_response(response)
+                )
+        except Exception as exc:
+            flight.error = exc
+            raise
+        finally:
+            del self.flights[key]
+            flight.event.set()
+        return response
@@ -0,0 +1,194 @@
+"""
+Conditional requests, answering `304 Not Modified` when the validators of the client
+still match the response.
+"""
+
+import hashlib
+from datetime import datetime, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Awaitable,
+    Callable,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
+
+from lilya import status
+from lilya.responses import Response as LilyaResponse
+
+from esmerald.utils.helpers import is_async_callable
+
+if TYPE_CHECKING:  # pragma: no cover
+    from esmerald.requests import Request
+
+CONDITIONAL_METHODS = frozenset({"GET", "HEAD"})
+RawHeaders = List[Tuple[bytes, bytes]]
+ETagProvider = Callable[["Request"], Union[Optional[str], Awaitable[Optional[str]]]]
+LastModifiedProvider = Callable[
+    ["Request"], Union[Optional[datetime], Awaitable[Optional[datetime]]]
+]
+
+# The headers kept in a `304 Not Modified`, as per RFC 9110.
+NOT_MODIFIED_HEADERS = frozenset(
+    {
+        b"cache-control",
+        b"content-location",
+        b"date",
+        b"etag",
+        b"expires",
+        b"last-modified",
+        b"vary",
+    }
+)
+
+
+def _strip_weak(etag: str) -> str:
+    return etag[2:] if etag.startswith("W/") else etag
+
+
+def _parse_date(value: str) -> Optional[datetime]:
+    try:
+        parsed = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return parsed if parsed.tzinfo is not None else parsed.replace(tzinfo=timezone.utc)
+
+
+class Conditional:
+    """
+    How the `GET` and `HEAD` requests are answered with a `304 Not Modified`.
+
+    Without providers, the `ETag` of the responses is a digest of their rendered body
+    and the handler always runs. With an `etag` or `last_modified` provider, called
+    with the request before the dependencies and the handler, a matching
+    `If-None-Match` or `If-Modified-Since` is answered right away, without running
+    the handler, and the validators are set on the responses instead of hashing them.
+
+    Args:
+        etag: Returns the version of the resource, for instance its revision or the
+            `updated_at` of its row, sync or async. `None` falls back to the digest.
+        last_modified: Returns when the resource was last modified, sync or async.
+        weak: If the `ETag` are weak validators, for instance when the same version
+            of a resource can be rendered differently.
+
+    **Example**
+
+    ```python
+    from esmerald import Conditional, Request, get
+
+
+    async def get_revision(request: Request) -> str:
+        return await Document.revision(request.path_params["id"])
+
+
+    @get("/documents/{id}", conditional=Conditional(etag=get_revision))
+    async def document(id: int) -> Document: ...
+    ```
+    """
+
+    __slots__ = ("etag", "last_modified", "weak")
+
+    def __init__(
+        self,
+        etag: Optional[ETagProvider] = None,
+        last_modified: Optional[LastModifiedProvider] = None,
+        weak: bool = False,
+    ) -> None:
+        self.etag = etag
+        self.last_modified = last_modified
+        self.weak = weak
+
+    def __repr__(self) -> str:
+        return (
+            f"{self.__class__.__name__}(etag={self.etag!r}, "
+            f"last_modified={self.last_modified!r}, weak={self.weak!r})"
+        )
+
+    def format_etag(self, value: str) -> str:
+        if value.startswith(('"', 'W/"')):
+            return value
+        return f'W/"{value}"' if self.weak else f'"{value}"'
+
+    @staticmethod
+    async def call(provider: Callable[["Request"], Any], request: "Request") -> Any:
+        if is_async_callable(provider):
+            return await provider(request)
+        return provider(request)
+
+    async def get_validators(self, request: "Request") -> RawHeaders:
+        """
+        Returns the `ETag` and `Last-Modified` headers of the providers, if any.
+        """
+        headers: RawHeaders = []
+        if self.etag is not None:
+            etag = await self.call(self.etag, request)
+            if etag is not None:
+                headers.append((b"etag", self.format_etag(str(etag)).encode("latin-1")))
+        if self.last_modified is not None:
+            last_modified = await self.call(self.last_modified, request)
+            if last_modified is not None:
+                if last_modified.tzinfo is None:
+                    last_modified = last_modified.replace(tzinfo=timezone.utc)
+                value = format_datetime(last_modified.astimezone(timezone.utc), usegmt=True)
+                headers.append((b"last-modified", value.encode("latin-1")))
+        return headers
+
+    def add_validators(self, response: LilyaResponse, validators: RawHeaders) -> None:
+        """
+        Sets the validators on a successful response, hashing its body without an
+        `ETag` provider. The validators set by the handler are kept.
+        """
+        body = getattr(response, "body", None)
+        if response.status_code != status.HTTP_200_OK or not isinstance(body, (bytes, str)):
+            return
+
+        names = {name.lower() for name, _ in response.encoded_headers}
+        for name, value in validators:
+            if name not in names:
+                response.headers[name.decode("latin-1")] = value.decode("latin-1")
+                names.add(name)
+
+        if b"etag" not in names:
+            if isinstance(body, str):
+                body = body.encode(response.charset)
+            digest = hashlib.blake2b(body, digest_size=16).hexdigest()
+            response.headers["etag"] = self.format_etag(digest)
+
+    def not_modified(
+        self, request: "Request", headers: Sequence[Tuple[bytes, bytes]]
+    ) -> Optional[LilyaResponse]:
+        """
+        Returns the `304 Not Modified` response when the validators of the request
+        match the given response headers, as per RFC 9110.
+        """
+        if request.method not in CONDITIONAL_METHODS:
+            return None
+
+        validators = {name.lower(): value.decode("latin-1") for name, value in headers}
+        if_none_match = request.headers.get("if-none-match")
+        if if_none_match is not None:
+            etag = validators.get(b"etag")
+            if etag is None:
+                return None
+            tags = {_strip_weak(tag.strip()) for tag in if_none_match.split(",")}
+            if "*" not in tags and _strip_weak(etag) not in tags:
+                return None
+        else:
+            if_modified_since = request.headers.get("if-modified-since")
+            last_modified = validators.get(b"last-modified")
+            if if_modified_since is None or last_modified is None:
+                return None
+            since, modified = _parse_date(if_modified_since), _parse_date(last_modified)
+            if since is None or modified is None or modified > since:
+                return None
+
+        response = LilyaResponse(status_code=status.HTTP_304_NOT_MODIFIED)
+        response.raw_headers = [
+            (name, value) for name, value in headers if name.lower() in NOT_MODIFIED_HEADERS
+        ]
+        return response
@@ -0,0 +1,170 @@
+"""
+Response serializers precompiled from the return annotation of the handlers.
+
+The content returned by a handler is serialized by looking up the encoder of every
+object on each response. When the return annotation declares a Pydantic model, a
+`msgspec.Struct` or a list or dict of those, a serializer specialized to that type is
+built once per route instead, serializing the whole content in a single call.
+
+A serializer returns `None` when the content does not have the declared type, the
+content being then serialized the usual way. In strict mode, the content is validated
+against the return annotation first and a content that does not match it is an error,
+the valid content being serialized like without the strict mode.
+"""
+
+from functools import partial
+from inspect import Signature
+from typing import Any, Callable, List, Optional, Tuple, get_args, get_origin
+
+import msgspec
+from msgspec import Struct
+from pydantic import BaseModel, TypeAdapter, ValidationError
+from pydantic.errors import PydanticSchemaGenerationError
+
+from esmerald.encoders import is_json_native_type
+from esmerald.exceptions import InternalServerError
+from esmerald.utils.helpers import is_union
+
+ResponseSerializer = Callable[[Any], Optional[bytes]]
+
+INVALID_RESPONSE = "The response does not match the return annotation."
+
+# Checks if a content has exactly the declared type.
+TypeCheck = Callable[[Any], bool]
+
+
+def _is_model(model: type, value: Any) -> bool:
+    return type(value) is model
+
+
+def _is_list_of(model: type, value: Any) -> bool:
+    return type(value) is list and all(type(item) is model for item in value)
+
+
+def _is_dict_of(model: type, value: Any) -> bool:
+    return type(value) is dict and all(type(item) is model for item in value.values())
+
+
+def get_type_check(annotation: Any) -> Optional[Tuple[type, TypeCheck]]:
+    """
+    Returns the model and the check of the contents declared as a model, a list of
+    models or a dict of models, `Optional` included, or `None`.
+    """
+    if is_union(annotation):
+        members = [argument for argument in get_args(annotation) if argument is not type(None)]
+        if len(members) == 1 and len(get_args(annotation)) == 2:
+            return get_type_check(members[0])
+        return None
+
+    if isinstance(annotation, type) and issubclass(annotation, (BaseModel, Struct)):
+        return annotation, partial(_is_model, annotation)
+
+    origin, arguments = get_origin(annotation), get_args(annotation)
+    if origin is list and len(arguments) == 1:
+        model = arguments[0]
+        check: Callable[[type, Any], bool] = _is_list_of
+    elif origin is dict and len(arguments) == 2 and arguments[0] is str:
+        model = arguments[1]
+        check = _is_dict_of
+    else:
+        return None
+
+    if isinstance(model, type) and issubclass(model, (BaseModel, Struct)):
+        return model, partial(check, model)
+    return None
+
+
+def _serialize_pydantic(adapter: TypeAdapter, is_type: TypeCheck, value: Any) -> Optional[bytes]:
+    return adapter.dump_json(value) if is_type(value) else None
+
+
+def _serialize_msgspec(
+    encoder: msgspec.json.Encoder, is_type: TypeCheck, value: Any
+) -> Optional[bytes]:
+    return encoder.encode(value) if is_type(value) else None
+
+
+def _invalid_response(errors: List[Any]) -> InternalServerError:
+    exception = InternalServerError(detail=INVALID_RESPONSE)
+    # The errors are the extra of the response, the keyword arguments would nest them.
+    exception.extra = errors  # type: ignore[assignment]
+    return exception
+
+
+def _validate_pydantic(adapter: TypeAdapter, value: Any) -> None:
+    try:
+        adapter.validate_python(value)
+    except ValidationError as e:
+        # The content is not rendered, it may not be JSON serializable.
+        raise _invalid_response(e.errors(include_url=False, include_input=False)) from e
+
+
+def _validate_msgspec(annotation: Any, value: Any) -> None:
+    try:
+        msgspec.convert(value, annotation, from_attributes=True)
+    except msgspec.ValidationError as e:
+        raise _invalid_response([{"msg": str(e)}]) from e
+
+
+def _validate(
+    validate: Callable[[Any], None], serializer: Optional[ResponseSerializer], value: Any
+) -> Optional[bytes]:
+    validate(value)
+    return serializer(value) if serializer is not None else None
+
+
+def _get_adapter(annotation: Any) -> Optional[TypeAdapter]:
+    try:
+        return TypeAdapter(annotation)
+    except (PydanticSchemaGenerationError, TypeError, NameError):
+        return None
+
+
+def _compile_serializer(annotation: Any) -> Optional[ResponseSerializer]:
+    type_check = get_type_check(annotation)
+    if type_check is None:
+        return None
+
+    model, is_type = type_check
+    if issubclass(model, Struct):
+        return partial(_serialize_msgspec, msgspec.json.Encoder(), is_type)
+
+    # Only the models rendered exactly like by the JSON encoder are serialized by Pydantic.
+    if not is_json_native_type(model):
+        return None
+    adapter = _get_adapter(annotation)
+    return partial(_serialize_pydantic, adapter, is_type) if adapter is not None else None
+
+
+def compile_response_serializer(
+    annotation: Any, strict: bool = False
+) -> Optional[ResponseSerializer]:
+    """
+    Compiles the serializer of the contents declared by a return annotation.
+
+    Args:
+        annotation (Any): The return annotation of the handler.
+        strict (bool): If the content is validated against the annotation before being
+            serialized.
+
+    Returns:
+        Optional[ResponseSerializer]: The serializer or `None` when the contents are
+            serialized the usual way.
+    """
+    if annotation in (None, Any, Signature.empty) or isinstance(annotation, str):
+        return None
+
+    serializer = _compile_serializer(annotation)
+    if not strict:
+        return serializer
+
+    validate: Callable[[Any], None]
+    type_check = get_type_check(annotation)
+    if type_check is not None and issubclass(type_check[0], Struct):
+        validate = partial(_validate_msgspec, annotation)
+    else:
+        adapter = _get_adapter(annotation)
+        if adapter is None:
+            return serializer
+        validate = partial(_validate_pydantic, adapter)
+    return partial(_validate, validate, serializer)
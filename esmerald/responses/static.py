@@ -0,0 +1,122 @@
+"""
+Precomputed responses of the static handlers.
+"""
+
+import gzip
+from typing import TYPE_CHECKING, List, Optional, Tuple
+
+from esmerald.responses.cache import CachedResponse, serialize_response
+
+if TYPE_CHECKING:  # pragma: no cover
+    from lilya.responses import Response as LilyaResponse
+    from lilya.types import Receive, Scope, Send
+
+# The bodies from this size, in bytes, also get a gzip variant, like the `GZipMiddleware`.
+GZIP_MINIMUM_SIZE = 500
+
+
+def accepts_gzip(scope: "Scope") -> bool:
+    """
+    If the `Accept-Encoding` of the request accepts gzip, read from the raw headers.
+    """
+    for name, value in scope["headers"]:
+        if name == b"accept-encoding":
+            for coding in value.lower().split(b","):
+                token, _, params = coding.partition(b";")
+                if token.strip() not in (b"gzip", b"*"):
+                    continue
+                params = params.strip()
+                if not params.startswith(b"q="):
+                    return True
+                try:
+                    return float(params[2:]) > 0
+                except ValueError:
+                    return False
+    return False
+
+
+def weaken(etag: bytes) -> bytes:
+    """
+    Returns the weak `ETag` of the gzip variant, not the same representation byte for byte.
+    """
+    return etag if etag.startswith(b"W/") else b"W/" + etag
+
+
+class StaticResponse:
+    """
+    The fully encoded response of a static handler, replayed as is on every request.
+
+    The bodies of at least `GZIP_MINIMUM_SIZE` bytes not already encoded also get a
+    gzip variant, sent to the requests accepting it.
+    """
+
+    __slots__ = ("plain", "gzipped")
+
+    def __init__(self, plain: CachedResponse, gzipped: Optional[CachedResponse] = None) -> None:
+        self.plain = plain
+        self.gzipped = gzipped
+
+    @classmethod
+    def from_response(cls, response: "LilyaResponse") -> Optional["StaticResponse"]:
+        """
+        Returns the precomputed response or `None` if the response cannot be replayed,
+        for instance an unsuccessful response, a streaming response or a response
+        setting cookies.
+        """
+        if not 200 <= response.status_code < 300:
+            return None
+
+        plain = serialize_response(response)
+        if plain is None:
+            return None
+
+        names = {name.lower() for name, _ in plain.headers}
+        if len(plain.body) < GZIP_MINIMUM_SIZE or b"content-encoding" in names:
+            return cls(plain)
+
+        body = gzip.compress(plain.body, mtime=0)
+        vary = b", ".join(
+            [value for name, value in plain.headers if name.lower() == b"vary"]
+            + [b"accept-encoding"]
+        )
+        headers = [
+            (name, value)
+            for name, value in plain.headers
+            if name.lower() not in (b"content-length", b"vary")
+        ]
+        plain_headers = [
+            *headers,
+            (b"content-length", str(len(plain.body)).encode()),
+            (b"vary", vary),
+        ]
+        gzip_headers = [
+            *[
+                (name, weaken(value) if name.lower() == b"etag" else value)
+                for name, value in headers
+            ],
+            (b"content-length", str(len(body)).encode()),
+            (b"content-encoding", b"gzip"),
+            (b"vary", vary),
+        ]
+        return cls(
+            CachedResponse(plain.status_code, tuple(plain_headers), plain.body),
+            CachedResponse(plain.status_code, tuple(gzip_headers), body),
+        )
+
+    @property
+    def encoded_headers(self) -> List[Tuple[bytes, bytes]]:
+        return self.plain.encoded_headers
+
+    async def __call__(self, scope: "Scope", receive: "Receive", send: "Send") -> None:
+        response = self.plain
+        if self.gzipped is not None and accepts_gzip(scope):
+            response = self.gzipped
+
+        await send(
+            {
+                "type": "http.response.start",
+                "status": response.status_code,
+                "headers": list(response.headers),
+            }
+        )
+        await send({"type": "http.response.body", "body": response.body})
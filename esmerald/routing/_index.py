@@ -0,0 +1,249 @@
+import re
+from typing import Any, Dict, List, Optional, Pattern, Sequence, Set, Tuple
+
+from lilya._internal._path import get_route_path
+from lilya.datastructures import URL
+from lilya.enums import Match, ScopeType
+from lilya.responses import RedirectResponse
+from lilya.routing import PathHandler, Router as LilyaRouter
+from lilya.types import Receive, Scope, Send
+
+# Convertor regexes that can never match a `/` and therefore can be safely
+# evaluated segment by segment. Anything else falls back to the route regex.
+SEGMENT_SAFE_REGEXES: Set[str] = {
+    "[^/]+",
+    "[0-9]+",
+    r"[0-9]+(\.[0-9]+)?",
+    "[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}",
+}
+WILDCARD_REGEX = ".*"
+PARAM_SEGMENT = re.compile(r"^\{([a-zA-Z_]\w*)\}$")
+
+
+class _Node:
+    """
+    A node of the routing radix tree. Each node represents a path segment.
+    """
+
+    __slots__ = ("static", "params", "wildcards", "routes")
+
+    def __init__(self) -> None:
+        self.static: Dict[str, "_Node"] = {}
+        self.params: Dict[str, Tuple[Pattern[str], "_Node"]] = {}
+        self.wildcards: List[int] = []
+        self.routes: List[int] = []
+
+
+def _split(path: str) -> List[str]:
+    return path.split("/")[1:]
+
+
+def _parse_route(route: Any) -> Optional[List[Tuple[str, Any]]]:
+    """
+    Translates the `path_format` and `param_convertors` of a route into a list of
+    `(kind, value)` segments understood by the tree.
+
+    Returns `None` when the route cannot be represented by segments (hosts, mixed
+    literal/param segments, custom convertors...) and must always be matched by regex.
+    """
+    path_format: Optional[str] = getattr(route, "path_format", None)
+    param_convertors: Optional[Dict[str, Any]] = getattr(route, "param_convertors", None)
+
+    if not isinstance(path_format, str) or not path_format.startswith("/"):
+        return None
+    if param_convertors is None:
+        return None
+
+    parts = _split(path_format)
+    segments: List[Tuple[str, Any]] = []
+
+    for position, part in enumerate(parts):
+        if "{" not in part and "}" not in part:
+            segments.append(("static", part))
+            continue
+
+        match = PARAM_SEGMENT.match(part)
+        if not match or match.group(1) not in param_convertors:
+            return None
+
+        regex = param_convertors[match.group(1)].regex
+        if regex == WILDCARD_REGEX and position == len(parts) - 1:
+            segments.append(("wildcard", None))
+        elif regex in SEGMENT_SAFE_REGEXES:
+            segments.append(("param", regex))
+        else:
+            return None
+    return segments
+
+
+class RouteIndex:
+    """
+    Compiled routing index built from a sequence of routes.
+
+    Fully static paths are resolved with a dictionary lookup and every other
+    path walks a tree of path segments built using the registered Lilya
+    convertors. Routes that cannot be expressed as segments are always returned
+    so their regex can still be evaluated.
+
+    The index only narrows down the routes that *can* match a given path. The
+    candidates are returned in the original declaration order and each one of them
+    is still matched with `route.search()`, which means the matching semantics
+    are exactly the same as a linear scan.
+    """
+
+    __slots__ = ("routes", "size", "root", "fallback", "static")
+
+    def __init__(self, routes: Sequence[Any]) -> None:
+        self.routes = routes
+        self.size = len(routes)
+        self.root = _Node()
+        self.fallback: List[int] = []
+        self.static: Dict[str, Tuple[Any, ...]] = {}
+
+        static_paths: Set[str] = set()
+
+        for position, route in enumerate(routes):
+            segments = _parse_route(route)
+            if segments is None:
+                self.fallback.append(position)
+                continue
+
+            self.add(position, segments)
+            if all(kind == "static" for kind, _ in segments):
+                static_paths.add(route.path_format)
+
+        for path in static_paths:
+            self.static[path] = self.lookup(path)
+
+    def add(self, position: int, segments: List[Tuple[str, Any]]) -> None:
+        node = self.root
+        for kind, value in segments:
+            if kind == "static":
+                node = node.static.setdefault(value, _Node())
+            elif kind == "param":
+                if value not in node.params:
+                    node.params[value] = (re.compile(value), _Node())
+                node = node.params[value][1]
+            else:
+                node.wildcards.append(position)
+                return
+        node.routes.append(position)
+
+    def is_valid_for(self, routes: Sequence[Any]) -> bool:
+        """
+        Checks if the index still reflects the given routes.
+        """
+        return routes is self.routes and len(routes) == self.size
+
+    def collect(self, node: _Node, segments: List[str], depth: int, found: Set[int]) -> None:
+        if depth == len(segments):
+            found.update(node.routes)
+            return
+
+        # A tail wildcard (`{path:path}`) consumes every remaining segment.
+        found.update(node.wildcards)
+
+        segment = segments[depth]
+        child = node.static.get(segment)
+        if child is not None:
+            self.collect(child, segments, depth + 1, found)
+
+        for regex, param_node in node.params.values():
+            if regex.fullmatch(segment):
+                self.collect(param_node, segments, depth + 1, found)
+
+    def lookup(self, path: str) -> Tuple[Any, ...]:
+        """
+        Returns the routes that can match the given path, in declaration order.
+        """
+        found: Set[int] = set(self.fallback)
+        if path.startswith("/"):
+            self.collect(self.root, _split(path), 0, found)
+        return tuple(self.routes[position] for position in sorted(found))
+
+    def candidates(self, path: str) -> Tuple[Any, ...]:
+        """
+        Same as `lookup()` but using the static hash table fast path first.
+        """
+        routes = self.static.get(path)
+        if routes is not None:
+            return routes
+        return self.lookup(path)
+
+
+class RouteIndexMixin:
+    """
+    Replaces the linear scan of the Lilya router by a lookup in a `RouteIndex`.
+
+    The index is built when the router is activated and rebuilt whenever the
+    list of routes changes.
+    """
+
+    _route_index: Optional[RouteIndex] = None
+
+    def activate_route_index(self) -> RouteIndex:
+        self._route_index = RouteIndex(self.routes)  # type: ignore[attr-defined]
+        return self._route_index
+
+    @property
+    def route_index(self) -> RouteIndex:
+        index = self._route_index
+        if index is None or not index.is_valid_for(self.routes):  # type: ignore[attr-defined]
+            index = self.activate_route_index()
+        return index
+
+    async def app(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """
+        Handle ASGI messages, managing different scopes and routing.
+
+        Same behaviour as the Lilya router but only evaluating the routes given by
+        the `route_index`.
+        """
+        assert scope["type"] in (ScopeType.HTTP, ScopeType.WEBSOCKET, ScopeType.LIFESPAN)
+
+        if "router" not in scope:
+            scope["router"] = self
+
+        partial = None
+        route_path = get_route_path(scope)
+        index = self.route_index
+
+        for route in index.candidates(route_path):
+            match, child_scope = route.search(scope)
+            if match == Match.FULL:
+                path_handler = PathHandler(
+                    child_scope=child_scope, scope=scope, receive=receive, send=send
+                )
+                await self.handle_route(route, path_handler=path_handler)  # type: ignore[attr-defined]
+                return
+            elif match == Match.PARTIAL and partial is None:
+                partial = route
+                partial_scope = child_scope
+
+        if partial is not None:
+            await self.handle_partial(partial, partial_scope, scope, receive, send)  # type: ignore[attr-defined]
+            return
+
+        if scope["type"] == ScopeType.HTTP and self.redirect_slashes and route_path != "/":  # type: ignore[attr-defined]
+            redirect_scope = dict(scope)
+            if route_path.endswith("/"):
+                redirect_scope["path"] = redirect_scope["path"].rstrip("/")
+            else:
+                redirect_scope["path"] = redirect_scope["path"] + "/"
+
+            for route in index.candidates(get_route_path(redirect_scope)):
+                match, child_scope = route.search(redirect_scope)
+                if match != Match.NONE:
+                    redirect_url = URL.build_from_scope(scope=redirect_scope)
+                    response = RedirectResponse(url=str(redirect_url))
+                    await response(scope, receive, send)
+                    return
+
+        await self.handle_default(scope, receive, send)  # type: ignore[attr-defined]
+
+
+class IndexedRouter(RouteIndexMixin, LilyaRouter):
+    """
+    Lilya router using the `RouteIndex` for the lookups. Used internally by the
+    `Include` when a list of routes is provided.
+    """
@@ -5,7 +5,7 @@ from typing import TYPE_CHECKING, Any, Dict, List, Union, _GenericAlias, cast, g
 from pydantic import BaseModel, create_model
 from pydantic.fields import FieldInfo
 
-from esmerald.encoders import ENCODER_TYPES, is_body_encoder
+from esmerald.encoders import encoder_cache, is_body_encoder
 from esmerald.enums import EncodingType
 from esmerald.openapi.params import ResponseParam
 from esmerald.params import Body
@@ -59,7 +59,7 @@ def convert_annotation_to_pydantic_model(field_annotation: Any) -> Any:
 
     if (
         not isinstance(field_annotation, BaseModel)
-        and any(encoder.is_type(field_annotation) for encoder in ENCODER_TYPES)
+        and encoder_cache.get_for_annotation(field_annotation) is not None
         and inspect.isclass(field_annotation)
     ):
         field_definitions: Dict[str, Any] = {}
@@ -10,6 +10,8 @@ if TYPE_CHECKING:  # pragma: no cover
     from esmerald.interceptors.types import Interceptor
     from esmerald.openapi.schemas.v3_1_0.security_scheme import SecurityScheme
     from esmerald.permissions.types import Permission
+    from esmerald.responses.cache import ResponseCache
+    from esmerald.responses.conditional import Conditional
     from esmerald.routing.gateways import Gateway, WebSocketGateway
     from esmerald.routing.router import HTTPHandler, WebhookHandler, WebSocketHandler
     from esmerald.transformers.model import TransformerModel
@@ -64,6 +66,8 @@ class View:
         "methods",
         "interceptors",
         "security",
+        "cache",
+        "conditional",
     )
 
     path: Annotated[
@@ -247,6 +251,44 @@ class View:
             """
         ),
     ]
+    cache: Annotated[
+        Optional["ResponseCache"],
+        Doc(
+            """
+            How the responses of the `GET` and `HEAD` handlers of the view are cached,
+            unless a handler sets its own.
+
+            **Example**
+
+            ```python
+            from esmerald import APIView, ResponseCache
+
+
+            class CatalogView(APIView):
+                cache = ResponseCache(ttl=60)
+            ```
+            """
+        ),
+    ]
+    conditional: Annotated[
+        Optional["Conditional"],
+        Doc(
+            """
+            How the `GET` and `HEAD` requests of the handlers of the view are answered with
+            a `304 Not Modified`, unless a handler sets its own.
+
+            **Example**
+
+            ```python
+            from esmerald import APIView, Conditional
+
+
+            class DocumentView(APIView):
+                conditional = Conditional()
+            ```
+            """
+        ),
+    ]
 
     def __init__(self, parent: Union["Gateway", "WebSocketGateway"]) -> None:
         for key in self.__slots__:
@@ -1,3 +1,4 @@
+from concurrent.futures import Executor
 from datetime import date, datetime, time, timedelta
 from decimal import Decimal
 from enum import Enum
@@ -10,8 +11,12 @@ from typing import (
     Awaitable,
     Callable,
     Dict,
+    FrozenSet,
     List,
+    NamedTuple,
+    Optional,
     Set,
+    Tuple,
     Type,
     TypeVar,
     Union,
@@ -28,18 +33,36 @@ from lilya.types import Receive, Scope, Send
 from typing_extensions import TypedDict
 
 from esmerald import status
+from esmerald.conf import settings
 from esmerald.datastructures import ResponseContainer, UploadFile
+from esmerald.encoders import estimate_json_size
+from esmerald.enums import MediaType
 from esmerald.exceptions import ImproperlyConfigured
+from esmerald.executors import (
+    ProcessExecutor,
+    SyncExecutor,
+    SyncExecutorType,
+    get_sync_executor,
+    json_offload,
+)
 from esmerald.injector import Inject
+from esmerald.interceptors.chain import InterceptorChain
+from esmerald.permissions.chain import PermissionChain
 from esmerald.permissions.utils import continue_or_raise_permission_exception
 from esmerald.requests import Request
 from esmerald.responses import JSONResponse, Response
+from esmerald.responses.cache import ResponseCache
+from esmerald.responses.coalesce import Coalesce
+from esmerald.responses.conditional import Conditional
+from esmerald.responses.serializers import compile_response_serializer
 from esmerald.routing.apis.base import View
+from esmerald.transformers.decoders import BodyDecoder
+from esmerald.transformers.engines import MsgSpecSignature, get_signature_engine
 from esmerald.transformers.model import (
     TransformerModel,
     create_signature as transfomer_create_signature,
 )
-from esmerald.transformers.signature import SignatureFactory
+from esmerald.transformers.signature import SignatureFactory, get_dependency_signature
 from esmerald.transformers.utils import get_signature
 from esmerald.typing import Void, VoidType
 from esmerald.utils.constants import DATA, PAYLOAD
@@ -74,6 +97,72 @@ CONV2TYPE = {conv: typ for typ, conv in TRANSFORMER_TYPES.items()}
 
 
 T = TypeVar("T", bound="Dispatcher")
+# The `Set-Cookie` values rendered once or the arguments of the cookies rendered per response.
+RenderedCookies = Tuple[Tuple[str, Union[bytes, Dict[str, Any]]], ...]
+
+
+class DispatchPlan(NamedTuple):
+    """
+    Immutable representation of everything a handler needs to dispatch a connection.
+
+    The plan is compiled once per handler by `Dispatcher.freeze()` so the hot path
+    of a request never walks the `parent_levels` of the handler.
+
+    Args:
+        parent (Any): The parent the plan was compiled for.
+        interceptors (Tuple[AsyncCallable, ...]): The resolved interceptors.
+        permissions (Tuple[AsyncCallable, ...]): The resolved permissions.
+        methods (FrozenSet[str]): The HTTP methods allowed by the handler.
+        fn (AnyCallable): The handler function, bound to the `View` if any.
+        is_async (bool): If the handler function is a coroutine function.
+        response_class (Optional[Type[Response]]): The closest custom response class.
+        response_headers (Optional[ResponseHeaders]): The resolved response headers, owned by
+            the plan.
+        response_cookies (Optional[ResponseCookies]): The resolved response cookies, owned by
+            the plan.
+        response_handler (Optional[Callable[..., Awaitable[LilyaResponse]]]): The response builder.
+        permission_chain (Optional[PermissionChain]): The permissions instantiated once, when
+            `singleton_permissions` is enabled.
+        interceptor_chain (Optional[InterceptorChain]): The interceptors instantiated once, when
+            `singleton_permissions` is enabled.
+        executor (Optional[SyncExecutor]): The closest `sync_executor` running the sync handler
+            or `None` to run it inline.
+        dependency_executor (Optional[SyncExecutor]): The executor running the sync
+            dependencies, the `executor` unless it runs in worker processes.
+        signature (Optional[MsgSpecSignature]): The validation of the signature by the closest
+            `signature_engine` or `None` when the signature model validates it.
+        body_decoder (Optional[BodyDecoder]): The decoder of the raw request body into the
+            declared `data` or `payload` or `None` to parse the JSON payload.
+        json_offload_threshold (Optional[int]): The size from which the JSON response is
+            encoded in a worker thread or `None` to always encode it in the event loop.
+        response_cache (Optional[ResponseCache]): The closest `cache` of the responses of
+            the handler or `None` to never cache them.
+        conditional (Optional[Conditional]): The closest `conditional` answering the
+            conditional requests or `None` to ignore the validators of the requests.
+        coalesce (Optional[Coalesce]): The closest `coalesce` of the identical requests in
+            flight or `None` to build the response of every request.
+    """
+
+    parent: Any
+    interceptors: Tuple["AsyncCallable", ...]
+    permissions: Tuple["AsyncCallable", ...]
+    methods: FrozenSet[str]
+    fn: "AnyCallable"
+    is_async: bool
+    response_class: Optional[Type[Response]] = None
+    response_headers: Optional["ResponseHeaders"] = None
+    response_cookies: Optional["ResponseCookies"] = None
+    response_handler: Optional[Callable[..., Awaitable[LilyaResponse]]] = None
+    permission_chain: Optional[PermissionChain] = None
+    interceptor_chain: Optional[InterceptorChain] = None
+    executor: Optional[SyncExecutor] = None
+    dependency_executor: Optional[SyncExecutor] = None
+    signature: Optional[MsgSpecSignature] = None
+    body_decoder: Optional[BodyDecoder] = None
+    json_offload_threshold: Optional[int] = None
+    response_cache: Optional[ResponseCache] = None
+    conditional: Optional[Conditional] = None
+    coalesce: Optional[Coalesce] = None
 
 
 class PathParameterSchema(TypedDict):
@@ -111,17 +200,19 @@ class BaseSignature:
 
         Websockets do not support methods.
         """
+        dependency_names = self.dependency_names
+
         if not self.signature_model:
             self.signature_model = SignatureFactory(
                 fn=cast("AnyCallable", self.fn),
-                dependency_names=self.dependency_names,
+                dependency_names=set(dependency_names),
             ).create_signature()
 
         for dependency in list(self.get_dependencies().values()):
             if not dependency.signature_model:
-                dependency.signature_model = SignatureFactory(
-                    fn=dependency.dependency, dependency_names=self.dependency_names
-                ).create_signature()
+                dependency.signature_model = get_dependency_signature(
+                    dependency.dependency, set(dependency_names)
+                )
 
         transformer_model = self.create_handler_transformer_model()
         if not is_websocket:
@@ -166,10 +257,13 @@ class BaseResponseHandler:
             Any: The response data generated by processing the request.
         """
         signature_model = get_signature(route)
+        plan = route.dispatch_plan
         is_data_or_payload: str = None
 
         if parameter_model.has_kwargs:
-            kwargs: Dict[str, Any] = parameter_model.to_kwargs(connection=request, handler=route)
+            kwargs: Dict[str, Any] = parameter_model.to_kwargs(
+                connection=request, handler=route, body_decoder=plan.body_decoder
+            )
 
             is_data_or_payload = (
                 DATA if DATA in kwargs else (PAYLOAD if PAYLOAD in kwargs else None)
@@ -189,7 +283,9 @@ class BaseResponseHandler:
                 elif is_data_or_payload is not None and data is None:
                     kwargs[is_data_or_payload] = data
                 # Check if the data is a dictionary and contains the expected parameter key
-                elif is_data_or_payload is not None and is_data_or_payload not in data:
+                elif is_data_or_payload is not None and (
+                    not isinstance(data, dict) or is_data_or_payload not in data
+                ):
                     kwargs[is_data_or_payload] = data
 
                 # Otherwise, assign the data to kwargs
@@ -214,29 +310,20 @@ class BaseResponseHandler:
                         if request_data is not None:
                             kwargs.update(request_data)
 
-            for dependency in parameter_model.dependencies:
-                kwargs[dependency.key] = await parameter_model.get_dependencies(
-                    dependency=dependency, connection=request, **kwargs
-                )
-
-            parsed_kwargs = signature_model.parse_values_for_connection(
-                connection=request, **kwargs
+            await parameter_model.resolve_dependencies(
+                parameter_model.dependencies, request, kwargs, executor=plan.dependency_executor
             )
-        else:
-            parsed_kwargs = {}
 
-        if isinstance(route.parent, View):
-            fn = partial(
-                cast("AnyCallable", route.fn),
-                route.parent,
-                **parsed_kwargs,
-            )
+            signature = plan.signature or signature_model
+            parsed_kwargs = signature.parse_values_for_connection(connection=request, **kwargs)
         else:
-            fn = partial(cast("AnyCallable", route.fn), **parsed_kwargs)
+            parsed_kwargs = {}
 
-        if is_async_callable(fn):
-            return await fn()
-        return fn()
+        if plan.is_async:
+            return await plan.fn(**parsed_kwargs)
+        if plan.executor is not None:
+            return await plan.executor.run(plan.fn, **parsed_kwargs)
+        return plan.fn(**parsed_kwargs)
 
     def _get_default_status_code(self, data: Response) -> int:
         """
@@ -254,6 +341,80 @@ class BaseResponseHandler:
             return data.status_code
         return cast(int, self.status_code)
 
+    def _render_cookies(self, cookies: "ResponseCookies") -> RenderedCookies:
+        """
+        Pre-renders the `Set-Cookie` header values of the given cookies.
+
+        The values are rendered once, when the response handler is created, exactly
+        as `set_cookie` would render them on every response. The cookies with an
+        `expires`, in seconds from the response, are rendered on every response instead.
+
+        Args:
+            cookies (ResponseCookies): The response cookies.
+
+        Returns:
+            RenderedCookies: The cookie keys and their encoded `Set-Cookie` values, or
+                their `set_cookie` arguments when rendered per response.
+        """
+        rendered: List[Tuple[str, Union[bytes, Dict[str, Any]]]] = []
+        for cookie in cookies or []:
+            arguments = cookie.model_dump(exclude_none=True, exclude={"description"})
+            if cookie.expires is not None:
+                rendered.append((cookie.key, arguments))
+                continue
+            response = LilyaResponse()
+            response.set_cookie(**arguments)
+            rendered.append((cookie.key, response.headers.getall("set-cookie")[-1]))
+        return tuple(rendered)
+
+    def _set_cookies(
+        self,
+        response: LilyaResponse,
+        cookies: "ResponseCookies",
+        rendered_cookies: RenderedCookies,
+    ) -> None:
+        """
+        Sets the dynamic cookies returned by the handler followed by the pre-rendered
+        cookies of the route that were not overridden by them.
+
+        Args:
+            response (LilyaResponse): The outgoing response.
+            cookies (ResponseCookies): The cookies returned by the handler.
+            rendered_cookies (RenderedCookies): The pre-rendered cookies of the route.
+        """
+        keys: Set[str] = set()
+        for cookie in cookies or []:
+            response.set_cookie(**cookie.model_dump(exclude_none=True, exclude={"description"}))
+            keys.add(cookie.key)
+
+        for key, value in rendered_cookies:
+            if key in keys:
+                continue
+            if isinstance(value, bytes):
+                response.headers.add("set-cookie", value)
+            else:
+                response.set_cookie(**value)
+
+    def _set_headers(
+        self, response: LilyaResponse, headers: Dict[str, str], allow_header: Dict[str, str]
+    ) -> None:
+        """
+        Sets the pre-rendered headers of the route not defined by the response and
+        the `allow` header.
+
+        Args:
+            response (LilyaResponse): The outgoing response.
+            headers (Dict[str, str]): The pre-rendered headers of the route.
+            allow_header (Dict[str, str]): The pre-rendered allow header.
+        """
+        response_headers = response.headers
+        for header, value in headers.items():
+            if header not in response_headers:
+                response_headers[header] = value
+
+        for header, value in allow_header.items():
+            response_headers[header] = value
+
     def _get_response_container_handler(
         self,
         cookies: "ResponseCookies",
@@ -272,20 +433,20 @@ class BaseResponseHandler:
             Callable[[ResponseContainer, Type["Esmerald"], Dict[str, Any]], LilyaResponse]: The response container handler function.
 
         """
+        rendered_cookies = self._render_cookies(cookies)
+        rendered_headers = self.get_headers(headers)
 
         async def response_content(
             data: ResponseContainer, app: Type["Esmerald"], **kwargs: Dict[str, Any]
         ) -> LilyaResponse:
-            _headers = {**self.get_headers(headers), **data.headers}
-            _cookies = self.get_cookies(data.cookies, cookies)
+            _headers = {**rendered_headers, **data.headers}
             response: Response = data.to_response(
                 app=app,
                 headers=_headers,
                 status_code=self.status_code,
                 media_type=media_type,
             )
-            for cookie in _cookies:
-                response.set_cookie(**cookie)
+            self._set_cookies(response, data.cookies, rendered_cookies)
             return response
 
         return cast(
@@ -306,19 +467,13 @@ class BaseResponseHandler:
         Returns:
             Callable[[Response, Dict[str, Any]], LilyaResponse]: The JSON response handler function.
         """
+        rendered_cookies = self._render_cookies(cookies)
+        rendered_headers = self.get_headers(headers)
+        allow_header = dict(self.allow_header)
 
         async def response_content(data: Response, **kwargs: Dict[str, Any]) -> LilyaResponse:
-            _cookies = self.get_cookies(cookies, [])
-            _headers = {
-                **self.get_headers(headers),
-                **data.headers,
-                **self.allow_header,
-            }
-            for cookie in _cookies:
-                data.set_cookie(**cookie)  # pragma: no cover
-
-            for header, value in _headers.items():
-                data.headers[header] = value
+            self._set_cookies(data, [], rendered_cookies)
+            self._set_headers(data, rendered_headers, allow_header)
 
             status_code = self._get_default_status_code(data)
             if status_code:
@@ -341,16 +496,12 @@ class BaseResponseHandler:
         Returns:
             Callable[[Response, Dict[str, Any]], LilyaResponse]: The response handler function.
         """
+        rendered_cookies = self._render_cookies(cookies)
+        rendered_headers = self.get_headers(headers)
+        allow_header = dict(self.allow_header)
 
         async def response_content(data: Response, **kwargs: Dict[str, Any]) -> LilyaResponse:
-            _cookies = self.get_cookies(data.cookies, cookies)
-            _headers = {
-                **self.get_headers(headers),
-                **data.headers,
-                **self.allow_header,
-            }
-            for cookie in _cookies:
-                data.set_cookie(**cookie)
+            self._set_cookies(data, cast("ResponseCookies", data.cookies), rendered_cookies)
 
             status_code = self._get_default_status_code(data)
             if status_code:
@@ -359,8 +510,7 @@ class BaseResponseHandler:
             if media_type:
                 data.media_type = media_type
 
-            for header, value in _headers.items():
-                data.headers[header] = value
+            self._set_headers(data, rendered_headers, allow_header)
             return data
 
         return cast(Callable[[Response, Dict[str, Any]], LilyaResponse], response_content)
@@ -378,20 +528,13 @@ class BaseResponseHandler:
         Returns:
             Callable[[LilyaResponse, Dict[str, Any]], LilyaResponse]: The Lilya response handler function.
         """
+        rendered_cookies = self._render_cookies(cookies)
+        rendered_headers = self.get_headers(headers)
+        allow_header = dict(self.allow_header)
 
         async def response_content(data: LilyaResponse, **kwargs: Dict[str, Any]) -> LilyaResponse:
-            _cookies = self.get_cookies(cookies, [])
-            _headers = {
-                **self.get_headers(headers),
-                **data.headers,
-                **self.allow_header,
-            }
-            for cookie in _cookies:
-                data.set_cookie(**cookie)  # pragma: no cover
-
-            for header, value in _headers.items():
-                data.headers[header] = value
-
+            self._set_cookies(data, [], rendered_cookies)
+            self._set_headers(data, rendered_headers, allow_header)
             return data
 
         return cast(Callable[[LilyaResponse, Dict[str, Any]], LilyaResponse], response_content)
@@ -415,25 +558,49 @@ class BaseResponseHandler:
         Returns:
             Callable[[Any, Dict[str, Any]], LilyaResponse]: The default handler function.
         """
+        rendered_cookies = self._render_cookies(cookies)
+        rendered_headers = self.get_headers(headers)
+
+        # The serializer of the return annotation is built once, for the responses
+        # serializing the JSON content like the Esmerald `Response`.
+        extra: Dict[str, Any] = {}
+        if (
+            is_class_and_subclass(response_class, Response)
+            and response_class.__init__ is Response.__init__
+            and response_class.make_response is Response.make_response
+        ):
+            extra["serializer"] = compile_response_serializer(
+                self.handler_signature.return_annotation,
+                strict=settings.strict_responses,
+            )
 
         async def response_content(data: Any, **kwargs: Dict[str, Any]) -> LilyaResponse:
             data = await self.get_response_data(data=data)
-            _cookies = self.get_cookies(cookies, [])
             if isinstance(data, JSONResponse):
                 response = data
                 response.status_code = self.status_code
                 response.background = self.background
             else:
-                response = response_class(
+                # The response mutates the given headers, hence the copy.
+                make_response = partial(
+                    response_class,
                     background=self.background,
                     content=data,
-                    headers=headers,
+                    headers={**rendered_headers},
                     media_type=media_type,
                     status_code=self.status_code,
+                    **extra,
                 )
+                # The large JSON contents are encoded in worker threads.
+                threshold = self.dispatch_plan.json_offload_threshold
+                if threshold is None or media_type != MediaType.JSON:
+                    response = make_response()
+                else:
+                    response = await json_offload.run(
+                        make_response, size=estimate_json_size(data), threshold=threshold
+                    )
 
-            for cookie in _cookies:
-                response.set_cookie(**cookie)  # pragma: no cover
+            self._set_cookies(response, [], rendered_cookies)
             return response
 
         return cast(Callable[[Response, Dict[str, Any]], LilyaResponse], response_content)
@@ -891,7 +1058,12 @@ class Dispatcher(BaseSignature, BaseDispatcher, OpenAPIDefinitionMixin):
         Raises:
         - PermissionDenied: If the connection is not allowed.
         """
-        for permission in self.get_permissions():
+        plan = self.dispatch_plan
+        if plan.permission_chain is not None:
+            await plan.permission_chain(cast("Request", connection), cast("APIGateHandler", self))
+            return
+
+        for permission in plan.permissions:
             awaitable: "BasePermission" = cast("BasePermission", await permission())
             request: "Request" = cast("Request", connection)
             handler = cast("APIGateHandler", self)
@@ -984,6 +1156,148 @@ class Dispatcher(BaseSignature, BaseDispatcher, OpenAPIDefinitionMixin):
             )
         return cast("List[AsyncCallable]", self._interceptors)
 
+    def compile_dispatch_plan(self) -> DispatchPlan:
+        """
+        Compiles the `DispatchPlan` of the handler.
+
+        Everything that depends on the parent levels of the handler is resolved here,
+        once, instead of on every connection.
+
+        Returns:
+        - DispatchPlan: The immutable dispatch plan of the handler.
+
+        Example:
+        >>> handler = Dispatcher()
+        >>> plan = handler.compile_dispatch_plan()
+        >>> print(plan.permissions)
+        """
+        fn = cast("AnyCallable", self.fn)
+        if isinstance(self.parent, View):
+            fn = partial(fn, self.parent)
+
+        permission_chain: Optional[PermissionChain] = None
+        interceptor_chain: Optional[InterceptorChain] = None
+        if settings.singleton_permissions:
+            levels = self.parent_levels
+            permission_chain = PermissionChain(
+                [permission for level in levels for permission in level.permissions or []],
+                executor=cast("Optional[Executor]", settings.permissions_executor),
+            )
+            interceptor_chain = InterceptorChain(
+                [interceptor for level in levels for interceptor in level.interceptors or []]
+            )
+
+        sync_executor = cast("Optional[SyncExecutorType]", settings.sync_executor)
+        for level in self.parent_levels:
+            if getattr(level, "sync_executor", None) is not None:
+                sync_executor = level.sync_executor
+
+        signature_engine = cast("Optional[str]", settings.signature_engine)
+        for level in self.parent_levels:
+            if getattr(level, "signature_engine", None) is not None:
+                signature_engine = level.signature_engine
+
+        json_offload_threshold = cast("Optional[int]", settings.json_offload_threshold)
+        for level in self.parent_levels:
+            if getattr(level, "json_offload_threshold", None) is not None:
+                json_offload_threshold = level.json_offload_threshold
+
+        response_cache: Optional[ResponseCache] = None
+        for level in self.parent_levels:
+            if isinstance(getattr(level, "cache", None), ResponseCache):
+                response_cache = level.cache
+
+        conditional = cast("Optional[Conditional]", settings.conditional)
+        for level in self.parent_levels:
+            if isinstance(getattr(level, "conditional", None), Conditional):
+                conditional = level.conditional
+
+        coalesce: Optional[Coalesce] = None
+        for level in self.parent_levels:
+            if isinstance(getattr(level, "coalesce", None), Coalesce):
+                coalesce = level.coalesce
+
+        executor = get_sync_executor(sync_executor)
+        dependency_executor = executor
+        if isinstance(executor, ProcessExecutor):
+            # The dependencies get the connection and other non-picklable arguments.
+            dependency_executor = None
+            if not is_async_callable(fn):
+                executor.validate(fn)
+
+        return DispatchPlan(
+            parent=self.parent,
+            interceptors=tuple(self.get_interceptors()),
+            permissions=tuple(self.get_permissions()),
+            methods=frozenset(getattr(self, "methods", None) or ()),
+            fn=fn,
+            is_async=is_async_callable(fn),
+            response_headers={},
+            response_cookies=[],
+            permission_chain=permission_chain,
+            interceptor_chain=interceptor_chain,
+            executor=executor,
+            dependency_executor=dependency_executor,
+            signature=get_signature_engine(
+                signature_engine, getattr(self, "signature_model", None)
+            ),
+            body_decoder=self.get_body_decoder(),
+            json_offload_threshold=json_offload_threshold,
+            response_cache=response_cache,
+            conditional=conditional,
+            coalesce=coalesce,
+        )
+
+    def get_body_decoder(self) -> Optional[BodyDecoder]:
+        """
+        Returns the decoder of the raw request body of the handler.
+
+        The body is only decoded into the declared type when none of the dependencies
+        reads it, the dependencies expecting the JSON payload.
+
+        Returns:
+        - Optional[BodyDecoder]: The decoder or `None` to parse the JSON payload.
+        """
+        signature_model = getattr(self, "signature_model", None)
+        if signature_model is None or signature_model.body_decoder is None:
+            return None
+
+        for dependency in self.get_dependencies().values():
+            dependency_model = getattr(dependency, "signature_model", None)
+            model_fields = getattr(dependency_model, "model_fields", None) or {}
+            if DATA in model_fields or PAYLOAD in model_fields:
+                return None
+        return cast("BodyDecoder", signature_model.body_decoder)
+
+    def freeze(self) -> DispatchPlan:
+        """
+        Compiles and stores the `DispatchPlan` used by `handle_dispatch`.
+
+        This is run for every handler when the application starts and lazily on
+        the first connection for the handlers added afterwards.
+
+        Returns:
+        - DispatchPlan: The immutable dispatch plan of the handler.
+        """
+        self._dispatch_plan = self.compile_dispatch_plan()
+        return self._dispatch_plan
+
+    @property
+    def dispatch_plan(self) -> DispatchPlan:
+        """
+        Returns the `DispatchPlan` of the handler, compiling it if needed.
+
+        A plan is compiled again if the handler was moved to a different parent,
+        for instance when copied into a `View`.
+
+        Returns:
+        - DispatchPlan: The immutable dispatch plan of the handler.
+        """
+        plan: Optional[DispatchPlan] = getattr(self, "_dispatch_plan", None)
+        if plan is None or plan.parent is not self.parent:
+            plan = self.freeze()
+        return plan
+
     async def intercept(self, scope: "Scope", receive: "Receive", send: "Send") -> None:
         """
         Executes all the interceptors in the handler scope before reaching any of the handlers.
@@ -1008,6 +1322,11 @@ class Dispatcher(BaseSignature, BaseDispatcher, OpenAPIDefinitionMixin):
         - The `intercept` method does not return any value.
         - The `intercept` method is responsible for executing the interceptors in the handler scope.
         """
-        for interceptor in self.get_interceptors():
+        plan = self.dispatch_plan
+        if plan.interceptor_chain is not None:
+            await plan.interceptor_chain(scope, receive, send)
+            return
+
+        for interceptor in plan.interceptors:
             awaitable: "EsmeraldInterceptor" = await interceptor()
             await awaitable.intercept(scope, receive, send)
@@ -17,6 +17,9 @@ if TYPE_CHECKING:  # pragma: no cover
     from esmerald.interceptors.types import Interceptor
     from esmerald.openapi.schemas.v3_1_0.security_scheme import SecurityScheme
     from esmerald.permissions.types import Permission
+    from esmerald.responses.cache import ResponseCache
+    from esmerald.responses.coalesce import Coalesce
+    from esmerald.responses.conditional import Conditional
     from esmerald.routing.router import HTTPHandler, WebhookHandler, WebSocketHandler
     from esmerald.types import Dependencies, ExceptionHandlerMap, Middleware, ParentType
 
@@ -112,6 +115,9 @@ class Gateway(LilyaPath, Dispatcher, BaseMiddleware, GatewayUtil):
         "deprecated",
         "tags",
         "operation_id",
+        "cache",
+        "conditional",
+        "coalesce",
     )
 
     def __init__(
@@ -271,6 +277,58 @@ class Gateway(LilyaPath, Dispatcher, BaseMiddleware, GatewayUtil):
                 """
             ),
         ] = None,
+        cache: Annotated[
+            Optional["ResponseCache"],
+            Doc(
+                """
+                How the responses of the `GET` and `HEAD` handlers of the `Gateway` are
+                cached, unless the handler sets its own.
+
+                **Example**
+
+                ```python
+                from esmerald import Gateway, ResponseCache
+
+                Gateway(handler=catalog, cache=ResponseCache(ttl=60))
+                ```
+                """
+            ),
+        ] = None,
+        conditional: Annotated[
+            Optional["Conditional"],
+            Doc(
+                """
+                How the `GET` and `HEAD` requests of the handlers of the `Gateway` are answered
+                with a `304 Not Modified`, unless the handler sets its own.
+
+                **Example**
+
+                ```python
+                from esmerald import Conditional, Gateway
+
+                Gateway(handler=document, conditional=Conditional())
+                ```
+                """
+            ),
+        ] = None,
+        coalesce: Annotated[
+            Optional["Coalesce"],
+            Doc(
+                """
+                How the identical `GET` and `HEAD` requests in flight of the handler of the
+                `Gateway` are coalesced into a single execution of the handler, unless the
+                handler sets its own.
+
+                **Example**
+
+                ```python
+                from esmerald import Coalesce, Gateway
+
+                Gateway(handler=reports, coalesce=Coalesce(timeout=5))
+                ```
+                """
+            ),
+        ] = None,
     ) -> None:
         if not path:
             path = "/"
@@ -326,6 +384,9 @@ class Gateway(LilyaPath, Dispatcher, BaseMiddleware, GatewayUtil):
             self.path
         )
         self.operation_id = operation_id
+        self.cache = cache
+        self.conditional = conditional
+        self.coalesce = coalesce
 
         if self.is_handler(self.handler):  # type: ignore
             self.handler.name = self.name
@@ -20,7 +20,11 @@ from esmerald.types import (
 from esmerald.utils.constants import AVAILABLE_METHODS
 
 if TYPE_CHECKING:  # pragma: no cover
+    from esmerald.executors import SyncExecutorType
     from esmerald.openapi.schemas.v3_1_0 import SecurityScheme
+    from esmerald.responses.cache import ResponseCache
+    from esmerald.responses.coalesce import Coalesce
+    from esmerald.responses.conditional import Conditional
 
 
 SUCCESSFUL_RESPONSE = "Successful response"
@@ -377,6 +381,114 @@ def get(
                 """
         ),
     ] = None,
+    sync_executor: Annotated[
+        Optional["SyncExecutorType"],
+        Doc(
+            """
+                How the handler runs when it is a sync function. One of `"inline"`,
+                `"thread"`, `"process"` or a `esmerald.executors.SyncExecutor`
+                instance. When not provided, the closest `sync_executor` of the `Include` or
+                of the application applies and, by default, the handler runs inline.
+
+                **Example**
+
+                ```python
+                from esmerald import get
+                from esmerald.executors import ThreadExecutor
+
+
+                @get("/report", sync_executor=ThreadExecutor("reports", total_tokens=4))
+                def report() -> dict: ...
+                ```
+                """
+        ),
+    ] = None,
+    cache: Annotated[
+        Optional["ResponseCache"],
+        Doc(
+            """
+                How the responses of the handler are cached. Only the `GET` and `HEAD`
+                requests are cached and a cached response is sent without resolving the
+                dependencies nor calling the handler. When not provided, the closest `cache`
+                of the `Gateway`, `APIView` or `Include` applies.
+
+                **Example**
+
+                ```python
+                from esmerald import ResponseCache, get
+
+
+                @get("/catalog", cache=ResponseCache(ttl=60, query_params=["page"]))
+                async def catalog(page: int = 1) -> List[Product]: ...
+                ```
+                """
+        ),
+    ] = None,
+    conditional: Annotated[
+        Optional["Conditional"],
+        Doc(
+            """
+                How the `GET` and `HEAD` requests of the handler are answered with a
+                `304 Not Modified` when the `If-None-Match` or `If-Modified-Since` of the
+                request still match. When not provided, the closest `conditional` of the
+                `Gateway`, `APIView`, `Include` or of the application applies.
+
+                **Example**
+
+                ```python
+                from esmerald import Conditional, get
+
+
+                @get("/documents/{id}", conditional=Conditional(etag=get_revision))
+                async def document(id: int) -> Document: ...
+                ```
+                """
+        ),
+    ] = None,
+    coalesce: Annotated[
+        Optional["Coalesce"],
+        Doc(
+            """
+                How the identical `GET` and `HEAD` requests in flight are coalesced. Only
+                one of them runs the handler and its serialized response is shared with the
+                others. When not provided, the `coalesce` of the `Gateway` applies.
+
+                **Example**
+
+                ```python
+                from esmerald import Coalesce, get
+
+
+                @get("/reports", coalesce=Coalesce(timeout=5, max_waiters=500))
+                async def reports(year: int) -> Report: ...
+                ```
+                """
+        ),
+    ] = None,
+    static: Annotated[
+        bool,
+        Doc(
+            """
+                Boolean flag indicating if the handler always returns the same response, for
+                instance a health check or a `/version`. The handler runs on the first request
+                and its encoded response, with a gzip variant for the larger bodies, is then
+                replayed to every request without running the handler again.
+
+                A static handler cannot declare parameters.
+
+                **Example**
+
+                ```python
+                from esmerald import get
+
+
+                @get("/version", static=True)
+                async def version() -> dict:
+                    return {"version": "1.0.0"}
+                ```
+                """
+        ),
+    ] = False,
 ) -> HTTPHandler:
     """
     Handler responsible for the HTTP method `get` and
@@ -418,6 +530,11 @@ def get(
             security=security,
             operation_id=operation_id,
             response_description=response_description,
+            sync_executor=sync_executor,
+            cache=cache,
+            conditional=conditional,
+            coalesce=coalesce,
+            static=static,
             responses=responses,
         )
         handler.fn = func
@@ -657,6 +774,114 @@ def head(
                 """
         ),
     ] = None,
+    sync_executor: Annotated[
+        Optional["SyncExecutorType"],
+        Doc(
+            """
+                How the handler runs when it is a sync function. One of `"inline"`,
+                `"thread"`, `"process"` or a `esmerald.executors.SyncExecutor`
+                instance. When not provided, the closest `sync_executor` of the `Include` or
+                of the application applies and, by default, the handler runs inline.
+
+                **Example**
+
+                ```python
+                from esmerald import get
+                from esmerald.executors import ThreadExecutor
+
+
+                @get("/report", sync_executor=ThreadExecutor("reports", total_tokens=4))
+                def report() -> dict: ...
+                ```
+                """
+        ),
+    ] = None,
+    cache: Annotated[
+        Optional["ResponseCache"],
+        Doc(
+            """
+                How the responses of the handler are cached. Only the `GET` and `HEAD`
+                requests are cached and a cached response is sent without resolving the
+                dependencies nor calling the handler. When not provided, the closest `cache`
+                of the `Gateway`, `APIView` or `Include` applies.
+
+                **Example**
+
+                ```python
+                from esmerald import ResponseCache, get
+
+
+                @get("/catalog", cache=ResponseCache(ttl=60, query_params=["page"]))
+                async def catalog(page: int = 1) -> List[Product]: ...
+                ```
+                """
+        ),
+    ] = None,
+    conditional: Annotated[
+        Optional["Conditional"],
+        Doc(
+            """
+                How the `GET` and `HEAD` requests of the handler are answered with a
+                `304 Not Modified` when the `If-None-Match` or `If-Modified-Since` of the
+                request still match. When not provided, the closest `conditional` of the
+                `Gateway`, `APIView`, `Include` or of the application applies.
+
+                **Example**
+
+                ```python
+                from esmerald import Conditional, get
+
+
+                @get("/documents/{id}", conditional=Conditional(etag=get_revision))
+                async def document(id: int) -> Document: ...
+                ```
+                """
+        ),
+    ] = None,
+    coalesce: Annotated[
+        Optional["Coalesce"],
+        Doc(
+            """
+                How the identical `GET` and `HEAD` requests in flight are coalesced. Only
+                one of them runs the handler and its serialized response is shared with the
+                others. When not provided, the `coalesce` of the `Gateway` applies.
+
+                **Example**
+
+                ```python
+                from esmerald import Coalesce, get
+
+
+                @get("/reports", coalesce=Coalesce(timeout=5, max_waiters=500))
+                async def reports(year: int) -> Report: ...
+                ```
+                """
+        ),
+    ] = None,
+    static: Annotated[
+        bool,
+        Doc(
+            """
+                Boolean flag indicating if the handler always returns the same response, for
+                instance a health check or a `/version`. The handler runs on the first request
+                and its encoded response, with a gzip variant for the larger bodies, is then
+                replayed to every request without running the handler again.
+
+                A static handler cannot declare parameters.
+
+                **Example**
+
+                ```python
+                from esmerald import get
+
+
+                @get("/version", static=True)
+                async def version() -> dict:
+                    return {"version": "1.0.0"}
+                ```
+                """
+        ),
+    ] = False,
 ) -> HTTPHandler:
     """
     Handler responsible for the HTTP method `head` and
@@ -687,6 +912,11 @@ def head(
             security=security,
             operation_id=operation_id,
             response_description=response_description,
+            sync_executor=sync_executor,
+            cache=cache,
+            conditional=conditional,
+            coalesce=coalesce,
+            static=static,
             responses=responses,
         )
         handler.fn = func
@@ -1054,6 +1284,28 @@ def post(
                 """
         ),
     ] = None,
+    sync_executor: Annotated[
+        Optional["SyncExecutorType"],
+        Doc(
+            """
+                How the handler runs when it is a sync function. One of `"inline"`,
+                `"thread"`, `"process"` or a `esmerald.executors.SyncExecutor`
+                instance. When not provided, the closest `sync_executor` of the `Include` or
+                of the application applies and, by default, the handler runs inline.
+
+                **Example**
+
+                ```python
+                from esmerald import get
+                from esmerald.executors import ThreadExecutor
+
+
+                @get("/report", sync_executor=ThreadExecutor("reports", total_tokens=4))
+                def report() -> dict: ...
+                ```
+                """
+        ),
+    ] = None,
 ) -> HTTPHandler:
     """
     Handler responsible for the HTTP method `post` and
@@ -1095,6 +1347,7 @@ def post(
             security=security,
             operation_id=operation_id,
             response_description=response_description,
+            sync_executor=sync_executor,
             responses=responses,
         )
         handler.fn = func
@@ -1457,6 +1710,28 @@ def put(
                 """
         ),
     ] = None,
+    sync_executor: Annotated[
+        Optional["SyncExecutorType"],
+        Doc(
+            """
+                How the handler runs when it is a sync function. One of `"inline"`,
+                `"thread"`, `"process"` or a `esmerald.executors.SyncExecutor`
+                instance. When not provided, the closest `sync_executor` of the `Include` or
+                of the application applies and, by default, the handler runs inline.
+
+                **Example**
+
+                ```python
+                from esmerald import get
+                from esmerald.executors import ThreadExecutor
+
+
+                @get("/report", sync_executor=ThreadExecutor("reports", total_tokens=4))
+                def report() -> dict: ...
+                ```
+                """
+        ),
+    ] = None,
 ) -> HTTPHandler:
     """
     Handler responsible for the HTTP method `put` and
@@ -1498,6 +1773,7 @@ def put(
             security=security,
             operation_id=operation_id,
             response_description=response_description,
+            sync_executor=sync_executor,
             responses=responses,
         )
         handler.fn = func
@@ -1860,6 +2136,28 @@ def patch(
                 """
         ),
     ] = None,
+    sync_executor: Annotated[
+        Optional["SyncExecutorType"],
+        Doc(
+            """
+                How the handler runs when it is a sync function. One of `"inline"`,
+                `"thread"`, `"process"` or a `esmerald.executors.SyncExecutor`
+                instance. When not provided, the closest `sync_executor` of the `Include` or
+                of the application applies and, by default, the handler runs inline.
+
+                **Example**
+
+                ```python
+                from esmerald import get
+                from esmerald.executors import ThreadExecutor
+
+
+                @get("/report", sync_executor=ThreadExecutor("reports", total_tokens=4))
+                def report() -> dict: ...
+                ```
+                """
+        ),
+    ] = None,
 ) -> HTTPHandler:
     """
     Handler responsible for the HTTP method `path` and
@@ -1901,6 +2199,7 @@ def patch(
             security=security,
             operation_id=operation_id,
             response_description=response_description,
+            sync_executor=sync_executor,
             responses=responses,
         )
         handler.fn = func
@@ -2263,6 +2562,28 @@ def delete(
                 """
         ),
     ] = None,
+    sync_executor: Annotated[
+        Optional["SyncExecutorType"],
+        Doc(
+            """
+                How the handler runs when it is a sync function. One of `"inline"`,
+                `"thread"`, `"process"` or a `esmerald.executors.SyncExecutor`
+                instance. When not provided, the closest `sync_executor` of the `Include` or
+                of the application applies and, by default, the handler runs inline.
+
+                **Example**
+
+                ```python
+                from esmerald import get
+                from esmerald.executors import ThreadExecutor
+
+
+                @get("/report", sync_executor=ThreadExecutor("reports", total_tokens=4))
+                def report() -> dict: ...
+                ```
+                """
+        ),
+    ] = None,
 ) -> HTTPHandler:
     """
     Handler responsible for the HTTP method `delete` and
@@ -2304,6 +2625,7 @@ def delete(
             security=security,
             operation_id=operation_id,
             response_description=response_description,
+            sync_executor=sync_executor,
             responses=responses,
         )
         handler.fn = func
@@ -2543,6 +2865,28 @@ def options(
                 """
         ),
     ] = None,
+    sync_executor: Annotated[
+        Optional["SyncExecutorType"],
+        Doc(
+            """
+                How the handler runs when it is a sync function. One of `"inline"`,
+                `"thread"`, `"process"` or a `esmerald.executors.SyncExecutor`
+                instance. When not provided, the closest `sync_executor` of the `Include` or
+                of the application applies and, by default, the handler runs inline.
+
+                **Example**
+
+                ```python
+                from esmerald import get
+                from esmerald.executors import ThreadExecutor
+
+
+                @get("/report", sync_executor=ThreadExecutor("reports", total_tokens=4))
+                def report() -> dict: ...
+                ```
+                """
+        ),
+    ] = None,
 ) -> HTTPHandler:
     """
     Handler responsible for the HTTP method `options` and
@@ -2573,6 +2917,7 @@ def options(
             security=security,
             operation_id=operation_id,
             response_description=response_description,
+            sync_executor=sync_executor,
             responses=responses,
         )
         handler.fn = func
@@ -2812,6 +3157,28 @@ def trace(
                 """
         ),
     ] = None,
+    sync_executor: Annotated[
+        Optional["SyncExecutorType"],
+        Doc(
+            """
+                How the handler runs when it is a sync function. One of `"inline"`,
+                `"thread"`, `"process"` or a `esmerald.executors.SyncExecutor`
+                instance. When not provided, the closest `sync_executor` of the `Include` or
+                of the application applies and, by default, the handler runs inline.
+
+                **Example**
+
+                ```python
+                from esmerald import get
+                from esmerald.executors import ThreadExecutor
+
+
+                @get("/report", sync_executor=ThreadExecutor("reports", total_tokens=4))
+                def report() -> dict: ...
+                ```
+                """
+        ),
+    ] = None,
 ) -> HTTPHandler:
     """
     Handler responsible for the HTTP method `trace` and
@@ -2843,6 +3210,7 @@ def trace(
             security=security,
             operation_id=operation_id,
             response_description=response_description,
+            sync_executor=sync_executor,
             responses=responses,
         )
         handler.fn = func
@@ -3224,6 +3592,114 @@ def route(
                 """
         ),
     ] = None,
+    sync_executor: Annotated[
+        Optional["SyncExecutorType"],
+        Doc(
+            """
+                How the handler runs when it is a sync function. One of `"inline"`,
+                `"thread"`, `"process"` or a `esmerald.executors.SyncExecutor`
+                instance. When not provided, the closest `sync_executor` of the `Include` or
+                of the application applies and, by default, the handler runs inline.
+
+                **Example**
+
+                ```python
+                from esmerald import get
+                from esmerald.executors import ThreadExecutor
+
+
+                @get("/report", sync_executor=ThreadExecutor("reports", total_tokens=4))
+                def report() -> dict: ...
+                ```
+                """
+        ),
+    ] = None,
+    cache: Annotated[
+        Optional["ResponseCache"],
+        Doc(
+            """
+                How the responses of the handler are cached. Only the `GET` and `HEAD`
+                requests are cached and a cached response is sent without resolving the
+                dependencies nor calling the handler. When not provided, the closest `cache`
+                of the `Gateway`, `APIView` or `Include` applies.
+
+                **Example**
+
+                ```python
+                from esmerald import ResponseCache, get
+
+
+                @get("/catalog", cache=ResponseCache(ttl=60, query_params=["page"]))
+                async def catalog(page: int = 1) -> List[Product]: ...
+                ```
+                """
+        ),
+    ] = None,
+    conditional: Annotated[
+        Optional["Conditional"],
+        Doc(
+            """
+                How the `GET` and `HEAD` requests of the handler are answered with a
+                `304 Not Modified` when the `If-None-Match` or `If-Modified-Since` of the
+                request still match. When not provided, the closest `conditional` of the
+                `Gateway`, `APIView`, `Include` or of the application applies.
+
+                **Example**
+
+                ```python
+                from esmerald import Conditional, get
+
+
+                @get("/documents/{id}", conditional=Conditional(etag=get_revision))
+                async def document(id: int) -> Document: ...
+                ```
+                """
+        ),
+    ] = None,
+    coalesce: Annotated[
+        Optional["Coalesce"],
+        Doc(
+            """
+                How the identical `GET` and `HEAD` requests in flight are coalesced. Only
+                one of them runs the handler and its serialized response is shared with the
+                others. When not provided, the `coalesce` of the `Gateway` applies.
+
+                **Example**
+
+                ```python
+                from esmerald import Coalesce, get
+
+
+                @get("/reports", coalesce=Coalesce(timeout=5, max_waiters=500))
+                async def reports(year: int) -> Report: ...
+                ```
+                """
+        ),
+    ] = None,
+    static: Annotated[
+        bool,
+        Doc(
+            """
+                Boolean flag indicating if the handler always returns the same response, for
+                instance a health check or a `/version`. The handler runs on the first request
+                and its encoded response, with a gzip variant for the larger bodies, is then
+                replayed to every request without running the handler again.
+
+                A static handler cannot declare parameters.
+
+                **Example**
+
+                ```python
+                from esmerald import get
+
+
+                @get("/version", static=True)
+                async def version() -> dict:
+                    return {"version": "1.0.0"}
+                ```
+                """
+        ),
+    ] = False,
 ) -> HTTPHandler:
     """
     Handler responsible for allowing multiple HTTP verbs in one go
@@ -3280,6 +3756,11 @@ def route(
             security=security,
             operation_id=operation_id,
             response_description=response_description,
+            sync_executor=sync_executor,
+            cache=cache,
+            conditional=conditional,
+            coalesce=coalesce,
+            static=static,
             responses=responses,
         )
 
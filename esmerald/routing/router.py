@@ -3,6 +3,7 @@ from __future__ import annotations
 import inspect
 from copy import copy
 from enum import IntEnum
+from functools import partial
 from inspect import Signature
 from typing import (
     TYPE_CHECKING,
@@ -10,6 +11,7 @@ from typing import (
     Awaitable,
     Callable,
     Dict,
+    Iterator,
     List,
     Mapping,
     NoReturn,
@@ -58,9 +60,14 @@ from esmerald.openapi.datastructures import OpenAPIResponse
 from esmerald.openapi.utils import is_status_code_allowed
 from esmerald.requests import Request
 from esmerald.responses import Response
+from esmerald.responses.cache import ResponseCache
+from esmerald.responses.coalesce import AnyResponse, Coalesce
+from esmerald.responses.conditional import CONDITIONAL_METHODS, Conditional, RawHeaders
+from esmerald.responses.static import StaticResponse
+from esmerald.routing._index import IndexedRouter, RouteIndexMixin
 from esmerald.routing._internal import OpenAPIFieldInfoMixin
 from esmerald.routing.apis.base import View
-from esmerald.routing.base import Dispatcher
+from esmerald.routing.base import Dispatcher, DispatchPlan
 from esmerald.routing.gateways import Gateway, WebhookGateway, WebSocketGateway
 from esmerald.transformers.model import TransformerModel
 from esmerald.transformers.signature import SignatureModel
@@ -72,6 +79,7 @@ from esmerald.websockets import WebSocket, WebSocketClose
 
 if TYPE_CHECKING:  # pragma: no cover
     from esmerald.applications import Application, Esmerald
+    from esmerald.executors import SyncExecutorType
     from esmerald.openapi.schemas.v3_1_0.security_scheme import SecurityScheme
     from esmerald.permissions.types import Permission
     from esmerald.types import (
@@ -91,7 +99,7 @@ if TYPE_CHECKING:  # pragma: no cover
     from esmerald.typing import AnyCallable
 
 
-class BaseRouter(LilyaRouter):
+class BaseRouter(RouteIndexMixin, LilyaRouter):
     __slots__ = (
         "redirect_slashes",
         "default",
@@ -551,6 +559,43 @@ class BaseRouter(LilyaRouter):
 
     def activate(self) -> None:
         self.routes = self.reorder_routes()
+        self.activate_route_index()
+
+    def freeze(self) -> None:
+        """
+        Compiles the dispatch plan of every handler reachable from the router.
+
+        Once frozen, the handlers dispatch the connections without walking the
+        parent levels. Handlers added after the freeze are compiled lazily on
+        their first connection.
+        """
+        self.freeze_routes(self.routes)
+
+    def freeze_routes(self, routes: Sequence[Any]) -> None:
+        """
+        Compiles the dispatch plans of the given routes and any nested route.
+
+        Args:
+            routes: The routes to freeze.
+        """
+        for handler in self.iter_handlers(routes):
+            handler.freeze()
+
+    def iter_handlers(
+        self, routes: Sequence[Any]
+    ) -> Iterator[Union[HTTPHandler, WebSocketHandler]]:
+        """
+        Yields the handlers of the given routes and any nested route.
+
+        Args:
+            routes: The routes to walk.
+        """
+        for route in routes or []:
+            if isinstance(route, (Gateway, WebSocketGateway, WebhookGateway)):
+                if isinstance(route.handler, (HTTPHandler, WebSocketHandler)):
+                    yield route.handler
+            elif isinstance(route, (Include, Host)):
+                yield from self.iter_handlers(getattr(route, "routes", None) or [])
 
     async def not_found(
         self, scope: "Scope", receive: "Receive", send: "Send"
@@ -1909,6 +1954,7 @@ class HTTPHandler(Dispatcher, OpenAPIFieldInfoMixin, LilyaPath):
         "_permissions",
         "_dependencies",
         "_response_handler",
+        "_dispatch_plan",
         "_middleware",
         "methods",
         "status_code",
@@ -1931,6 +1977,12 @@ class HTTPHandler(Dispatcher, OpenAPIFieldInfoMixin, LilyaPath):
         "security",
         "operation_id",
         "interceptors",
+        "sync_executor",
+        "cache",
+        "conditional",
+        "coalesce",
+        "static",
+        "_static_response",
         "__type__",
     )
 
@@ -1961,6 +2013,11 @@ class HTTPHandler(Dispatcher, OpenAPIFieldInfoMixin, LilyaPath):
         responses: Optional[Dict[int, OpenAPIResponse]] = None,
         security: Optional[List[SecurityScheme]] = None,
         operation_id: Optional[str] = None,
+        sync_executor: Optional[SyncExecutorType] = None,
+        cache: Optional[ResponseCache] = None,
+        conditional: Optional[Conditional] = None,
+        coalesce: Optional[Coalesce] = None,
+        static: bool = False,
     ) -> None:
         """
         Handles the "handler" or "apiview" of the platform. A handler can be any get, put, patch, post, delete or route.
@@ -1978,6 +2035,8 @@ class HTTPHandler(Dispatcher, OpenAPIFieldInfoMixin, LilyaPath):
         self._dependencies: Dependencies = {}
 
         self._response_handler: Union[Callable[[Any], Awaitable[LilyaResponse]], VoidType] = Void
+        self._dispatch_plan: Optional[DispatchPlan] = None
+        self._static_response: Optional[StaticResponse] = None
 
         self.parent: ParentType = None
         self.path = path
@@ -1992,6 +2051,11 @@ class HTTPHandler(Dispatcher, OpenAPIFieldInfoMixin, LilyaPath):
 
         self.security = security or []
         self.operation_id = operation_id
+        self.sync_executor = sync_executor
+        self.cache = cache
+        self.conditional = conditional
+        self.coalesce = coalesce
+        self.static = static
 
         if not methods:
             methods = [HttpMethod.GET.value]
@@ -2065,7 +2129,7 @@ class HTTPHandler(Dispatcher, OpenAPIFieldInfoMixin, LilyaPath):
         a MethodNotAllowed if otherwise.
         """
         for method in methods:
-            if method not in self.http_methods:
+            if method not in self.dispatch_plan.methods:
                 raise MethodNotAllowed(detail=f"Method {method.upper()} not allowed.")
 
     @property
@@ -2110,30 +2174,110 @@ class HTTPHandler(Dispatcher, OpenAPIFieldInfoMixin, LilyaPath):
                 filtered_cookies.append(cookie)
         return filtered_cookies
 
+    def compile_dispatch_plan(self) -> DispatchPlan:
+        """
+        Adds the resolved response class, headers, cookies and response builder
+        to the dispatch plan of the handler.
+        """
+        plan = super().compile_dispatch_plan()
+        return plan._replace(
+            response_class=self.get_response_class(),
+            response_headers=self.get_response_headers(),
+            response_cookies=self.get_response_cookies(),
+            response_handler=self.get_response_for_handler(),
+        )
+
     async def handle_dispatch(self, scope: "Scope", receive: "Receive", send: "Send") -> None:
         """
         ASGIapp that authorizes the connection and then awaits the handler function.
         """
-        if self.get_interceptors():
+        plan = self.dispatch_plan
+        if plan.interceptors:
             await self.intercept(scope, receive, send)
 
-        methods = [scope["method"]]
-        await self.allowed_methods(scope, receive, send, methods)
+        method = scope["method"]
+        if method not in plan.methods:
+            raise MethodNotAllowed(detail=f"Method {method.upper()} not allowed.")
 
-        request = Request(scope=scope, receive=receive, send=send)
-        route_handler, parameter_model = self.route_map[scope["method"]]
-
-        if self.get_permissions():
+        if plan.permissions:
             connection = Connection(scope=scope, receive=receive)
             await self.allow_connection(connection)
 
+        if self._static_response is not None and plan.conditional is None:
+            await self._static_response(scope, receive, send)
+            return
+
+        request = Request(scope=scope, receive=receive, send=send)
+        route_handler, parameter_model = self.route_map[method]
+
+        if self._static_response is not None:
+            not_modified = plan.conditional.not_modified(
+                request, self._static_response.encoded_headers
+            )
+            if not_modified is not None:
+                await not_modified(scope, receive, send)
+            else:
+                await self._static_response(scope, receive, send)
+            return
+
+        conditional = plan.conditional if method in CONDITIONAL_METHODS else None
+        validators: RawHeaders = []
+        if conditional is not None:
+            validators = await conditional.get_validators(request)
+            not_modified = conditional.not_modified(request, validators)
+            if not_modified is not None:
+                await not_modified(scope, receive, send)
+                return
+
+        cache = plan.response_cache
+        response: Optional[AnyResponse] = None
+        if cache is not None:
+            response = await cache.get(request)
+
+        if response is None:
+            build = partial(
+                self.build_response, scope, request, route_handler, parameter_model, validators
+            )
+            if plan.coalesce is not None:
+                response = await plan.coalesce.run(request, build)
+            else:
+                response = await build()
+            # The first request of a static handler also gets the precomputed response.
+            response = self._static_response or response
+
+        if conditional is not None:
+            not_modified = conditional.not_modified(request, response.encoded_headers)
+            if not_modified is not None:
+                not_modified.background = getattr(response, "background", None)
+                response = not_modified
+        await response(scope, receive, send)
+
+    async def build_response(
+        self,
+        scope: "Scope",
+        request: Request,
+        route_handler: HTTPHandler,
+        parameter_model: TransformerModel,
+        validators: RawHeaders,
+    ) -> LilyaResponse:
+        """
+        Builds the response of the handler, adding the validators of the conditional
+        requests and storing it in the response cache, if any.
+        """
+        plan = self.dispatch_plan
         response = await self.get_response_for_request(
             scope=scope,
             request=request,
             route=route_handler,
             parameter_model=parameter_model,
         )
-        await response(scope, receive, send)
+        if plan.conditional is not None:
+            plan.conditional.add_validators(response, validators)
+        if plan.response_cache is not None:
+            await plan.response_cache.store(request, response)
+        if self.static and self._static_response is None:
+            self._static_response = StaticResponse.from_response(response)
+        return response
 
     def check_handler_function(self) -> None:
         """Validates the route handler function once it's set by inspecting its
@@ -2222,10 +2366,34 @@ class HTTPHandler(Dispatcher, OpenAPIFieldInfoMixin, LilyaPath):
         self.check_handler_function()
         self.validate_annotations()
         self.validate_reserved_kwargs()
+        self.validate_static()
+
+    def validate_static(self) -> None:
+        """
+        Validates a static handler, replaying the same response to every request, does
+        not depend on the request.
+
+        Raises:
+            ImproperlyConfigured if the handler declares parameters or handles other
+            methods than `GET` and `HEAD`.
+        """
+        if not self.static:
+            return
+
+        parameters = [name for name in self.handler_signature.parameters if name != "self"]
+        if parameters:
+            raise ImproperlyConfigured(
+                f"The static handler '{self.fn.__name__}' cannot declare parameters, "
+                f"got {', '.join(parameters)}."
+            )
+        if not self.methods <= {HttpMethod.GET.value, HttpMethod.HEAD.value}:
+            raise ImproperlyConfigured(
+                f"The static handler '{self.fn.__name__}' can only handle GET and HEAD."
+            )
 
     async def to_response(self, app: "Esmerald", data: Any) -> LilyaResponse:
-        response_handler = self.get_response_for_handler()
-        return await response_handler(app=app, data=data)  # type: ignore[call-arg]
+        response_handler = self.dispatch_plan.response_handler
+        return await response_handler(app=app, data=data)
 
 
 class WebhookHandler(HTTPHandler, OpenAPIFieldInfoMixin, LilyaPath):
@@ -2238,6 +2406,7 @@ class WebhookHandler(HTTPHandler, OpenAPIFieldInfoMixin, LilyaPath):
         "_permissions",
         "_dependencies",
         "_response_handler",
+        "_dispatch_plan",
         "_middleware",
         "methods",
         "status_code",
@@ -2353,6 +2522,7 @@ class WebSocketHandler(Dispatcher, LilyaWebSocketPath):
         self._dependencies: Dependencies = {}
         self._response_handler: Union[Callable[[Any], Awaitable[LilyaResponse]], VoidType] = Void
         self._interceptors: Union[List[Interceptor], VoidType] = Void
+        self._dispatch_plan: Optional[DispatchPlan] = None
         self.interceptors: Sequence[Interceptor] = []
         self.handler = handler
         self.parent: ParentType = None
@@ -2401,20 +2571,18 @@ class WebSocketHandler(Dispatcher, LilyaWebSocketPath):
 
     async def handle_dispatch(self, scope: "Scope", receive: "Receive", send: "Send") -> None:
         """The handle of a websocket"""
-        if self.get_interceptors():
+        plan = self.dispatch_plan
+        if plan.interceptors:
             await self.intercept(scope, receive, send)
 
         websocket = WebSocket(scope=scope, receive=receive, send=send)
-        if self.get_permissions():
+        if plan.permissions:
             await self.allow_connection(connection=websocket)
 
         kwargs = await self.get_kwargs(websocket=websocket)
 
-        fn = cast("AsyncAnyCallable", self.fn)
-        if isinstance(self.parent, View):
-            await fn(self.parent, **kwargs)
-        else:
-            await fn(**kwargs)
+        fn = cast("AsyncAnyCallable", plan.fn)
+        await fn(**kwargs)
 
     async def get_kwargs(self, websocket: WebSocket) -> Any:
         """Resolves the required kwargs from the request data.
@@ -2429,11 +2597,11 @@ class WebSocketHandler(Dispatcher, LilyaWebSocketPath):
 
         signature_model = get_signature(self)
         kwargs = self.websocket_parameter_model.to_kwargs(connection=websocket)
-        for dependency in self.websocket_parameter_model.dependencies:
-            kwargs[dependency.key] = await self.websocket_parameter_model.get_dependencies(
-                dependency=dependency, connection=websocket, **kwargs
-            )
-        return signature_model.parse_values_for_connection(connection=websocket, **kwargs)
+        await self.websocket_parameter_model.resolve_dependencies(
+            self.websocket_parameter_model.dependencies, websocket, kwargs
+        )
+        signature = self.dispatch_plan.signature or signature_model
+        return signature.parse_values_for_connection(connection=websocket, **kwargs)
 
 
 class Include(LilyaInclude):
@@ -2462,6 +2630,10 @@ class Include(LilyaInclude):
         "deprecated",
         "security",
         "tags",
+        "sync_executor",
+        "signature_engine",
+        "cache",
+        "conditional",
     )
 
     def __init__(
@@ -2769,6 +2941,75 @@ class Include(LilyaInclude):
                 """
             ),
         ] = None,
+        sync_executor: Annotated[
+            Optional[SyncExecutorType],
+            Doc(
+                """
+                How the sync handlers and dependencies of the `Include` run. One of `"inline"`,
+                `"thread"`, `"process"` or a `esmerald.executors.SyncExecutor` instance.
+
+                **Example**
+
+                ```python
+                from esmerald import Include
+                from esmerald.executors import ThreadExecutor
+
+                Include("/orders", routes=[...], sync_executor=ThreadExecutor("orders", 10))
+                ```
+                """
+            ),
+        ] = None,
+        signature_engine: Annotated[
+            Optional[str],
+            Doc(
+                """
+                The engine validating the parameters of the handlers of the `Include`.
+                One of `"pydantic"` or `"msgspec"`.
+
+                **Example**
+
+                ```python
+                from esmerald import Include
+
+                Include("/orders", routes=[...], signature_engine="msgspec")
+                ```
+                """
+            ),
+        ] = None,
+        cache: Annotated[
+            Optional[ResponseCache],
+            Doc(
+                """
+                How the responses of the `GET` and `HEAD` handlers of the `Include` are
+                cached, unless a handler, `Gateway` or `APIView` sets its own.
+
+                **Example**
+
+                ```python
+                from esmerald import Include, ResponseCache
+
+                Include("/catalog", routes=[...], cache=ResponseCache(ttl=60))
+                ```
+                """
+            ),
+        ] = None,
+        conditional: Annotated[
+            Optional[Conditional],
+            Doc(
+                """
+                How the `GET` and `HEAD` requests of the handlers of the `Include` are answered
+                with a `304 Not Modified`, unless a handler, `Gateway` or `APIView` sets its own.
+
+                **Example**
+
+                ```python
+                from esmerald import Conditional, Include
+
+                Include("/documents", routes=[...], conditional=Conditional())
+                ```
+                """
+            ),
+        ] = None,
     ) -> None:
         self.path = path
         if not path:
@@ -2815,6 +3056,10 @@ class Include(LilyaInclude):
         self.parent = parent
         self.security = security or []
         self.tags = tags or []
+        self.sync_executor = sync_executor
+        self.signature_engine = signature_engine
+        self.cache = cache
+        self.conditional = conditional
 
         if namespace:
             routes = include(namespace, pattern)
@@ -2822,6 +3067,12 @@ class Include(LilyaInclude):
         if routes:
             routes = self.resolve_route_path_handler(routes)
 
+        # The routes are served by an indexed router instead of the
+        # default linear scan of the Lilya router.
+        if self.app is None and routes is not None:
+            self.app = IndexedRouter(routes=routes)
+            routes = None
+
         super().__init__(
             path=self.path,
             app=self.app,
@@ -0,0 +1,181 @@
+"""
+Precompiled converters of the signatures with primitive parameters only.
+
+Most handlers only receive path and query parameters of primitive types. Validating
+those with the signature model means instantiating the model and reading every
+field back on each request. The converters give the same values without the model.
+Anything the converters cannot convert on their own, including every invalid value,
+goes through the signature model, meaning the validation errors stay the same.
+"""
+
+import re
+from typing import Any, Callable, Dict, Optional, Tuple, get_args
+from uuid import UUID
+
+from lilya.transformers import TRANSFORMER_TYPES
+from pydantic.fields import FieldInfo
+
+from esmerald.utils.helpers import is_union
+
+# Returned by a converter when the value must be validated by the signature model.
+FALLBACK: Any = object()
+
+Converter = Callable[[Any], Any]
+FieldConverter = Tuple[str, Converter, bool, Any]
+
+_INTEGER = re.compile(TRANSFORMER_TYPES["int"].regex)
+_FLOAT = re.compile(TRANSFORMER_TYPES["float"].regex)
+_UUID = re.compile(TRANSFORMER_TYPES["uuid"].regex)
+
+# The largest number of digits converted without the signature model.
+MAX_DIGITS = 18
+
+BOOLEANS = {
+    "true": True,
+    "t": True,
+    "yes": True,
+    "y": True,
+    "on": True,
+    "1": True,
+    "false": False,
+    "f": False,
+    "no": False,
+    "n": False,
+    "off": False,
+    "0": False,
+}
+
+
+def convert_str(value: Any) -> Any:
+    return value if type(value) is str else FALLBACK
+
+
+def convert_int(value: Any) -> Any:
+    if type(value) is int:
+        return value
+    if type(value) is str and len(value) <= MAX_DIGITS and _INTEGER.fullmatch(value):
+        return int(value)
+    return FALLBACK
+
+
+def convert_float(value: Any) -> Any:
+    if type(value) is float:
+        return value
+    if type(value) is str and len(value) <= MAX_DIGITS and _FLOAT.fullmatch(value):
+        return float(value)
+    return FALLBACK
+
+
+def convert_bool(value: Any) -> Any:
+    if type(value) is bool:
+        return value
+    if type(value) is str:
+        return BOOLEANS.get(value.lower(), FALLBACK)
+    return FALLBACK
+
+
+def convert_uuid(value: Any) -> Any:
+    if type(value) is UUID:
+        return value
+    if type(value) is str and _UUID.fullmatch(value):
+        return UUID(value)
+    return FALLBACK
+
+
+def convert_any(value: Any) -> Any:
+    return value
+
+
+CONVERTERS: Dict[Any, Converter] = {
+    str: convert_str,
+    int: convert_int,
+    float: convert_float,
+    bool: convert_bool,
+    UUID: convert_uuid,
+    Any: convert_any,
+}
+
+# The defaults are returned as they are, like the signature model does with immutable ones.
+IMMUTABLE_DEFAULTS = (type(None), str, int, float, bool, UUID)
+
+
+def _optional(converter: Converter) -> Converter:
+    def convert_optional(value: Any) -> Any:
+        return None if value is None else converter(value)
+
+    return convert_optional
+
+
+def get_converter(annotation: Any) -> Optional[Converter]:
+    """
+    Returns the converter of a primitive annotation, `Optional` included, or `None`.
+    """
+    if annotation in CONVERTERS:
+        return CONVERTERS[annotation]
+
+    if is_union(annotation):
+        arguments = [argument for argument in get_args(annotation) if argument is not type(None)]
+        if len(arguments) == 1 and len(get_args(annotation)) == 2:
+            converter = get_converter(arguments[0])
+            return _optional(converter) if converter is not None else None
+    return None
+
+
+def get_field_converter(name: str, field: FieldInfo) -> Optional[FieldConverter]:
+    """
+    Returns the converter of a field of a signature model or `None` if the field must be
+    validated by the model.
+    """
+    if field.metadata or (field.alias and field.alias != name):
+        return None
+    if field.default_factory is not None:
+        return None
+
+    converter = get_converter(field.annotation)
+    if converter is None:
+        return None
+
+    is_required = field.is_required()
+    if not is_required and not isinstance(field.default, IMMUTABLE_DEFAULTS):
+        return None
+    return name, converter, is_required, field.default
+
+
+def compile_converters(
+    model_fields: Dict[str, FieldInfo],
+) -> Optional[Tuple[FieldConverter, ...]]:
+    """
+    Compiles the converters of the fields of a signature model.
+
+    Returns:
+        Optional[Tuple[FieldConverter, ...]]: The converters or `None` when any of the
+            fields is not primitive.
+    """
+    converters = []
+    for name, field in model_fields.items():
+        converter = get_field_converter(name, field)
+        if converter is None:
+            return None
+        converters.append(converter)
+    return tuple(converters)
+
+
+def convert_values(
+    converters: Tuple[FieldConverter, ...], kwargs: Dict[str, Any]
+) -> Optional[Dict[str, Any]]:
+    """
+    Converts the values of the fields or returns `None` when any of the values must be
+    validated by the signature model.
+    """
+    values: Dict[str, Any] = {}
+    for name, converter, is_required, default in converters:
+        if name in kwargs:
+            value = converter(kwargs[name])
+            if value is FALLBACK:
+                return None
+            values[name] = value
+        elif is_required:
+            return None
+        else:
+            values[name] = default
+    return values
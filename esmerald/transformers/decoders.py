@@ -0,0 +1,73 @@
+"""
+Decoders of the request bodies declared as a Pydantic model or a `msgspec.Struct`.
+
+Without a decoder, the body is parsed into a `dict`, built into the declared type by
+the encoder and validated again by the signature model. A decoder builds the declared
+type from the raw bytes of the body in one step, with `model_validate_json` or
+`msgspec.json.decode`, and the signature model accepts the instance as it is.
+
+An invalid body is parsed again the usual way, meaning the validation errors stay
+the same.
+"""
+
+from functools import partial
+from typing import TYPE_CHECKING, Any, Callable, Optional, Tuple, Type, cast, get_args
+
+import msgspec
+from msgspec import Struct
+from pydantic import BaseModel, ValidationError
+from pydantic.fields import FieldInfo
+
+from esmerald.encoders import MsgSpecEncoder, PydanticEncoder
+from esmerald.utils.helpers import is_class_and_subclass, is_union
+
+if TYPE_CHECKING:  # pragma: no cover
+    from esmerald.encoders import Encoder
+
+BodyDecoder = Callable[[bytes], Any]
+
+# Raised by the decoders when the body must be parsed the usual way.
+DECODE_ERRORS: Tuple[Type[Exception], ...] = (ValidationError, msgspec.MsgspecError)
+
+NULL = b"null"
+
+
+def _decode_optional(decoder: BodyDecoder, body: bytes) -> Any:
+    return None if body == NULL else decoder(body)
+
+
+def get_body_decoder(annotation: Any) -> Optional[BodyDecoder]:
+    """
+    Returns the decoder of the raw body for the annotation or `None`.
+
+    Only the Pydantic models and the `msgspec.Struct`, `Optional` included, are
+    decoded from the raw body.
+    """
+    if is_class_and_subclass(annotation, BaseModel):
+        return cast("BodyDecoder", annotation.model_validate_json)
+    if is_class_and_subclass(annotation, Struct):
+        return partial(msgspec.json.decode, type=annotation)
+
+    if is_union(annotation):
+        arguments = [argument for argument in get_args(annotation) if argument is not type(None)]
+        if len(arguments) == 1 and len(get_args(annotation)) == 2:
+            decoder = get_body_decoder(arguments[0])
+            return partial(_decode_optional, decoder) if decoder is not None else None
+    return None
+
+
+def get_field_body_decoder(
+    field: FieldInfo, encoder: Optional["Encoder"]
+) -> Optional[BodyDecoder]:
+    """
+    Returns the decoder of the body field of a signature model or `None` if the body
+    must be parsed the usual way.
+
+    The fields with constraints or with a custom encoder are not decoded from the raw
+    body.
+    """
+    if field.metadata:
+        return None
+    if encoder is not None and not isinstance(encoder, (PydanticEncoder, MsgSpecEncoder)):
+        return None
+    return get_body_decoder(field.annotation)
@@ -0,0 +1,225 @@
+"""
+The engines validating the values of the signatures of the handlers.
+
+The `pydantic` engine, the default, validates the values with the signature model of
+the handler. The `msgspec` engine compiles the fields supported by msgspec into a
+`msgspec.Struct` converted with `msgspec.convert` and validates the others, for
+instance the Pydantic models, with a Pydantic model of those fields only.
+"""
+
+import weakref
+from collections.abc import Iterable, Mapping
+from copy import deepcopy
+from functools import partial
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Type,
+    Union,
+    cast,
+)
+
+import msgspec
+from lilya._internal._encoders import DataclassEncoder, EnumEncoder, PrimitiveEncoder
+from msgspec import inspect as msgspec_inspect
+from pydantic import ValidationError, create_model
+from pydantic.fields import FieldInfo
+
+from esmerald.encoders import MsgSpecEncoder
+from esmerald.exceptions import ImproperlyConfigured
+from esmerald.parsers import ArbitraryBaseModel
+from esmerald.transformers.utils import _collects
+
+if TYPE_CHECKING:  # pragma: no cover
+    from esmerald.requests import Request
+    from esmerald.transformers.signature import SignatureModel
+    from esmerald.websockets import WebSocket
+
+PYDANTIC = "pydantic"
+MSGSPEC = "msgspec"
+SIGNATURE_ENGINES = (PYDANTIC, MSGSPEC)
+
+# The encoders of the types msgspec converts on its own.
+MSGSPEC_ENCODERS = (MsgSpecEncoder, DataclassEncoder, EnumEncoder, PrimitiveEncoder)
+
+# The defaults a `msgspec.Struct` accepts as they are, the others are copied.
+IMMUTABLE_DEFAULTS = (type(None), str, int, float, bool, bytes, tuple, frozenset)
+
+# The annotations of the fields receiving the values of the repeated parameters.
+SEQUENCE_TYPES = (list, tuple, set, frozenset)
+
+
+def is_msgspec_type(annotation: Any) -> bool:
+    """
+    If msgspec converts the annotation on its own, without any custom type.
+    """
+    try:
+        info = msgspec_inspect.type_info(annotation)
+    except (TypeError, ValueError):
+        return False
+    return _is_supported(info, set())
+
+
+def _is_supported(info: Any, seen: Set[int]) -> bool:
+    if isinstance(info, msgspec_inspect.CustomType):
+        return False
+    if id(info) in seen:
+        return True
+    seen.add(id(info))
+
+    for name in getattr(info, "__struct_fields__", ()):
+        value = getattr(info, name)
+        values = value if isinstance(value, tuple) else (value,)
+        for item in values:
+            if isinstance(item, msgspec_inspect.Field):
+                item = item.type
+            if isinstance(item, msgspec_inspect.Type) and not _is_supported(item, seen):
+                return False
+    return True
+
+
+def _get_struct_field(name: str, field: FieldInfo) -> Tuple[Any, ...]:
+    if field.default_factory is not None:
+        return (
+            name,
+            field.annotation,
+            msgspec.field(default_factory=cast("Callable[[], Any]", field.default_factory)),
+        )
+    if field.is_required():
+        return name, field.annotation
+    if isinstance(field.default, IMMUTABLE_DEFAULTS):
+        return name, field.annotation, field.default
+    return name, field.annotation, msgspec.field(default_factory=partial(deepcopy, field.default))
+
+
+class MsgSpecSignature:
+    """
+    Validates the values of a signature model with msgspec.
+
+    The fields are converted with `msgspec.convert`, in lax mode, except the ones with
+    annotations msgspec does not support on its own, the ones with constraints or
+    aliases and the ones with a custom encoder, which are validated by Pydantic.
+
+    The values failing the conversion are validated again by the signature model, raising
+    the same errors as the `pydantic` engine.
+    """
+
+    __slots__ = ("signature_model", "struct", "fallback", "fallback_fields", "sequence_fields")
+
+    def __init__(self, signature_model: Type["SignatureModel"]) -> None:
+        self.signature_model = signature_model
+        encoders = signature_model.encoders or {}
+
+        struct_fields: List[Tuple[Any, ...]] = []
+        fallback_fields: Dict[str, Any] = {}
+        sequence_fields: List[str] = []
+        for name, field in signature_model.model_fields.items():
+            encoder = encoders.get(name, {}).get("encoder")  # type: ignore
+            if (
+                not field.metadata
+                and (not field.alias or field.alias == name)
+                and (encoder is None or isinstance(encoder, MSGSPEC_ENCODERS))
+                and is_msgspec_type(field.annotation)
+            ):
+                struct_fields.append(_get_struct_field(name, field))
+                if _collects(field.annotation, SEQUENCE_TYPES):
+                    sequence_fields.append(name)
+            else:
+                fallback_fields[name] = (field.annotation, field)
+
+        self.struct = msgspec.defstruct(
+            f"{signature_model.__name__}_struct", struct_fields, kw_only=True
+        )
+        self.fallback_fields = tuple(fallback_fields)
+        self.sequence_fields = tuple(sequence_fields)
+        self.fallback: Optional[Type[ArbitraryBaseModel]] = None
+        if fallback_fields:
+            self.fallback = create_model(
+                f"{signature_model.__name__}_fallback",
+                __base__=ArbitraryBaseModel,
+                **fallback_fields,
+            )
+
+    def parse_values_for_connection(
+        self, connection: Union["Request", "WebSocket"], **kwargs: Any
+    ) -> Dict[str, Any]:
+        """
+        Validates the keyword arguments of the connection.
+
+        Args:
+            connection (Union[Request, WebSocket]): The connection object.
+            kwargs (Any): Keyword arguments to validate.
+
+        Returns:
+            Dict[str, Any]: The validated values of the fields.
+        """
+        signature_model = self.signature_model
+        values = kwargs
+        for name in self.sequence_fields:
+            # The repeated parameters are views msgspec does not convert.
+            value = kwargs.get(name)
+            if isinstance(value, Iterable) and not isinstance(
+                value, (list, tuple, str, bytes, Mapping)
+            ):
+                if values is kwargs:
+                    values = dict(kwargs)
+                values[name] = list(value)
+
+        try:
+            values = msgspec.structs.asdict(msgspec.convert(values, self.struct, strict=False))
+        except msgspec.ValidationError:
+            return cast(
+                "Dict[str, Any]", signature_model.parse_values_for_connection(connection, **kwargs)
+            )
+
+        if self.fallback is not None:
+            fallback_kwargs = {
+                name: kwargs[name] for name in self.fallback_fields if name in kwargs
+            }
+            try:
+                if signature_model.encoders:
+                    fallback_kwargs = signature_model.parse_encoders(fallback_kwargs)
+                fallback = self.fallback(**fallback_kwargs)
+            except ValidationError as e:
+                raise signature_model.build_base_system_exception(connection, e) from e
+            except Exception as e:
+                raise signature_model.build_encoder_exception(connection, e) from e
+
+            for name in self.fallback_fields:
+                values[name] = getattr(fallback, name)
+        return values
+
+
+_signatures: "weakref.WeakKeyDictionary[Any, MsgSpecSignature]" = weakref.WeakKeyDictionary()
+
+
+def get_signature_engine(
+    engine: Optional[str], signature_model: Optional[Type["SignatureModel"]]
+) -> Optional[MsgSpecSignature]:
+    """
+    Returns the validation of the signature model by the given engine or `None` when
+    the signature model validates the values itself.
+
+    The signatures converted by the precompiled primitive converters of the signature
+    model keep them, being faster than any engine.
+
+    Args:
+        engine (Optional[str]): One of `"pydantic"` or `"msgspec"`.
+        signature_model (Optional[Type[SignatureModel]]): The signature model.
+    """
+    if engine is not None and engine not in SIGNATURE_ENGINES:
+        raise ImproperlyConfigured(
+            f"Unknown signature_engine {engine!r}. Use one of {', '.join(SIGNATURE_ENGINES)}."
+        )
+    if engine != MSGSPEC or signature_model is None or signature_model.converters is not None:
+        return None
+
+    if signature_model not in _signatures:
+        _signatures[signature_model] = MsgSpecSignature(signature_model)
+    return _signatures[signature_model]
@@ -1,24 +1,46 @@
-from typing import TYPE_CHECKING, Any, Dict, Mapping, Optional, Set, Tuple, Type, Union, cast
+from collections import ChainMap
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Dict,
+    Iterable,
+    List,
+    Mapping,
+    Optional,
+    Set,
+    Tuple,
+    Type,
+    Union,
+    cast,
+)
 
+import anyio
+from lilya.datastructures import State
 from pydantic.fields import FieldInfo
 
 from esmerald.context import Context
 from esmerald.enums import EncodingType, ParamType
 from esmerald.exceptions import ImproperlyConfigured
+from esmerald.executors import SyncExecutor
 from esmerald.params import Body
 from esmerald.parsers import ArbitraryExtraBaseModel, parse_form_data
 from esmerald.requests import Request
+from esmerald.transformers.decoders import DECODE_ERRORS, BodyDecoder
 from esmerald.transformers.signature import SignatureModel
 from esmerald.transformers.utils import (
     Dependency,
+    DependencyCache,
     ParamSetting,
+    RequestParamsPlan,
+    compile_request_params,
     create_parameter_setting,
-    get_request_params,
+    extract_request_params,
     get_signature,
     merge_sets,
 )
 from esmerald.utils.constants import CONTEXT, DATA, PAYLOAD, RESERVED_KWARGS
 from esmerald.utils.schema import is_field_optional
+from esmerald.utils.sync import unwrap_exception_group
 
 if TYPE_CHECKING:
     from esmerald.routing.router import HTTPHandler, WebSocketHandler
@@ -30,6 +52,58 @@ MEDIA_TYPES = [EncodingType.MULTI_PART, EncodingType.URL_ENCODED]
 MappingUnion = Mapping[Union[int, str], Any]
 
 
+class ConnectionSource:
+    """
+    The sources of a connection read by a handler, combined into the
+    `TransformerModel.sources` bitmask when the signature is created.
+
+    Only the sources in the bitmask are parsed on each request, meaning the headers
+    and the cookies of the connection are not parsed for the handlers that do not
+    declare any.
+    """
+
+    QUERY_PARAMS = 1
+    PATH_PARAMS = 2
+    HEADERS = 4
+    COOKIES = 8
+    QUERY = 16
+
+
+def get_connection_sources(
+    query_params: RequestParamsPlan,
+    path_params: RequestParamsPlan,
+    headers: RequestParamsPlan,
+    cookies: RequestParamsPlan,
+    reserved_kwargs: Set[str],
+) -> int:
+    """
+    Returns the `ConnectionSource` bitmask of the compiled parameters and the reserved
+    keyword arguments of a handler.
+    """
+    sources = 0
+    if query_params.extractors:
+        sources |= ConnectionSource.QUERY_PARAMS
+    if path_params.extractors:
+        sources |= ConnectionSource.PATH_PARAMS
+    if headers.extractors:
+        sources |= ConnectionSource.HEADERS
+    if cookies.extractors:
+        sources |= ConnectionSource.COOKIES
+    if "query" in reserved_kwargs:
+        sources |= ConnectionSource.QUERY
+    return sources
+
+
+def get_state_view(state: State) -> State:
+    """
+    Returns a copy on write view of the state of the application.
+
+    The values of the application state are read through the view while the values
+    set on the view are kept in the view, without copying the application state.
+    """
+    return State(cast("Dict[str, Any]", ChainMap({}, state._state)))
+
+
 class TransformerModel(ArbitraryExtraBaseModel):
     """
     Represents a transformer model with parameters and dependencies.
@@ -80,6 +154,19 @@ class TransformerModel(ArbitraryExtraBaseModel):
         )
         self.is_optional = is_optional
 
+        # Compiled once so the extraction of the parameters is a single pass per request.
+        self.query_params_plan = compile_request_params(query_params)
+        self.path_params_plan = compile_request_params(path_params)
+        self.headers_plan = compile_request_params(headers)
+        self.cookies_plan = compile_request_params(cookies)
+        self.sources = get_connection_sources(
+            query_params=self.query_params_plan,
+            path_params=self.path_params_plan,
+            headers=self.headers_plan,
+            cookies=self.cookies_plan,
+            reserved_kwargs=reserved_kwargs,
+        )
+
     def get_cookie_params(self) -> Set[ParamSetting]:
         """
         Get cookie parameters.
@@ -120,37 +207,49 @@ class TransformerModel(ArbitraryExtraBaseModel):
         self,
         connection: Union["WebSocket", "Request"],
         handler: Union["HTTPHandler", "WebSocketHandler"] = None,
+        body_decoder: Optional[BodyDecoder] = None,
     ) -> Any:
-        connection_params = {}
-        for key, value in connection.query_params.items():
-            if len(value) == 1:
-                value = value[0]
-                connection_params[key] = value
-
-        query_params = get_request_params(
-            params=cast("MappingUnion", connection.query_params),
-            expected=self.query_params,
-            url=connection.url,
-        )
-        path_params = get_request_params(
-            params=cast("MappingUnion", connection.path_params),
-            expected=self.path_params,
-            url=connection.url,
-        )
-        headers = get_request_params(
-            params=cast("MappingUnion", connection.headers),
-            expected=self.headers,
-            url=connection.url,
-        )
-        cookies = get_request_params(
-            params=cast("MappingUnion", connection.cookies),
-            expected=self.cookies,
-            url=connection.url,
-        )
+        sources = self.sources
+        query_params: Dict[str, Any] = {}
+        path_params: Dict[str, Any] = {}
+        headers: Dict[str, Any] = {}
+        cookies: Dict[str, Any] = {}
+
+        if sources & ConnectionSource.QUERY_PARAMS:
+            query_params = extract_request_params(
+                params=cast("MappingUnion", connection.query_params),
+                plan=self.query_params_plan,
+                url=connection.url,
+            )
+        if sources & ConnectionSource.PATH_PARAMS:
+            path_params = extract_request_params(
+                params=cast("MappingUnion", connection.path_params),
+                plan=self.path_params_plan,
+                url=connection.url,
+            )
+        if sources & ConnectionSource.HEADERS:
+            headers = extract_request_params(
+                params=cast("MappingUnion", connection.headers),
+                plan=self.headers_plan,
+                url=connection.url,
+            )
+        if sources & ConnectionSource.COOKIES:
+            cookies = extract_request_params(
+                params=cast("MappingUnion", connection.cookies),
+                plan=self.cookies_plan,
+                url=connection.url,
+            )
 
         if not self.reserved_kwargs:
             return {**query_params, **path_params, **headers, **cookies}
 
+        connection_params = {}
+        if sources & ConnectionSource.QUERY:
+            for key, value in connection.query_params.items():
+                if len(value) == 1:
+                    value = value[0]
+                    connection_params[key] = value
+
         return self.handle_reserved_kwargs(
             connection=connection,
             connection_params=connection_params,
@@ -159,19 +258,30 @@ class TransformerModel(ArbitraryExtraBaseModel):
             headers=headers,
             cookies=cookies,
             handler=handler,
+            body_decoder=body_decoder,
         )
 
-    async def get_request_data(self, request: Request) -> Any:
+    async def get_request_data(
+        self, request: Request, body_decoder: Optional[BodyDecoder] = None
+    ) -> Any:
         """
         Get request data asynchronously.
 
         Args:
             request (Request): HTTP Request object.
+            body_decoder (Optional[BodyDecoder]): Decoder of the raw JSON body into the
+                declared type. An invalid body is parsed into the JSON payload instead.
 
         Returns:
-            Any: Parsed form data or JSON payload.
+            Any: Parsed form data, decoded body or JSON payload.
         """
         if not self.form_data:
+            if body_decoder is not None:
+                try:
+                    return await request.decode_json(body_decoder)
+                except DECODE_ERRORS:
+                    # Parsed the usual way so the validation errors stay the same.
+                    pass
             return await request.json()
 
         media_type, field = self.form_data
@@ -194,6 +304,107 @@ class TransformerModel(ArbitraryExtraBaseModel):
         """
         return Context(__handler__=handler, __request__=request)
 
+    async def resolve_dependencies(
+        self,
+        dependencies: Iterable[Dependency],
+        connection: Union["WebSocket", Request],
+        kwargs: Dict[str, Any],
+        cache: Optional[DependencyCache] = None,
+        executor: Optional[SyncExecutor] = None,
+    ) -> None:
+        """
+        Resolve the given dependencies into the kwargs.
+
+        The dependencies of the same level do not depend on each other, only on their own
+        dependencies, which means they are resolved concurrently in a task group.
+        The sync dependencies and the ones declared with `Inject(concurrent=False)`
+        are resolved one after another, before the concurrent ones.
+
+        A dependency shared by several dependants is resolved once per request,
+        unless declared with `Inject(request_cache=False)`.
+
+        Args:
+            dependencies (Iterable[Dependency]): The dependencies to resolve.
+            connection (Union[WebSocket, Request]): WebSocket or HTTP Request object.
+            kwargs (Dict[str, Any]): The kwargs where the resolved values are assigned.
+            cache (Optional[DependencyCache]): The values already resolved during the request.
+            executor (Optional[SyncExecutor]): The executor running the sync dependencies.
+        """
+        if cache is None:
+            cache = DependencyCache()
+
+        concurrent: List[Dependency] = []
+        for dependency in dependencies:
+            if dependency.is_concurrent:
+                concurrent.append(dependency)
+            else:
+                kwargs[dependency.key] = await self.resolve_dependency(
+                    dependency, connection, kwargs, cache, executor
+                )
+
+        if len(concurrent) < 2:
+            for dependency in concurrent:
+                kwargs[dependency.key] = await self.resolve_dependency(
+                    dependency, connection, kwargs, cache, executor
+                )
+            return
+
+        values: Dict[str, Any] = {}
+
+        async def resolve(dependency: Dependency) -> None:
+            values[dependency.key] = await self.resolve_dependency(
+                dependency, connection, kwargs, cache, executor
+            )
+
+        try:
+            async with anyio.create_task_group() as group:
+                for dependency in concurrent:
+                    group.start_soon(resolve, dependency)
+        except Exception as exc:
+            raise unwrap_exception_group(exc) from None
+        kwargs.update(values)
+
+    async def resolve_dependency(
+        self,
+        dependency: Dependency,
+        connection: Union["WebSocket", Request],
+        kwargs: Dict[str, Any],
+        cache: DependencyCache,
+        executor: Optional[SyncExecutor] = None,
+    ) -> Any:
+        """
+        Resolve a dependency, and its own dependencies, once per request.
+
+        Args:
+            dependency (Dependency): Dependency object.
+            connection (Union[WebSocket, Request]): WebSocket or HTTP Request object.
+            kwargs (Dict[str, Any]): The values available to the dependency.
+            cache (DependencyCache): The values already resolved during the request.
+            executor (Optional[SyncExecutor]): The executor running the sync dependencies.
+
+        Returns:
+            Any: The value of the dependency.
+        """
+        if dependency.is_singleton:
+            return await dependency.inject.warm_up()
+
+        async def resolver() -> Any:
+            dependency_kwargs = dict(kwargs)
+            await self.resolve_dependencies(
+                dependency.dependencies, connection, dependency_kwargs, cache, executor
+            )
+            signature_model = get_signature(dependency.inject)
+            return await dependency.inject.resolve(
+                signature_model.parse_values_for_connection(
+                    connection=connection, **dependency_kwargs
+                ),
+                executor,
+            )
+
+        if not dependency.use_request_cache:
+            return await resolver()
+        return await cache.resolve(dependency.key, resolver)
+
     async def get_dependencies(
         self, dependency: Dependency, connection: Union["WebSocket", Request], **kwargs: Any
     ) -> Any:
@@ -208,15 +419,7 @@ class TransformerModel(ArbitraryExtraBaseModel):
         Returns:
             Any: Dependencies resolved from the connection and dependencies.
         """
-        signature_model = get_signature(dependency.inject)
-        for _dependency in dependency.dependencies:
-            kwargs[_dependency.key] = await self.get_dependencies(
-                dependency=_dependency, connection=connection, **kwargs
-            )
-        dependency_kwargs = signature_model.parse_values_for_connection(
-            connection=connection, **kwargs
-        )
-        return await dependency.inject(**dependency_kwargs)
+        return await self.resolve_dependency(dependency, connection, kwargs, DependencyCache())
 
     def to_dict(self) -> Dict[str, Any]:
         """
@@ -288,6 +491,7 @@ class TransformerModel(ArbitraryExtraBaseModel):
         headers: Any,
         cookies: Any,
         handler: Optional[Any] = None,
+        body_decoder: Optional[BodyDecoder] = None,
     ) -> Any:
         """
         Handle reserved keyword arguments.
@@ -300,15 +504,21 @@ class TransformerModel(ArbitraryExtraBaseModel):
             headers (Any): Headers.
             cookies (Any): Cookies.
             handler (Optional[Any], optional): Handler object. Defaults to None.
+            body_decoder (Optional[BodyDecoder], optional): Decoder of the raw JSON body.
+                Defaults to None.
 
         Returns:
             Any: Reserved keyword arguments.
         """
         reserved_kwargs: Any = {}
         if DATA in self.reserved_kwargs:
-            reserved_kwargs[DATA] = self.get_request_data(request=cast("Request", connection))
+            reserved_kwargs[DATA] = self.get_request_data(
+                request=cast("Request", connection), body_decoder=body_decoder
+            )
         if PAYLOAD in self.reserved_kwargs:
-            reserved_kwargs[PAYLOAD] = self.get_request_data(request=cast("Request", connection))
+            reserved_kwargs[PAYLOAD] = self.get_request_data(
+                request=cast("Request", connection), body_decoder=body_decoder
+            )
 
         if CONTEXT in self.reserved_kwargs and handler is not None:
             reserved_kwargs[CONTEXT] = self.get_request_context(
@@ -326,31 +536,44 @@ class TransformerModel(ArbitraryExtraBaseModel):
         if "query" in self.reserved_kwargs:
             reserved_kwargs["query"] = connection_params
         if "state" in self.reserved_kwargs:
-            reserved_kwargs["state"] = connection.app.state.copy()  # pragma: no cover
+            reserved_kwargs["state"] = get_state_view(connection.app.state)
 
         return {**reserved_kwargs, **path_params, **query_params, **headers, **cookies}
 
 
-def dependency_tree(key: str, dependencies: "Dependencies") -> Dependency:
+def dependency_tree(
+    key: str, dependencies: "Dependencies", built: Optional[Dict[str, Dependency]] = None
+) -> Dependency:
     """
     Recursively build a dependency tree starting from a given key.
 
+    The dependencies shared by several dependants are built once and reused, which
+    makes the tree a directed acyclic graph.
+
     Args:
         key (str): Key of the dependency to start building from.
         dependencies (Dependencies): Dictionary of dependencies.
+        built (Optional[Dict[str, Dependency]]): The dependencies already built.
 
     Returns:
         Dependency: Constructed dependency tree starting from the specified key.
     """
+    if built is None:
+        built = {}
+    if key in built:
+        return built[key]
+
     inject = dependencies[key]
     dependency_keys = [key for key in get_signature(inject).model_fields if key in dependencies]
-    return Dependency(
+    dependency = built[key] = Dependency(
         key=key,
         inject=inject,
         dependencies=[
-            dependency_tree(key=key, dependencies=dependencies) for key in dependency_keys
+            dependency_tree(key=key, dependencies=dependencies, built=built)
+            for key in dependency_keys
         ],
     )
+    return dependency
 
 
 def get_parameter_settings(
@@ -375,9 +598,10 @@ def get_parameter_settings(
     }
     parameter_definitions: Set[ParamSetting] = set()
 
+    built: Dict[str, Dependency] = {}
     for key in dependencies:
         if key in signature_fields:
-            _dependencies.add(dependency_tree(key=key, dependencies=dependencies))
+            _dependencies.add(dependency_tree(key=key, dependencies=dependencies, built=built))
 
     for field_name, model_field in signature_fields.items():
         if field_name not in ignored_keys:
@@ -1,14 +1,17 @@
 import re
+import weakref
 from inspect import Parameter as InspectParameter, Signature as InspectSignature
 from typing import (
     TYPE_CHECKING,
     Any,
     ClassVar,
     Dict,
+    FrozenSet,
     Generator,
     List,
     Optional,
     Set,
+    Tuple,
     Type,
     Union,
     _GenericAlias,
@@ -19,7 +22,7 @@ from typing import (
 from orjson import loads
 from pydantic import ValidationError, create_model
 
-from esmerald.encoders import ENCODER_TYPES, Encoder
+from esmerald.encoders import ENCODER_TYPES, Encoder, encoder_cache
 from esmerald.exceptions import (
     HTTPException,
     ImproperlyConfigured,
@@ -29,8 +32,11 @@ from esmerald.exceptions import (
 from esmerald.parsers import ArbitraryBaseModel, ArbitraryExtraBaseModel
 from esmerald.requests import Request
 from esmerald.transformers.constants import CLASS_SPECIAL_WORDS, UNDEFINED, VALIDATION_NAMES
+from esmerald.transformers.converters import FieldConverter, compile_converters, convert_values
+from esmerald.transformers.decoders import BodyDecoder, get_field_body_decoder
 from esmerald.transformers.utils import get_connection_info, get_field_definition_from_param
 from esmerald.typing import Undefined
+from esmerald.utils.constants import DATA, PAYLOAD
 from esmerald.utils.dependency import is_dependency_field, should_skip_dependency_validation
 from esmerald.utils.helpers import is_optional_union
 from esmerald.websockets import WebSocket
@@ -131,6 +137,12 @@ class SignatureModel(ArbitraryBaseModel):
         encoders (ClassVar[Dict[str, "Encoder"]]): Class variable holding a dictionary of encoders.
             This attribute stores encoder instances associated with parameter names,
             allowing customized encoding and decoding of function parameters.
+        converters (ClassVar[Optional[Tuple[FieldConverter, ...]]]): Class variable holding the
+            precompiled converters of the fields when all of them are primitive, in which case
+            the valid values are converted without instantiating the model.
+        body_decoder (ClassVar[Optional[BodyDecoder]]): Class variable holding the decoder of
+            the raw request body when the `data` or `payload` is a Pydantic model or a
+            `msgspec.Struct`.
 
     Note:
         - `dependency_names` and `return_annotation` are intended to be set statically for the class.
@@ -140,6 +152,8 @@ class SignatureModel(ArbitraryBaseModel):
     dependency_names: ClassVar[Set[str]]
     return_annotation: ClassVar[Any]
     encoders: ClassVar[Dict["Encoder", Any]]
+    converters: ClassVar[Optional[Tuple["FieldConverter", ...]]] = None
+    body_decoder: ClassVar[Optional["BodyDecoder"]] = None
 
     @classmethod
     def parse_encoders(cls, kwargs: Dict[str, Any]) -> Dict[str, Any]:
@@ -201,6 +215,11 @@ class SignatureModel(ArbitraryBaseModel):
             BaseSystemException: If validation error occurs.
             EncoderException: If encoder error occurs.
         """
+        if cls.converters is not None:
+            values = convert_values(cls.converters, kwargs)
+            if values is not None:
+                return values
+
         try:
             if cls.encoders:
                 kwargs = cls.parse_encoders(kwargs)
@@ -278,40 +297,46 @@ class SignatureModel(ArbitraryBaseModel):
             detailed error message and categorized errors.
         """
 
-        def categorize_errors(errors: list) -> tuple:
-            """
-            Categorizes errors into server errors and client errors.
-
-            Args:
-                errors (list): List of errors to categorize.
-
-            Returns:
-                tuple: Two lists containing server errors and client errors respectively.
-            """
-            server_errors = []
-            client_errors = []
-            for err in errors:
-                if is_server_error(err, cls):
-                    server_errors.append(err)
-                else:
-                    client_errors.append(err)
-            return server_errors, client_errors
-
         try:
-            error_list = loads(exception.json())
-            server_errors, client_errors = categorize_errors(error_list)
-
-            method, url = get_connection_info(connection)
-            error_message = f"Validation failed for {url} with method {method}."
-
-            if client_errors:
-                return ValidationErrorException(detail=error_message, extra=client_errors)
-            return InternalServerError(detail=error_message, extra=server_errors)
+            return cls.build_validation_exception(connection, loads(exception.json()))
         except Exception as e:
             # Handle any unexpected errors here
             # Return the original exception if unable to construct the expected exceptions
             return e
 
+    @classmethod
+    def build_validation_exception(
+        cls, connection: Union[Request, WebSocket], errors: List[Dict[str, Any]]
+    ) -> Union["InternalServerError", "ValidationErrorException"]:
+        """
+        Constructs a system exception from a list of validation errors, categorizing them
+        as server or client errors.
+
+        The errors of the dependencies are server errors, the others client errors.
+
+        Args:
+            connection (Union[Request, WebSocket]): The connection object where the error occurred.
+            errors (List[Dict[str, Any]]): The validation errors, in the format of the Pydantic
+                errors.
+
+        Returns:
+            Union[InternalServerError, ValidationErrorException]: The constructed exception.
+        """
+        server_errors = []
+        client_errors = []
+        for err in errors:
+            if is_server_error(err, cls):
+                server_errors.append(err)
+            else:
+                client_errors.append(err)
+
+        method, url = get_connection_info(connection)
+        error_message = f"Validation failed for {url} with method {method}."
+
+        if client_errors:
+            return ValidationErrorException(detail=error_message, extra=client_errors)
+        return InternalServerError(detail=error_message, extra=server_errors)
+
     def field_value(self, key: str) -> Any:
         return self.__getattribute__(key)
 
@@ -515,14 +540,16 @@ class SignatureFactory(ArbitraryExtraBaseModel):
         Returns:
             Any: The encoder found, or None if no encoder matches.
         """
-        origin = get_origin(annotation)
+        if not get_origin(annotation):
+            return encoder_cache.get_for_annotation(annotation)
+
+        # The first registered encoder of any of the arguments.
+        matches = {
+            id(encoder_cache.get_for_annotation(arg)) for arg in self.extract_arguments(annotation)
+        }
         for encoder in ENCODER_TYPES:
-            if not origin and encoder.is_type(annotation):
+            if id(encoder) in matches:
                 return encoder
-            elif origin:
-                arguments = self.extract_arguments(annotation)
-                if any(encoder.is_type(arg) for arg in arguments):
-                    return encoder
         return None
 
     def _process_parameters(self) -> None:
@@ -556,4 +583,33 @@ class SignatureFactory(ArbitraryExtraBaseModel):
         model.return_annotation = self.signature.return_annotation
         model.dependency_names = self.dependency_names
         model.encoders = encoders  # type: ignore
+        if not encoders:
+            model.converters = compile_converters(model.model_fields)
+
+        for name in (DATA, PAYLOAD):
+            if name in model.model_fields:
+                encoder = encoders.get(name, {}).get("encoder")
+                model.body_decoder = get_field_body_decoder(model.model_fields[name], encoder)
         return model
+
+
+_dependency_signatures: "weakref.WeakKeyDictionary[Any, Dict[FrozenSet[str], Type[SignatureModel]]]" = weakref.WeakKeyDictionary()
+
+
+def get_dependency_signature(fn: Any, dependency_names: Set[str]) -> Type[SignatureModel]:
+    """
+    Returns the signature model of a dependency.
+
+    The same dependency is usually declared by many handlers, each with its own
+    `Inject`, which is why the signature models are shared for the same dependency
+    names instead of being built for every `Inject`.
+    """
+    names = frozenset(dependency_names)
+    try:
+        models = _dependency_signatures.setdefault(fn, {})
+    except TypeError:
+        return SignatureFactory(fn=fn, dependency_names=set(names)).create_signature()
+
+    if names not in models:
+        models[names] = SignatureFactory(fn=fn, dependency_names=set(names)).create_signature()
+    return models[names]
@@ -1,6 +1,9 @@
+from functools import partial
 from typing import (
     TYPE_CHECKING,
     Any,
+    Awaitable,
+    Callable,
     Dict,
     List,
     Mapping,
@@ -14,7 +17,9 @@ from typing import (
     get_origin,
 )
 
+import anyio
 from lilya.datastructures import URL
+from pydantic import PrivateAttr
 from pydantic.fields import FieldInfo
 
 from esmerald.enums import ParamType, ScopeType
@@ -24,7 +29,7 @@ from esmerald.parsers import ArbitraryExtraBaseModel, HashableBaseModel
 from esmerald.requests import Request
 from esmerald.typing import Undefined
 from esmerald.utils.constants import REQUIRED
-from esmerald.utils.helpers import is_class_and_subclass, is_union
+from esmerald.utils.helpers import is_async_callable, is_class_and_subclass, is_union
 from esmerald.utils.schema import should_skip_json_schema
 
 if TYPE_CHECKING:  # pragma: no cover
@@ -43,6 +48,8 @@ class ParamSetting(NamedTuple):
 
 
 class Dependency(HashableBaseModel, ArbitraryExtraBaseModel):
+    _is_async: bool = PrivateAttr(default=False)
+
     def __init__(
         self, key: str, inject: "Inject", dependencies: List["Dependency"], **kwargs: Any
     ) -> None:
@@ -50,6 +57,92 @@ class Dependency(HashableBaseModel, ArbitraryExtraBaseModel):
         self.key = key
         self.inject = inject
         self.dependencies = dependencies
+        self._is_async = is_async_callable(getattr(inject, "dependency", inject)) or any(
+            dependency.is_async for dependency in dependencies
+        )
+
+    @property
+    def is_async(self) -> bool:
+        """
+        If resolving the dependency, or any of its own dependencies, awaits.
+        """
+        return self._is_async
+
+    @property
+    def is_concurrent(self) -> bool:
+        """
+        If the dependency can be resolved concurrently with its siblings.
+        """
+        return (
+            self._is_async and not self.is_singleton and getattr(self.inject, "concurrent", True)
+        )
+
+    @property
+    def is_singleton(self) -> bool:
+        """
+        If the dependency is built once, when the application starts.
+        """
+        return getattr(self.inject, "singleton", False)
+
+    @property
+    def use_request_cache(self) -> bool:
+        """
+        If the value of the dependency is shared by all its dependants during a request.
+        """
+        return getattr(self.inject, "request_cache", True)
+
+
+class DependencyCache:
+    """
+    The values of the dependencies resolved during a single request.
+
+    A dependency shared by several dependants is resolved once per request, even when
+    the dependants are resolved concurrently, in which case the late ones wait for the
+    value of the first.
+    """
+
+    __slots__ = ("values", "errors", "pending")
+
+    def __init__(self) -> None:
+        self.values: Dict[str, Any] = {}
+        self.errors: Dict[str, Exception] = {}
+        self.pending: Dict[str, anyio.Event] = {}
+
+    async def resolve(self, key: str, resolver: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        Returns the value of the dependency `key`, calling the `resolver` only if the
+        dependency was not resolved yet.
+
+        Args:
+            key (str): The key of the dependency.
+            resolver (Callable[[], Awaitable[Any]]): Resolves the value of the dependency.
+
+        Returns:
+            Any: The value of the dependency.
+        """
+        while key not in self.values:
+            if key in self.errors:
+                raise self.errors[key]
+
+            event = self.pending.get(key)
+            if event is None:
+                break
+            await event.wait()
+        else:
+            return self.values[key]
+
+        event = self.pending[key] = anyio.Event()
+        try:
+            value = await resolver()
+        except Exception as exc:
+            self.errors[key] = exc
+            raise
+        finally:
+            del self.pending[key]
+            event.set()
+
+        self.values[key] = value
+        return value
 
 
 def _merge_difference_parameters(difference: Set[ParamSetting]) -> Set[ParamSetting]:
@@ -165,22 +258,101 @@ def create_parameter_setting(
     return param_settings
 
 
-def _get_missing_required_params(params: Any, expected: Set[ParamSetting]) -> List[str]:
+def _get_values(params: Mapping[Union[int, str], Any]) -> Any:
+    return params.values()
+
+
+def _get_dict(params: Mapping[Union[int, str], Any]) -> Any:
+    return dict(params.items()) if params else None
+
+
+def _get_value(alias: str, default: Any, params: Mapping[Union[int, str], Any]) -> Any:
+    return params.get(alias, default)
+
+
+def _collects(annotation: Any, types: Tuple[type, ...]) -> bool:
+    """
+    If the annotation, or any of the arguments of a union, is one of the given types.
+    """
+    if is_union(annotation):
+        return any(is_class_and_subclass(argument, types) for argument in get_args(annotation))
+    return is_class_and_subclass(get_origin(annotation) or annotation, types)
+
+
+def compile_param_extractor(param: ParamSetting) -> Callable[[Any], Any]:
     """
-    Get missing required parameters.
+    Returns the callable extracting the value of the parameter from the request
+    parameters.
+
+    Args:
+        param (ParamSetting): The parameter setting.
+
+    Returns:
+        Callable[[Any], Any]: Receives the request parameters and returns the value.
+    """
+    annotation = param.field_info.annotation
+    if _collects(annotation, (list, tuple)):
+        return _get_values
+    if _collects(annotation, (dict,)):
+        return _get_dict
+    return partial(_get_value, param.field_alias, param.default_value)
+
+
+class RequestParamsPlan(NamedTuple):
+    """
+    The extraction of a set of parameters compiled once, when the transformer model
+    is created.
+
+    Args:
+        required (Tuple[str, ...]): The aliases of the required parameters.
+        extractors (Tuple[Tuple[str, Callable[[Any], Any]], ...]): The field name and the
+            extractor of each parameter.
+    """
+
+    required: Tuple[str, ...]
+    extractors: Tuple[Tuple[str, Callable[[Any], Any]], ...]
+
+
+def compile_request_params(expected: Set[ParamSetting]) -> RequestParamsPlan:
+    """
+    Compiles the extraction of the expected parameters.
 
     Args:
-        params (Any): Request parameters.
         expected (Set[ParamSetting]): Set of expected parameters.
 
     Returns:
-        List[str]: List of missing required parameters.
+        RequestParamsPlan: The compiled extraction.
     """
-    missing_params = []
-    for param in expected:
-        if param.is_required and param.field_alias not in params:
-            missing_params.append(param.field_alias)
-    return missing_params
+    return RequestParamsPlan(
+        required=tuple(param.field_alias for param in expected if param.is_required),
+        extractors=tuple((param.field_name, compile_param_extractor(param)) for param in expected),
+    )
+
+
+def extract_request_params(
+    params: Mapping[Union[int, str], Any], plan: RequestParamsPlan, url: URL
+) -> Dict[str, Any]:
+    """
+    Gather the parameters from the request using a compiled plan.
+
+    Args:
+        params (Any): Request parameters.
+        plan (RequestParamsPlan): The compiled extraction of the expected parameters.
+        url (URL): The URL.
+
+    Returns:
+        Dict[str, Any]: The gathered parameters.
+
+    Raises:
+        ValidationErrorException: If required parameters are missing.
+    """
+    if plan.required:
+        missing_params = [alias for alias in plan.required if alias not in params]
+        if missing_params:
+            raise ValidationErrorException(
+                f"Missing required parameter(s) {', '.join(missing_params)} for URL {url}."
+            )
+    return {name: extract(params) for name, extract in plan.extractors}
 
 
 def get_request_params(
@@ -189,6 +361,9 @@ def get_request_params(
     """
     Gather the parameters from the request.
 
+    Compiles the extraction on every call, prefer `compile_request_params` and
+    `extract_request_params` when the expected parameters are known in advance.
+
     Args:
         params (Any): Request parameters.
         expected (Set[ParamSetting]): Set of expected parameters.
@@ -200,33 +375,7 @@ def get_request_params(
     Raises:
         ValidationErrorException: If required parameters are missing.
     """
-    missing_params = _get_missing_required_params(params, expected)
-    if missing_params:
-        raise ValidationErrorException(
-            f"Missing required parameter(s) {', '.join(missing_params)} for URL {url}."
-        )
-
-    values: Dict[Any, Any] = {}
-    for param in expected:
-        if not is_union(param.field_info.annotation):
-            annotation = get_origin(param.field_info.annotation)
-            origin = annotation or param.field_info.annotation
-
-            if is_class_and_subclass(origin, (list, tuple)):
-                values[param.field_name] = params.values()
-            elif is_class_and_subclass(origin, dict):
-                values[param.field_name] = dict(params.items()) if params else None
-            else:
-                values[param.field_name] = params.get(param.field_alias, param.default_value)
-        elif is_union(param.field_info.annotation):
-            arguments = get_args(param.field_info.annotation)
-            if any(is_class_and_subclass(origin, (list, tuple)) for origin in arguments):
-                values[param.field_name] = params.values()
-            elif any(is_class_and_subclass(origin, dict) for origin in arguments):
-                values[param.field_name] = dict(params.items()) if params else None
-            else:
-                values[param.field_name] = params.get(param.field_alias, param.default_value)
-    return values
+    return extract_request_params(params, compile_request_params(expected), url)
 
 
 def get_connection_info(connection: "ConnectionType") -> Tuple[str, "URL"]:
@@ -22,3 +22,15 @@ class AsyncCallable(Generic[P, T]):
 
     async def __call__(self, *args: P.args, **kwargs: P.kwargs) -> T:
         return await self.fn(*args, **kwargs)
+
+
+def unwrap_exception_group(exc: BaseException) -> BaseException:
+    """
+    Returns the first exception raised inside a task group.
+
+    The task groups raise the exceptions of their tasks wrapped in an exception group
+    but the exception handlers of the application expect the original exception.
+    """
+    while isinstance(getattr(exc, "exceptions", None), (list, tuple)) and exc.exceptions:  # type: ignore[attr-defined]
+        exc = exc.exceptions[0]  # type: ignore[attr-defined]
+    return exc
@@ -0,0 +1,177 @@
+from typing import Dict, List
+
+import anyio
+import pytest
+
+from esmerald import CachePolicy, Factory, Gateway, ImproperlyConfigured, Inject, Injects, get
+from esmerald.core.di.cache import ProviderCache
+from esmerald.testclient import create_client
+
+pytestmark = pytest.mark.anyio
+
+
+class Provider:
+    def __init__(self, delay: float = 0) -> None:
+        self.calls: List[Dict[str, int]] = []
+        self.delay = delay
+
+    async def __call__(self, **kwargs: int) -> int:
+        self.calls.append(kwargs)
+        await anyio.sleep(self.delay)
+        return len(self.calls)
+
+
+def test_policy_validation() -> None:
+    with pytest.raises(ImproperlyConfigured):
+        CachePolicy(ttl=0)
+
+    with pytest.raises(ImproperlyConfigured):
+        CachePolicy(maxsize=0)
+
+    with pytest.raises(ImproperlyConfigured):
+        CachePolicy(stale_while_revalidate=10)
+
+
+async def test_values_expire_after_the_ttl() -> None:
+    provider = Provider()
+    inject = Inject(provider, cache=CachePolicy(ttl=0.05))
+
+    assert await inject() == 1
+    assert await inject() == 1
+
+    await anyio.sleep(0.06)
+
+    assert await inject() == 2
+    assert inject.cache_info().hits == 1
+    assert inject.cache_info().misses == 2
+
+
+async def test_expired_values_are_purged() -> None:
+    provider = Provider()
+    inject = Inject(provider, cache=CachePolicy(ttl=0.05))
+
+    for value in range(10):
+        await inject(value=value)
+
+    assert inject.cache_info().currsize == 10
+
+    await anyio.sleep(0.06)
+    await inject(value=10)
+
+    assert inject.cache_info().currsize == 1
+
+
+async def test_lru_keyed_by_the_arguments() -> None:
+    provider = Provider()
+    inject = Inject(provider, cache=CachePolicy(maxsize=2))
+
+    assert await inject(value=1) == 1
+    assert await inject(value=2) == 2
+    assert await inject(value=1) == 1
+    assert await inject(value=3) == 3
+
+    # value=2 was the least recently used and got evicted.
+    assert await inject(value=2) == 4
+    assert inject.cache_info().currsize == 2
+
+
+async def test_concurrent_misses_call_the_provider_once() -> None:
+    provider = Provider(delay=0.05)
+    inject = Inject(provider, cache=CachePolicy(ttl=10))
+    values: List[int] = []
+
+    async def resolve() -> None:
+        values.append(await inject(value=1))
+
+    async with anyio.create_task_group() as group:
+        for _ in range(5):
+            group.start_soon(resolve)
+
+    assert values == [1] * 5
+    assert len(provider.calls) == 1
+    assert inject.cache_info().misses == 1
+    assert inject.cache_info().hits == 4
+
+
+async def test_concurrent_misses_share_the_error() -> None:
+    calls = 0
+
+    async def failing() -> None:
+        nonlocal calls
+        calls += 1
+        await anyio.sleep(0.01)
+        raise ValueError("unavailable")
+
+    cache = ProviderCache(CachePolicy(ttl=10))
+    errors: List[Exception] = []
+
+    async def resolve() -> None:
+        try:
+            await cache.get({}, failing)
+        except ValueError as exc:
+            errors.append(exc)
+
+    async with anyio.create_task_group() as group:
+        group.start_soon(resolve)
+        group.start_soon(resolve)
+
+    assert calls == 1
+    assert len(errors) == 2
+
+
+@pytest.mark.parametrize("anyio_backend", ["asyncio"])
+async def test_stale_values_are_revalidated_in_the_background() -> None:
+    provider = Provider(delay=0.02)
+    inject = Inject(provider, cache=CachePolicy(ttl=0.05, stale_while_revalidate=10))
+
+    assert await inject() == 1
+
+    await anyio.sleep(0.06)
+
+    assert await inject() == 1
+    assert inject.cache_info().stale_hits == 1
+
+    await anyio.sleep(0.05)
+
+    assert await inject() == 2
+    assert len(provider.calls) == 2
+
+
+async def test_stale_values_are_revalidated_inline_outside_asyncio(anyio_backend) -> None:
+    provider = Provider()
+    inject = Inject(provider, cache=CachePolicy(ttl=0.05, stale_while_revalidate=10))
+
+    assert await inject() == 1
+
+    await anyio.sleep(0.06)
+
+    expected = 1 if anyio_backend == "asyncio" else 2
+    assert await inject() == expected
+
+
+async def test_factory_cache() -> None:
+    provider = Provider()
+    factory = Factory(provider, cache=CachePolicy(ttl=10))
+
+    assert await factory() == 1
+    assert await factory() == 1
+    assert factory.cache_info().hits == 1
+
+
+def test_cached_dependency_across_requests() -> None:
+    provider = Provider()
+
+    async def get_jwks() -> int:
+        return await provider()
+
+    jwks = Inject(get_jwks, cache=CachePolicy(ttl=10))
+
+    @get("/", dependencies={"jwks": jwks})
+    async def home(jwks: int = Injects()) -> int:
+        return jwks
+
+    with create_client(routes=[Gateway(handler=home)]) as client:
+        assert client.get("/").json() == 1
+        assert client.get("/").json() == 1
+
+    assert jwks.cache_info().hits == 1
@@ -0,0 +1,103 @@
+import time
+from typing import Any, List
+
+import anyio
+from lilya.status import HTTP_200_OK, HTTP_401_UNAUTHORIZED
+
+from esmerald import Gateway, Inject, Injects, get
+from esmerald.exceptions import NotAuthorized
+from esmerald.testclient import create_client
+
+DELAY = 0.2
+
+
+async def first() -> str:
+    await anyio.sleep(DELAY)
+    return "first"
+
+
+async def second() -> str:
+    await anyio.sleep(DELAY)
+    return "second"
+
+
+async def unauthorized() -> None:
+    await anyio.sleep(0)
+    raise NotAuthorized()
+
+
+def test_independent_dependencies_are_resolved_concurrently() -> None:
+    @get("/", dependencies={"first": Inject(first), "second": Inject(second)})
+    async def home(first: str = Injects(), second: str = Injects()) -> List[str]:
+        return [first, second]
+
+    with create_client(routes=[Gateway(handler=home)]) as client:
+        start = time.perf_counter()
+        response = client.get("/")
+        elapsed = time.perf_counter() - start
+
+        assert response.status_code == HTTP_200_OK
+        assert response.json() == ["first", "second"]
+        assert elapsed < DELAY * 1.75
+
+
+def test_dependencies_opting_out_are_resolved_sequentially() -> None:
+    calls: List[str] = []
+
+    def tracked(name: str) -> Any:
+        async def dependency() -> str:
+            calls.append(f"start-{name}")
+            await anyio.sleep(DELAY / 4)
+            calls.append(f"end-{name}")
+            return name
+
+        return dependency
+
+    one, two = tracked("one"), tracked("two")
+
+    @get(
+        "/",
+        dependencies={
+            "one": Inject(one, concurrent=False),
+            "two": Inject(two, concurrent=False),
+        },
+    )
+    async def home(one: str = Injects(), two: str = Injects()) -> List[str]:
+        return [one, two]
+
+    with create_client(routes=[Gateway(handler=home)]) as client:
+        response = client.get("/")
+
+        assert response.json() == ["one", "two"]
+        assert calls[1].startswith("end-")
+        assert calls[3].startswith("end-")
+
+
+def test_nested_dependencies_are_resolved_before_their_dependant() -> None:
+    async def combined(first: str, second: str) -> str:
+        return f"{first}-{second}"
+
+    @get(
+        "/",
+        dependencies={
+            "first": Inject(first),
+            "second": Inject(second),
+            "combined": Inject(combined),
+        },
+    )
+    async def home(combined: str = Injects()) -> str:
+        return combined
+
+    with create_client(routes=[Gateway(handler=home)]) as client:
+        assert client.get("/").json() == "first-second"
+
+
+def test_exceptions_of_concurrent_dependencies_are_not_wrapped() -> None:
+    @get("/", dependencies={"first": Inject(first), "denied": Inject(unauthorized)})
+    async def home(first: str = Injects(), denied: None = Injects()) -> str:
+        return first
+
+    with create_client(routes=[Gateway(handler=home)]) as client:
+        response = client.get("/")
+
+        assert response.status_code == HTTP_401_UNAUTHORIZED
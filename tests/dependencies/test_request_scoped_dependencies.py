@@ -0,0 +1,94 @@
+from typing import List
+
+import anyio
+
+from esmerald import Gateway, Inject, Injects, get
+from esmerald.testclient import create_client
+
+
+class Connection:
+    checkouts = 0
+
+    def __init__(self) -> None:
+        Connection.checkouts += 1
+        self.id = Connection.checkouts
+
+
+async def get_db() -> Connection:
+    await anyio.sleep(0.01)
+    return Connection()
+
+
+async def user_repo(db: Connection) -> int:
+    return db.id
+
+
+async def audit_repo(db: Connection) -> int:
+    await anyio.sleep(0.01)
+    return db.id
+
+
+def sync_repo(db: Connection) -> int:
+    return db.id
+
+
+def test_shared_dependency_is_resolved_once_per_request() -> None:
+    Connection.checkouts = 0
+
+    @get(
+        "/",
+        dependencies={
+            "db": Inject(get_db),
+            "user_repo": Inject(user_repo),
+            "audit_repo": Inject(audit_repo),
+            "sync_repo": Inject(sync_repo),
+        },
+    )
+    async def home(
+        user_repo: int = Injects(), audit_repo: int = Injects(), sync_repo: int = Injects()
+    ) -> List[int]:
+        return [user_repo, audit_repo, sync_repo]
+
+    with create_client(routes=[Gateway(handler=home)]) as client:
+        assert client.get("/").json() == [1, 1, 1]
+        assert client.get("/").json() == [2, 2, 2]
+
+    assert Connection.checkouts == 2
+
+
+def test_dependency_opting_out_is_resolved_for_every_dependant() -> None:
+    Connection.checkouts = 0
+
+    @get(
+        "/",
+        dependencies={
+            "db": Inject(get_db, request_cache=False),
+            "user_repo": Inject(user_repo),
+            "audit_repo": Inject(audit_repo),
+        },
+    )
+    async def home(user_repo: int = Injects(), audit_repo: int = Injects()) -> List[int]:
+        return sorted([user_repo, audit_repo])
+
+    with create_client(routes=[Gateway(handler=home)]) as client:
+        assert client.get("/").json() == [1, 2]
+
+    assert Connection.checkouts == 2
+
+
+def test_shared_subtrees_are_collapsed() -> None:
+    @get(
+        "/",
+        dependencies={
+            "db": Inject(get_db),
+            "user_repo": Inject(user_repo),
+            "audit_repo": Inject(audit_repo),
+        },
+    )
+    async def home(user_repo: int = Injects(), audit_repo: int = Injects()) -> None: ...
+
+    with create_client(routes=[Gateway(handler=home)]):
+        audit, user = sorted(home.transformer.dependencies, key=lambda dependency: dependency.key)
+
+        assert audit.key == "audit_repo"
+        assert audit.dependencies[0] is user.dependencies[0]
@@ -0,0 +1,122 @@
+import time
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, List
+
+import anyio
+import pytest
+
+from esmerald import (
+    Esmerald,
+    Factory,
+    Gateway,
+    ImproperlyConfigured,
+    Include,
+    Inject,
+    Injects,
+    get,
+)
+from esmerald.testclient import EsmeraldTestClient, create_client
+
+events: List[str] = []
+
+
+class Pool:
+    built = 0
+
+    def __init__(self) -> None:
+        Pool.built += 1
+        self.id = Pool.built
+
+
+@asynccontextmanager
+async def http_pool() -> AsyncIterator[Pool]:
+    events.append("open")
+    yield Pool()
+    events.append("close")
+
+
+async def slow_model() -> str:
+    await anyio.sleep(0.2)
+    return "model"
+
+
+async def slow_engine() -> str:
+    await anyio.sleep(0.2)
+    return "engine"
+
+
+@pytest.fixture(autouse=True)
+def reset() -> None:
+    events.clear()
+    Pool.built = 0
+
+
+def test_singletons_are_built_on_startup_and_closed_on_shutdown() -> None:
+    pool = Inject(http_pool, singleton=True)
+
+    @get("/", dependencies={"pool": pool})
+    async def home(pool: Pool = Injects()) -> int:
+        return pool.id
+
+    with create_client(
+        routes=[Include("/api", routes=[Gateway(handler=home)])],
+        on_startup=[lambda: events.append("startup")],
+        on_shutdown=[lambda: events.append("shutdown")],
+    ) as client:
+        assert events == ["open", "startup"]
+        assert client.get("/api").json() == 1
+        assert client.get("/api").json() == 1
+
+    assert events == ["open", "startup", "shutdown", "close"]
+    assert Pool.built == 1
+
+
+def test_singletons_are_built_concurrently() -> None:
+    @get(
+        "/",
+        dependencies={
+            "model": Inject(slow_model, singleton=True),
+            "engine": Inject(Factory(slow_engine, singleton=True)),
+        },
+    )
+    async def home(model: str = Injects(), engine: str = Injects()) -> List[str]:
+        return [model, engine]
+
+    app = Esmerald(routes=[Gateway(handler=home)])
+    client = EsmeraldTestClient(app)
+
+    start = time.perf_counter()
+    with client:
+        elapsed = time.perf_counter() - start
+
+        assert client.get("/").json() == ["model", "engine"]
+
+    assert elapsed < 0.35
+
+
+def test_singletons_are_built_on_first_injection_without_lifespan() -> None:
+    pool = Inject(http_pool, singleton=True)
+
+    @get("/", dependencies={"pool": pool})
+    async def home(pool: Pool = Injects()) -> int:
+        return pool.id
+
+    client = create_client(routes=[Gateway(handler=home)])
+
+    assert client.get("/").json() == 1
+    assert client.get("/").json() == 1
+    assert Pool.built == 1
+
+
+def test_singletons_cannot_take_arguments() -> None:
+    def get_client(settings: str) -> str:
+        return settings
+
+    with pytest.raises(ImproperlyConfigured):
+        Inject(get_client, singleton=True)
+
+    with pytest.raises(ImproperlyConfigured):
+        Inject(lambda pool=None: pool, singleton=True)
+
+    assert Inject(Pool, singleton=True).singleton
+    assert Inject(get_client).singleton is False
@@ -0,0 +1,87 @@
+from collections import deque
+from datetime import date
+from typing import Any, List
+
+import pytest
+from pydantic import BaseModel
+
+from esmerald import Esmerald
+from esmerald.encoders import (
+    ENCODER_TYPES,
+    Encoder,
+    PydanticEncoder,
+    encoder_cache,
+    is_body_encoder,
+    json_encoder,
+    register_esmerald_encoder,
+)
+
+
+class User(BaseModel):
+    name: str
+
+
+class Point:
+    def __init__(self, x: int, y: int) -> None:
+        self.x = x
+        self.y = y
+
+
+class PointEncoder(Encoder):
+    checked: List[Any] = []
+
+    def is_type(self, value: Any) -> bool:
+        self.checked.append(value)
+        return isinstance(value, Point) or value is Point
+
+    def serialize(self, obj: Point) -> Any:
+        return [obj.x, obj.y]
+
+    def encode(self, annotation: Any, value: Any) -> Any:
+        return Point(*value)
+
+
+class DatePointEncoder(PointEncoder):
+    def serialize(self, obj: Point) -> Any:
+        return date(2024, obj.x, obj.y).isoformat()
+
+
+@pytest.fixture(autouse=True)
+def registry(monkeypatch) -> deque:
+    registry = deque(ENCODER_TYPES)
+    monkeypatch.setattr("lilya._internal._encoders.ENCODER_TYPES", registry)
+    monkeypatch.setattr("esmerald.encoders.ENCODER_TYPES", registry)
+    monkeypatch.setattr(PointEncoder, "checked", [])
+    register_esmerald_encoder(PydanticEncoder)
+    return registry
+
+
+def test_encoders_are_looked_up_once_per_type() -> None:
+    register_esmerald_encoder(PointEncoder)
+
+    assert json_encoder(Point(1, 2)) == [1, 2]
+    assert json_encoder(Point(3, 4)) == [3, 4]
+    assert json_encoder(User(name="esmerald")) == {"name": "esmerald"}
+    assert json_encoder(User(name="lilya")) == {"name": "lilya"}
+
+    assert len(PointEncoder.checked) == 2
+    assert is_body_encoder(Point)
+    assert is_body_encoder(Point)
+    assert len(PointEncoder.checked) == 3
+
+    with pytest.raises(ValueError):
+        json_encoder(object())
+
+
+def test_registering_an_encoder_clears_the_cache(registry) -> None:
+    register_esmerald_encoder(PointEncoder)
+
+    assert json_encoder(Point(1, 2)) == [1, 2]
+
+    Esmerald().register_encoder(DatePointEncoder)
+
+    assert json_encoder(Point(1, 2)) == "2024-01-02"
+
+    registry.remove(encoder_cache.get(Point(1, 2)))
+
+    assert json_encoder(Point(1, 2)) == [1, 2]
@@ -0,0 +1,130 @@
+from collections import deque
+from datetime import datetime
+from enum import Enum
+from typing import Any, Dict, List, Optional
+
+import msgspec
+import pytest
+from orjson import OPT_OMIT_MICROSECONDS, OPT_SERIALIZE_NUMPY, dumps
+from pydantic import BaseModel
+
+from esmerald import Gateway, get
+from esmerald.encoders import (
+    MsgSpecEncoder,
+    PydanticEncoder,
+    encode_json,
+    get_json_encoder,
+    is_json_native_model,
+    register_esmerald_encoder,
+)
+from esmerald.responses import Response
+from esmerald.testclient import create_client
+
+
+class Status(str, Enum):
+    ACTIVE = "active"
+
+
+class Tag(BaseModel):
+    name: str
+    weight: float
+
+
+class User(BaseModel):
+    name: str
+    status: Status
+    tags: List[Tag]
+    extra: Dict[str, Optional[int]] = {}
+
+
+class Event(BaseModel):
+    name: str
+    created_at: datetime
+
+
+class Item(msgspec.Struct):
+    name: str
+    price: float
+
+
+@pytest.fixture(autouse=True)
+def esmerald_encoders() -> None:
+    register_esmerald_encoder(PydanticEncoder)
+    register_esmerald_encoder(MsgSpecEncoder)
+
+
+def serialize(content: Any) -> bytes:
+    return dumps(
+        content, default=Response.transform, option=OPT_SERIALIZE_NUMPY | OPT_OMIT_MICROSECONDS
+    )
+
+
+def test_models_are_serialized_straight_into_bytes() -> None:
+    user = User(name="esmerald", status=Status.ACTIVE, tags=[Tag(name="a", weight=1)])
+    item = Item(name="item", price=1.5)
+
+    assert is_json_native_model(User)
+    assert encode_json(user) == serialize(user)
+    assert encode_json([user, user]) == serialize([user, user])
+    assert encode_json(item) == b'{"name":"item","price":1.5}'
+    assert encode_json([item]) == b'[{"name":"item","price":1.5}]'
+
+
+def test_contents_serialized_by_the_json_encoder() -> None:
+    event = Event(name="event", created_at=datetime(2024, 1, 1, 12, 0, 0, 123456))
+
+    assert not is_json_native_model(Event)
+    assert encode_json(event) is None
+    assert encode_json([event]) is None
+    assert encode_json({"name": "esmerald"}) is None
+    assert encode_json([]) is None
+
+
+def test_encoders_overriding_serialize_keep_serializing(monkeypatch) -> None:
+    class DumpByAlias(PydanticEncoder):
+        def serialize(self, obj: BaseModel) -> Dict[str, Any]:
+            return obj.model_dump(by_alias=True)
+
+    class MsgSpecBuiltins(MsgSpecEncoder):
+        def serialize(self, obj: Any) -> Any:
+            return msgspec.to_builtins(obj)
+
+        def serialize_json(self, obj: Any) -> Optional[bytes]:
+            return msgspec.json.encode(obj)
+
+    user = User(name="esmerald", status=Status.ACTIVE, tags=[])
+    item = Item(name="item", price=1.5)
+
+    assert isinstance(get_json_encoder(user), PydanticEncoder)
+
+    monkeypatch.setattr(
+        "esmerald.encoders.ENCODER_TYPES", deque([DumpByAlias(), MsgSpecBuiltins()])
+    )
+
+    assert get_json_encoder(user) is None
+    assert encode_json(user) is None
+    assert isinstance(get_json_encoder(item), MsgSpecBuiltins)
+
+
+def test_response_of_models() -> None:
+    @get("/users")
+    async def users() -> List[User]:
+        return [User(name="esmerald", status=Status.ACTIVE, tags=[Tag(name="a", weight=2)])]
+
+    @get("/event")
+    async def event() -> Event:
+        return Event(name="event", created_at=datetime(2024, 1, 1, 12, 0, 0, 123456))
+
+    with create_client(routes=[Gateway(handler=users), Gateway(handler=event)]) as client:
+        assert client.get("/users").json() == [
+            {
+                "name": "esmerald",
+                "status": "active",
+                "tags": [{"name": "a", "weight": 2.0}],
+                "extra": {},
+            }
+        ]
+        assert client.get("/event").json() == {
+            "name": "event",
+            "created_at": "2024-01-01T12:00:00",
+        }
@@ -0,0 +1,99 @@
+from freezegun import freeze_time
+from lilya.responses import Response as LilyaResponse
+
+from esmerald import Gateway, Response, get
+from esmerald.datastructures import Cookie, ResponseHeader
+from esmerald.testclient import create_client
+
+response_headers = {"x-route": ResponseHeader(value="route")}
+response_cookies = [Cookie(key="route", value="cookie"), Cookie(key="shared", value="route")]
+
+
+@get(response_headers=response_headers, response_cookies=response_cookies)
+async def default(size: int) -> str:
+    return "x" * size
+
+
+@get(response_headers=response_headers, response_cookies=response_cookies)
+async def esmerald_response() -> Response:
+    return Response(
+        "esmerald",
+        headers={"x-route": "handler"},
+        cookies=[Cookie(key="shared", value="handler")],
+    )
+
+
+@get(response_headers=response_headers, response_cookies=response_cookies)
+async def lilya_response() -> LilyaResponse:
+    response = LilyaResponse("lilya")
+    response.headers.add("x-multi", "one")
+    response.headers.add("x-multi", "two")
+    return response
+
+
+def test_default_handler_headers_are_rendered():
+    with create_client(routes=[Gateway("/default", handler=default)]) as client:
+        response = client.get("/default?size=1")
+
+        assert response.headers["x-route"] == "route"
+        assert response.headers["content-length"] == "3"
+        assert sorted(response.headers.get_list("set-cookie")) == [
+            "route=cookie; Path=/; SameSite=lax",
+            "shared=route; Path=/; SameSite=lax",
+        ]
+
+        response = client.get("/default?size=5")
+
+        assert response.headers["content-length"] == "7"
+        assert response.json() == "xxxxx"
+
+
+def test_handler_cookies_and_headers_take_precedence():
+    with create_client(routes=[Gateway("/esmerald", handler=esmerald_response)]) as client:
+        response = client.get("/esmerald")
+
+        assert response.headers["x-route"] == "handler"
+        assert response.headers.get_list("set-cookie") == [
+            "shared=handler; Path=/; SameSite=lax",
+            "route=cookie; Path=/; SameSite=lax",
+        ]
+
+
+def test_lilya_response_keeps_multiple_header_values():
+    with create_client(routes=[Gateway("/lilya", handler=lilya_response)]) as client:
+        response = client.get("/lilya")
+
+        assert response.headers.get_list("x-multi") == ["one", "two"]
+        assert response.headers["x-route"] == "route"
+        assert response.headers["allow"] == str({"GET"})
+
+
+def test_route_cookies_are_rendered_once(monkeypatch):
+    with create_client(routes=[Gateway("/default", handler=default)]) as client:
+        client.get("/default?size=1")
+
+        def model_dump(*args, **kwargs):
+            raise AssertionError("Cookie.model_dump was called on the hot path")
+
+        monkeypatch.setattr(Cookie, "model_dump", model_dump)
+
+        response = client.get("/default?size=2")
+
+        assert response.status_code == 200
+        assert len(response.headers.get_list("set-cookie")) == 2
+
+
+def test_route_cookies_expiring_are_rendered_per_response():
+    @get(response_cookies=[Cookie(key="session", value="v", expires=1), *response_cookies])
+    async def expiring() -> str:
+        return "expiring"
+
+    with freeze_time("2024-01-01 12:00:00") as frozen:
+        with create_client(routes=[Gateway("/expiring", handler=expiring)]) as client:
+            first = client.get("/expiring").headers.get_list("set-cookie")
+            frozen.tick(2)
+            second = client.get("/expiring").headers.get_list("set-cookie")
+
+    assert "session=v; expires=Mon, 01 Jan 2024 12:00:01 GMT; Path=/; SameSite=lax" in first
+    assert "session=v; expires=Mon, 01 Jan 2024 12:00:03 GMT; Path=/; SameSite=lax" in second
+    assert "route=cookie; Path=/; SameSite=lax" in second
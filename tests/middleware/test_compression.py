@@ -0,0 +1,142 @@
+import gzip
+from typing import AsyncIterator, Dict, List
+
+import pytest
+from lilya.middleware import DefineMiddleware
+
+from esmerald import Esmerald, Gateway, get
+from esmerald.datastructures import Stream
+from esmerald.exceptions import ImproperlyConfigured
+from esmerald.middleware import CompressionMiddleware
+from esmerald.responses import Response
+from esmerald.testclient import EsmeraldTestClient, create_client
+
+brotli = pytest.importorskip("brotli")
+
+ITEMS = [f"item-{number}" for number in range(200)]
+
+
+@get("/items")
+async def items() -> List[str]:
+    return ITEMS
+
+
+@get("/small")
+async def small() -> Dict[str, str]:
+    return {"name": "esmerald"}
+
+
+@get("/reports/items")
+async def report_items() -> List[str]:
+    return ITEMS
+
+
+@get("/versioned")
+async def versioned() -> Response:
+    return Response(ITEMS, headers={"etag": '"v1"', "vary": "authorization"})
+
+
+@get("/stream")
+async def stream() -> Stream:
+    async def chunks() -> AsyncIterator[bytes]:
+        for number in range(5):
+            yield f"chunk-{number}\n".encode()
+
+    return Stream(iterator=chunks(), media_type="text/plain")
+
+
+routes = [
+    Gateway(handler=items),
+    Gateway(handler=small),
+    Gateway(handler=report_items),
+    Gateway(handler=versioned),
+    Gateway(handler=stream),
+]
+
+
+def test_content_negotiation() -> None:
+    with create_client(
+        routes=routes, middleware=[DefineMiddleware(CompressionMiddleware)]
+    ) as client:
+        response = client.get("/items", headers={"accept-encoding": "gzip, br"})
+
+        assert response.headers["content-encoding"] == "br"
+        assert response.headers["vary"] == "Accept-Encoding"
+        assert response.json() == ITEMS
+
+        response = client.get("/items", headers={"accept-encoding": "br;q=0.5, gzip"})
+
+        assert response.headers["content-encoding"] == "gzip"
+        assert response.json() == ITEMS
+
+        response = client.get("/items", headers={"accept-encoding": "gzip;q=0, identity"})
+
+        assert "content-encoding" not in response.headers
+        assert response.json() == ITEMS
+
+        response = client.get("/small", headers={"accept-encoding": "gzip"})
+
+        assert "content-encoding" not in response.headers
+        assert response.json() == {"name": "esmerald"}
+
+        response = client.get("/versioned", headers={"accept-encoding": "gzip"})
+
+        assert response.headers["etag"] == 'W/"v1"'
+        assert response.headers["vary"] == "authorization, Accept-Encoding"
+
+
+def test_minimum_size_per_path_and_streams() -> None:
+    middleware = DefineMiddleware(
+        CompressionMiddleware, encodings=["gzip"], minimum_sizes={"/reports": 100_000}
+    )
+
+    with create_client(routes=routes, middleware=[middleware]) as client:
+        response = client.get("/reports/items", headers={"accept-encoding": "gzip, br"})
+
+        assert "content-encoding" not in response.headers
+
+        response = client.get("/stream", headers={"accept-encoding": "gzip, br"})
+
+        assert response.headers["content-encoding"] == "gzip"
+        assert "content-length" not in response.headers
+        assert response.text == "".join(f"chunk-{number}\n" for number in range(5))
+
+
+def test_resources_sharing_an_etag_are_not_mixed_up() -> None:
+    @get("/docs/{id}")
+    async def document(id: int) -> Response:
+        return Response([f"document-{id}"] * 100, headers={"etag": '"1"'})
+
+    with create_client(
+        routes=[Gateway(handler=document)], middleware=[DefineMiddleware(CompressionMiddleware)]
+    ) as client:
+        for id in (1, 2, 1):
+            response = client.get(f"/docs/{id}", headers={"accept-encoding": "gzip"})
+
+            assert response.headers["content-encoding"] == "gzip"
+            assert response.json() == [f"document-{id}"] * 100
+
+
+def test_compressed_bodies_are_cached() -> None:
+    app = CompressionMiddleware(
+        Esmerald(routes=routes), encodings=["gzip"], levels={"gzip": [(0, 9)]}, cache_size=1
+    )
+
+    with EsmeraldTestClient(app) as client:
+        client.get("/items", headers={"accept-encoding": "gzip"})
+
+        compressed = next(iter(app.cache.values()))
+
+        assert gzip.decompress(compressed).startswith(b'["item-0"')
+        assert client.get("/items", headers={"accept-encoding": "gzip"}).json() == ITEMS
+        assert len(app.cache) == 1
+
+        client.get("/versioned", headers={"accept-encoding": "gzip"})
+
+        assert list(app.cache.values()) == [compressed]
+
+    assert app.get_level("gzip", 10) == 9
+    assert CompressionMiddleware(app).get_level("br") == 1
+
+    with pytest.raises(ImproperlyConfigured):
+        CompressionMiddleware(app, encodings=["deflate"])
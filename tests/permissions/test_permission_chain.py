@@ -0,0 +1,166 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING
+
+from lilya.status import HTTP_200_OK, HTTP_403_FORBIDDEN
+from lilya.types import Receive, Scope, Send
+
+from esmerald import EsmeraldInterceptor
+from esmerald.permissions import AllowAny, BasePermission, DenyAll
+from esmerald.permissions.chain import PermissionChain
+from esmerald.requests import Request
+from esmerald.routing.gateways import Gateway
+from esmerald.routing.handlers import get
+from esmerald.routing.router import Include
+from esmerald.testclient import create_client, override_settings
+
+if TYPE_CHECKING:
+    from esmerald.types import APIGateHandler  # pragma: no cover
+
+executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="permissions")
+
+
+class CountedPermission(BasePermission):
+    instances = 0
+    threads: list = []
+
+    def __init__(self) -> None:
+        CountedPermission.instances += 1
+
+    def has_permission(self, request: "Request", apiview: "APIGateHandler") -> bool:
+        CountedPermission.threads.append(threading.current_thread().name)
+        return True
+
+
+class HeaderPermission(BasePermission):
+    message = "Missing header."
+
+    async def has_permission(self, request: "Request", apiview: "APIGateHandler") -> bool:
+        return bool(request.headers.get("allow"))
+
+
+class CountedInterceptor(EsmeraldInterceptor):
+    instances = 0
+
+    def __init__(self) -> None:
+        CountedInterceptor.instances += 1
+
+    async def intercept(self, scope: "Scope", receive: "Receive", send: "Send") -> None:
+        scope["path_params"]["name"] = "intercepted"
+
+
+def reset_counters() -> None:
+    CountedPermission.instances = 0
+    CountedPermission.threads = []
+    CountedInterceptor.instances = 0
+
+
+@override_settings(singleton_permissions=True)
+def test_permissions_and_interceptors_are_instantiated_once() -> None:
+    reset_counters()
+
+    @get("/{name}")
+    async def home(name: str) -> str:
+        return name
+
+    with create_client(
+        routes=[
+            Include(
+                "/api",
+                routes=[
+                    Gateway(
+                        handler=home,
+                        permissions=[CountedPermission],
+                        interceptors=[CountedInterceptor],
+                    )
+                ],
+            )
+        ]
+    ) as client:
+        for _ in range(3):
+            response = client.get("/api/esmerald")
+
+            assert response.status_code == HTTP_200_OK
+            assert response.json() == "intercepted"
+
+    assert CountedPermission.instances == 1
+    assert CountedInterceptor.instances == 1
+    assert isinstance(home.dispatch_plan.permission_chain, PermissionChain)
+
+
+@override_settings(singleton_permissions=True)
+def test_permission_chain_denies_with_message() -> None:
+    @get("/secret", permissions=[AllowAny, HeaderPermission])
+    async def secret() -> str:
+        return "secret"
+
+    with create_client(routes=[Gateway(handler=secret)]) as client:
+        response = client.get("/secret")
+
+        assert response.status_code == HTTP_403_FORBIDDEN
+        assert response.json()["detail"] == "Missing header."
+
+        response = client.get("/secret", headers={"allow": "yes"})
+
+        assert response.status_code == HTTP_200_OK
+
+
+@override_settings(singleton_permissions=True)
+def test_permission_chain_operators() -> None:
+    @get("/and", permissions=[AllowAny & HeaderPermission])
+    async def with_and() -> str:
+        return "and"
+
+    @get("/or", permissions=[DenyAll | HeaderPermission])
+    async def with_or() -> str:
+        return "or"
+
+    @get("/not", permissions=[~HeaderPermission])
+    async def with_not() -> str:
+        return "not"
+
+    with create_client(
+        routes=[Gateway(handler=with_and), Gateway(handler=with_or), Gateway(handler=with_not)]
+    ) as client:
+        assert client.get("/and").status_code == HTTP_403_FORBIDDEN
+        assert client.get("/and", headers={"allow": "yes"}).status_code == HTTP_200_OK
+        assert client.get("/or").status_code == HTTP_403_FORBIDDEN
+        assert client.get("/or", headers={"allow": "yes"}).status_code == HTTP_200_OK
+        assert client.get("/not").status_code == HTTP_200_OK
+        assert client.get("/not", headers={"allow": "yes"}).status_code == HTTP_403_FORBIDDEN
+
+
+@override_settings(singleton_permissions=True)
+def test_sync_permissions_run_inline() -> None:
+    reset_counters()
+
+    @get("/home", permissions=[CountedPermission])
+    async def home() -> str:
+        return threading.current_thread().name
+
+    with create_client(routes=[Gateway(handler=home)]) as client:
+        response = client.get("/home")
+
+    assert CountedPermission.threads == [response.json()]
+
+
+@override_settings(singleton_permissions=True)
+def test_sync_permissions_run_on_the_executor(monkeypatch) -> None:
+    reset_counters()
+
+    from esmerald.conf.global_settings import EsmeraldAPISettings
+
+    monkeypatch.setattr(
+        EsmeraldAPISettings, "permissions_executor", property(lambda self: executor)
+    )
+
+    @get("/home", permissions=[~~CountedPermission])
+    async def home() -> str:
+        return "home"
+
+    with create_client(routes=[Gateway(handler=home)]) as client:
+        response = client.get("/home")
+
+        assert response.status_code == HTTP_200_OK
+
+    assert CountedPermission.threads[0].startswith("permissions")
@@ -0,0 +1,92 @@
+from typing import Any, Dict, List
+
+import anyio
+import httpx
+import pytest
+
+from esmerald import Coalesce, Esmerald, Gateway, get
+from esmerald.exceptions import ImproperlyConfigured, ServiceUnavailable
+
+pytestmark = pytest.mark.anyio
+
+
+async def fetch_all(app: Esmerald, urls: List[str]) -> List[httpx.Response]:
+    responses: List[Any] = [None] * len(urls)
+    transport = httpx.ASGITransport(app=app)
+
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+
+        async def fetch(index: int, url: str) -> None:
+            responses[index] = await client.get(url)
+
+        async with anyio.create_task_group() as group:
+            for index, url in enumerate(urls):
+                group.start_soon(fetch, index, url)
+    return responses
+
+
+async def test_identical_requests_share_the_response() -> None:
+    calls: List[int] = []
+
+    @get("/reports", coalesce=Coalesce(query_params=["year"]))
+    async def reports(year: int) -> Dict[str, int]:
+        calls.append(year)
+        await anyio.sleep(0.05)
+        return {"year": year, "call": len(calls)}
+
+    app = Esmerald(routes=[Gateway(handler=reports)])
+    responses = await fetch_all(
+        app, ["/reports?year=2024"] * 10 + ["/reports?year=2024&page=2", "/reports?year=2023"]
+    )
+
+    assert sorted(calls) == [2023, 2024]
+    assert {response.status_code for response in responses} == {200}
+    assert len({response.content for response in responses[:11]}) == 1
+    assert responses[0].headers["content-type"] == "application/json"
+
+    await fetch_all(app, ["/reports?year=2024"] * 2)
+
+    assert len(calls) == 3
+
+
+async def test_waiters_cap_and_timeout() -> None:
+    calls: List[str] = []
+
+    @get("/capped", coalesce=Coalesce(max_waiters=2))
+    async def capped() -> str:
+        calls.append("capped")
+        await anyio.sleep(0.05)
+        return "capped"
+
+    @get("/slow")
+    async def slow() -> str:
+        calls.append("slow")
+        await anyio.sleep(0.2)
+        return "slow"
+
+    app = Esmerald(
+        routes=[Gateway(handler=capped), Gateway(handler=slow, coalesce=Coalesce(timeout=0.01))]
+    )
+    await fetch_all(app, ["/capped"] * 5 + ["/slow"] * 3)
+
+    assert calls.count("capped") == 3
+    assert calls.count("slow") == 3
+
+
+async def test_waiters_get_the_error() -> None:
+    calls: List[str] = []
+
+    @get("/down", coalesce=Coalesce())
+    async def down() -> str:
+        calls.append("down")
+        await anyio.sleep(0.05)
+        raise ServiceUnavailable()
+
+    app = Esmerald(routes=[Gateway(handler=down)])
+    responses = await fetch_all(app, ["/down"] * 5)
+
+    assert calls == ["down"]
+    assert {response.status_code for response in responses} == {503}
+
+    with pytest.raises(ImproperlyConfigured):
+        Coalesce(max_waiters=0)
@@ -0,0 +1,121 @@
+from datetime import datetime, timezone
+from typing import Dict, List
+
+from lilya.status import HTTP_200_OK, HTTP_304_NOT_MODIFIED
+
+from esmerald import Conditional, Esmerald, Gateway, Inject, Injects, Request, ResponseCache, get
+from esmerald.responses import Response
+from esmerald.testclient import EsmeraldTestClient, create_client
+
+
+def test_etag_of_the_rendered_body() -> None:
+    @get("/items")
+    async def items() -> List[str]:
+        return ["a", "b"]
+
+    @get("/versioned")
+    async def versioned() -> Response:
+        return Response(["a"], headers={"etag": '"v1"'})
+
+    app = Esmerald(
+        routes=[Gateway(handler=items), Gateway(handler=versioned)], conditional=Conditional()
+    )
+
+    with EsmeraldTestClient(app) as client:
+        response = client.get("/items")
+        etag = response.headers["etag"]
+
+        assert response.status_code == HTTP_200_OK
+        assert etag.startswith('"')
+
+        response = client.get("/items", headers={"if-none-match": f'"other", {etag}'})
+
+        assert response.status_code == HTTP_304_NOT_MODIFIED
+        assert response.content == b""
+        assert response.headers["etag"] == etag
+
+        response = client.get("/items", headers={"if-none-match": '"other"'})
+
+        assert response.status_code == HTTP_200_OK
+        assert response.json() == ["a", "b"]
+
+        assert client.get("/versioned").headers["etag"] == '"v1"'
+        assert client.get("/versioned", headers={"if-none-match": 'W/"v1"'}).status_code == 304
+
+
+def test_conditional_is_opt_in() -> None:
+    @get("/items")
+    async def items() -> List[str]:
+        return ["a"]
+
+    with create_client(routes=[Gateway(handler=items)]) as client:
+        assert "etag" not in client.get("/items").headers
+
+
+def test_providers_short_circuit_the_handler() -> None:
+    calls: List[str] = []
+    modified = datetime(2024, 1, 1, 12, 0, 0, tzinfo=timezone.utc)
+
+    def get_version(request: Request) -> str:
+        return f"document-{request.path_params['id']}-3"
+
+    async def get_modified(request: Request) -> datetime:
+        return modified
+
+    def get_user() -> str:
+        calls.append("dependency")
+        return "user"
+
+    @get(
+        "/documents/{id}",
+        conditional=Conditional(etag=get_version, last_modified=get_modified, weak=True),
+        dependencies={"user": Inject(get_user)},
+    )
+    async def document(id: int, user: str = Injects()) -> Dict[str, int]:
+        calls.append("handler")
+        return {"id": id}
+
+    with create_client(routes=[Gateway(handler=document)]) as client:
+        response = client.get("/documents/1")
+
+        assert response.json() == {"id": 1}
+        assert response.headers["etag"] == 'W/"document-1-3"'
+        assert response.headers["last-modified"] == "Mon, 01 Jan 2024 12:00:00 GMT"
+        assert calls == ["dependency", "handler"]
+
+        response = client.get("/documents/1", headers={"if-none-match": 'W/"document-1-3"'})
+
+        assert response.status_code == HTTP_304_NOT_MODIFIED
+
+        response = client.get(
+            "/documents/1", headers={"if-modified-since": "Mon, 01 Jan 2024 13:00:00 GMT"}
+        )
+
+        assert response.status_code == HTTP_304_NOT_MODIFIED
+        assert calls == ["dependency", "handler"]
+
+        response = client.get(
+            "/documents/1", headers={"if-modified-since": "Mon, 01 Jan 2024 11:00:00 GMT"}
+        )
+
+        assert response.status_code == HTTP_200_OK
+        assert client.get("/documents/2", headers={"if-none-match": '"document-1-3"'}).json() == {
+            "id": 2
+        }
+        assert len(calls) == 6
+
+
+def test_cached_responses_are_conditional() -> None:
+    calls: List[str] = []
+
+    @get("/catalog", cache=ResponseCache(), conditional=Conditional())
+    async def catalog() -> List[str]:
+        calls.append("handler")
+        return ["a"]
+
+    with create_client(routes=[Gateway(handler=catalog)]) as client:
+        etag = client.get("/catalog").headers["etag"]
+
+        assert client.get("/catalog").headers["etag"] == etag
+        assert client.get("/catalog", headers={"if-none-match": etag}).status_code == 304
+        assert calls == ["handler"]
@@ -0,0 +1,127 @@
+from lilya.websockets import WebSocket
+
+from esmerald import APIView, Gateway, Include, WebSocketGateway, get, websocket
+from esmerald.permissions import AllowAny, DenyAll
+from esmerald.routing.base import Dispatcher, DispatchPlan
+from esmerald.testclient import create_client
+
+
+@get(permissions=[AllowAny])
+async def allowed() -> str:
+    return "allowed"
+
+
+@get()
+async def denied() -> str:
+    return "denied"
+
+
+@get()
+def sync_handler() -> str:
+    return "sync"
+
+
+@websocket()
+async def socket_handler(socket: WebSocket) -> None:
+    await socket.accept()
+    await socket.send_json({"data": "socket"})
+    await socket.close()
+
+
+class ItemView(APIView):
+    @get("/item")
+    async def item(self) -> str:
+        return self.__class__.__name__
+
+
+def test_dispatch_plan_resolves_the_parent_levels():
+    with create_client(
+        routes=[
+            Include(
+                "/api",
+                routes=[
+                    Include(
+                        "/nested",
+                        routes=[Gateway("/denied", handler=denied, permissions=[DenyAll])],
+                    )
+                ],
+            ),
+            Gateway("/allowed", handler=allowed),
+        ]
+    ) as client:
+        assert client.get("/api/nested/denied").status_code == 403
+        assert client.get("/allowed").json() == "allowed"
+
+        plan = denied.dispatch_plan
+
+        assert isinstance(plan, DispatchPlan)
+        assert len(plan.permissions) == 1
+        assert plan.methods == frozenset({"GET"})
+        assert plan.is_async
+
+
+def test_handlers_are_frozen_on_startup():
+    @get()
+    async def home() -> str:
+        return "home"
+
+    with create_client(routes=[Include("/api", routes=[Gateway("/home", handler=home)])]):
+        assert home._dispatch_plan is not None
+
+
+def test_dispatch_does_not_walk_the_parent_levels(monkeypatch):
+    with create_client(
+        routes=[
+            Gateway("/allowed", handler=allowed),
+            Gateway("/sync", handler=sync_handler),
+            Gateway("/view", handler=ItemView),
+            WebSocketGateway("/ws", handler=socket_handler),
+        ]
+    ) as client:
+
+        def parent_levels(self):
+            raise AssertionError("parent_levels was called on the hot path")
+
+        monkeypatch.setattr(Dispatcher, "parent_levels", property(parent_levels))
+
+        assert client.get("/allowed").json() == "allowed"
+        assert client.get("/sync").json() == "sync"
+        assert client.get("/view/item").json() == "ItemView"
+
+        with client.websocket_connect("/ws") as ws:
+            assert ws.receive_json() == {"data": "socket"}
+
+
+def test_method_not_allowed_with_dispatch_plan():
+    with create_client(routes=[Gateway("/allowed", handler=allowed)]) as client:
+        response = client.post("/allowed")
+
+        assert response.status_code == 405
+
+
+def test_dispatch_plan_is_compiled_again_for_a_new_parent():
+    @get()
+    async def home() -> str:
+        return "home"
+
+    gateway = Gateway("/home", handler=home)
+    home.parent = gateway
+    plan = home.freeze()
+
+    assert home.dispatch_plan is plan
+
+    home.parent = Gateway("/other", handler=home)
+
+    assert home.dispatch_plan is not plan
+
+
+def test_dispatch_plans_do_not_share_their_headers_and_cookies():
+    with create_client(
+        routes=[Gateway(handler=allowed), WebSocketGateway(handler=socket_handler)]
+    ):
+        plans = [allowed.dispatch_plan, socket_handler.dispatch_plan]
+
+    assert DispatchPlan._field_defaults["response_headers"] is None
+    assert DispatchPlan._field_defaults["response_cookies"] is None
+    assert plans[0].response_headers is not plans[1].response_headers
+    assert plans[0].response_cookies is not plans[1].response_cookies
@@ -0,0 +1,85 @@
+from typing import Any, Dict, List
+
+from pydantic import BaseModel
+
+from esmerald import Esmerald, Gateway, get, post
+from esmerald.encoders import estimate_json_size
+from esmerald.executors import get_json_offload_metrics
+from esmerald.testclient import EsmeraldTestClient, create_client
+
+
+class Item(BaseModel):
+    name: str
+    tags: List[str]
+
+
+def test_estimate_json_size() -> None:
+    items = [Item(name="item", tags=["a", "b"]) for _ in range(100)]
+
+    assert estimate_json_size("esmerald") == 10
+    assert estimate_json_size([]) == 2
+    assert estimate_json_size({"a": 1}) == 13
+    assert estimate_json_size(items) > 100 * len('{"name":"item"}')
+
+
+def test_large_payloads_are_offloaded() -> None:
+    @post("/items")
+    async def create_items(data: List[Dict[str, Any]]) -> Dict[str, int]:
+        return {"count": len(data)}
+
+    @post("/item")
+    async def create_item(data: Item) -> Dict[str, str]:
+        return {"name": data.name}
+
+    @get("/items")
+    async def items(count: int) -> List[Item]:
+        return [Item(name=f"item{number}", tags=["a", "b"]) for number in range(count)]
+
+    routes = [
+        Gateway(handler=create_items),
+        Gateway(handler=create_item),
+        Gateway(handler=items),
+    ]
+
+    app = Esmerald(routes=routes, json_offload_threshold=1024)
+
+    with EsmeraldTestClient(app) as client:
+        before = get_json_offload_metrics()
+
+        response = client.post("/items", json=[{"name": "item"}] * 500)
+
+        assert response.json() == {"count": 500}
+
+        after = get_json_offload_metrics()
+
+        assert after.offloaded == before.offloaded + 1
+        assert after.inline == before.inline + 1
+
+        response = client.post("/item", json={"name": "item", "tags": ["a"] * 500})
+
+        assert response.json() == {"name": "item"}
+        assert get_json_offload_metrics().offloaded == after.offloaded + 1
+
+        before = get_json_offload_metrics()
+
+        assert len(client.get("/items?count=1").json()) == 1
+        assert len(client.get("/items?count=500").json()) == 500
+
+        after = get_json_offload_metrics()
+
+        assert after.offloaded == before.offloaded + 1
+        assert after.inline > before.inline
+        assert after.executor.name == "json"
+        assert 0 < after.ratio < 1
+
+
+def test_offload_is_disabled_by_default() -> None:
+    @post("/items")
+    async def create_items(data: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        return data
+
+    with create_client(routes=[Gateway(handler=create_items)]) as client:
+        before = get_json_offload_metrics()
+
+        assert len(client.post("/items", json=[{"name": "item"}] * 500).json()) == 500
+        assert get_json_offload_metrics()[:2] == before[:2]
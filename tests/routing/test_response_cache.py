@@ -0,0 +1,206 @@
+import time
+from typing import Dict, List
+
+import anyio
+import pytest
+
+from esmerald import (
+    APIView,
+    Esmerald,
+    Gateway,
+    Include,
+    Inject,
+    Injects,
+    ResponseCache,
+    get,
+    route,
+)
+from esmerald.exceptions import ImproperlyConfigured
+from esmerald.responses import Response
+from esmerald.responses.cache import (
+    CacheBackend,
+    CachedResponse,
+    FileCacheBackend,
+    MemoryCacheBackend,
+)
+from esmerald.testclient import EsmeraldTestClient, create_client
+
+
+def test_cached_responses_skip_the_dependencies_and_the_handler() -> None:
+    calls: List[str] = []
+    cache = ResponseCache(query_params=["page"], vary=["accept-language"])
+
+    def get_language() -> str:
+        calls.append("dependency")
+        return "en"
+
+    @get("/catalog", cache=cache, dependencies={"language": Inject(get_language)})
+    async def catalog(page: int = 1, language: str = Injects()) -> Dict[str, int]:
+        calls.append("handler")
+        return {"page": page}
+
+    with create_client(routes=[Gateway(handler=catalog)]) as client:
+        response = client.get("/catalog?page=1")
+
+        assert response.json() == {"page": 1}
+        assert response.headers["vary"] == "accept-language"
+        assert calls == ["dependency", "handler"]
+
+        response = client.get("/catalog?utm_source=mail&page=1")
+
+        assert response.json() == {"page": 1}
+        assert response.headers["content-type"] == "application/json"
+        assert calls == ["dependency", "handler"]
+
+        assert client.get("/catalog?page=2").json() == {"page": 2}
+        assert client.get("/catalog?page=1", headers={"accept-language": "pt"}).status_code == 200
+        assert len(calls) == 6
+
+        anyio.run(cache.invalidate, "/catalog")
+
+        assert client.get("/catalog?page=1").json() == {"page": 1}
+        assert len(calls) == 8
+
+
+def test_only_cacheable_responses_are_stored() -> None:
+    calls: List[str] = []
+    cache = ResponseCache()
+
+    @get("/cookie", cache=cache)
+    async def cookie() -> Response:
+        calls.append("cookie")
+        response = Response("cookie")
+        response.set_cookie("session", "value")
+        return response
+
+    @get("/private", cache=cache)
+    async def private() -> Response:
+        calls.append("private")
+        return Response("private", headers={"cache-control": "private"})
+
+    @route("/items", methods=["POST"], cache=cache)
+    async def create_item() -> str:
+        calls.append("post")
+        return "created"
+
+    routes = [Gateway(handler=cookie), Gateway(handler=private), Gateway(handler=create_item)]
+
+    with create_client(routes=routes) as client:
+        for _ in range(2):
+            client.get("/cookie")
+            client.get("/private")
+            client.post("/items")
+
+    assert len(calls) == 6
+
+
+def test_cache_levels() -> None:
+    calls: List[str] = []
+
+    @get("/include")
+    async def include() -> str:
+        calls.append("include")
+        return "include"
+
+    @get("/handler", cache=ResponseCache(ttl=0.05))
+    async def handler() -> str:
+        calls.append("handler")
+        return "handler"
+
+    class CatalogView(APIView):
+        cache = ResponseCache()
+
+        @get("/view")
+        async def view(self) -> str:
+            calls.append("view")
+            return "view"
+
+    app = Esmerald(
+        routes=[
+            Include(
+                "/api",
+                routes=[Gateway(handler=include), Gateway(handler=handler)],
+                cache=ResponseCache(),
+            ),
+            Gateway(handler=CatalogView),
+        ]
+    )
+
+    with EsmeraldTestClient(app) as client:
+        for _ in range(2):
+            assert client.get("/api/include").json() == "include"
+            assert client.get("/view").json() == "view"
+            assert client.get("/api/handler").json() == "handler"
+
+        time.sleep(0.1)
+        client.get("/api/handler")
+
+    assert calls.count("include") == calls.count("view") == 1
+    assert calls.count("handler") == 2
+
+
+@pytest.mark.anyio
+async def test_memory_backend_evicts_the_least_recently_used() -> None:
+    backend = MemoryCacheBackend(maxsize=2)
+    response = CachedResponse(200, (), b"")
+
+    await backend.set("/a", "GET", response, None)
+    await backend.set("/b", "GET", response, None)
+    await backend.get("/a", "GET")
+    await backend.set("/c", "GET", response, None)
+
+    assert await backend.get("/a", "GET") == response
+    assert await backend.get("/b", "GET") is None
+
+    with pytest.raises(ImproperlyConfigured):
+        ResponseCache(maxsize=1, backend=backend)
+
+
+def test_file_backend(tmp_path) -> None:
+    calls: List[str] = []
+
+    def build_app() -> Esmerald:
+        @get("/config", cache=ResponseCache(ttl=60, backend=FileCacheBackend(str(tmp_path), 2)))
+        async def config(name: str) -> Dict[str, str]:
+            calls.append(name)
+            return {"name": name}
+
+        return Esmerald(routes=[Gateway(handler=config)])
+
+    with EsmeraldTestClient(build_app()) as client:
+        assert client.get("/config?name=a").json() == {"name": "a"}
+        assert client.get("/config?name=a").json() == {"name": "a"}
+
+    # Shared by the processes of the application.
+    with EsmeraldTestClient(build_app()) as client:
+        response = client.get("/config?name=a")
+
+        assert response.json() == {"name": "a"}
+        assert response.headers["content-length"] == str(len(response.content))
+        assert calls == ["a"]
+
+        client.get("/config?name=b")
+        client.get("/config?name=c")
+        client.get("/config?name=a")
+
+    assert calls == ["a", "b", "c", "a"]
+
+
+@pytest.mark.anyio
+async def test_file_backend_concurrent_stores(tmp_path) -> None:
+    backend = FileCacheBackend(str(tmp_path), maxsize=20)
+
+    async with anyio.create_task_group() as group:
+        for number in range(50):
+            response = CachedResponse(200, (), str(number % 5).encode() * 10_000)
+            group.start_soon(backend.set, f"/items/{number % 25}", "GET", response, None)
+
+    stored = [await backend.get(f"/items/{number}", "GET") for number in range(25)]
+    bodies = [response.body for response in stored if response is not None]
+
+    assert 18 <= len(bodies) <= 20
+    assert all(len(set(body)) == 1 for body in bodies)
+    assert not list(tmp_path.glob("*/*.tmp"))
+
+    with pytest.raises(TypeError):
+        CacheBackend()
@@ -0,0 +1,153 @@
+from datetime import datetime
+from typing import Dict, List, Optional
+
+import msgspec
+from lilya.status import HTTP_200_OK, HTTP_500_INTERNAL_SERVER_ERROR
+from pydantic import BaseModel
+
+from esmerald import Gateway, get
+from esmerald.responses.serializers import compile_response_serializer
+from esmerald.testclient import create_client, override_settings
+
+
+class Tag(BaseModel):
+    name: str
+    weight: float
+
+
+class SpecialTag(Tag):
+    special: bool = True
+
+
+class Event(BaseModel):
+    name: str
+    created_at: datetime
+
+
+class Item(msgspec.Struct):
+    name: str
+    price: float
+
+
+class Native:
+    name = "native"
+
+
+def test_serializers_of_the_return_annotations() -> None:
+    tags = compile_response_serializer(List[Tag])
+    items = compile_response_serializer(Dict[str, Item])
+
+    assert tags([Tag(name="a", weight=1)]) == b'[{"name":"a","weight":1.0}]'
+    assert tags([SpecialTag(name="a", weight=1)]) is None
+    assert tags({"name": "a"}) is None
+    assert items({"a": Item(name="item", price=1.5)}) == b'{"a":{"name":"item","price":1.5}}'
+    assert items({"a": {"name": "item"}}) is None
+
+    assert compile_response_serializer(Optional[Tag]) is not None
+    assert compile_response_serializer(Event) is None
+    assert compile_response_serializer(List[int]) is None
+    assert compile_response_serializer(None) is None
+
+
+def test_responses_of_the_return_annotations() -> None:
+    @get("/tags")
+    async def tags() -> List[Tag]:
+        return [Tag(name="a", weight=1), SpecialTag(name="b", weight=2)]
+
+    @get("/items")
+    async def items() -> List[Item]:
+        return [Item(name="item", price=1.5)]
+
+    @get("/events")
+    async def events() -> List[Event]:
+        return [Event(name="event", created_at=datetime(2024, 1, 1, 12, 0, 0, 123456))]
+
+    @get("/mismatch")
+    async def mismatch() -> List[Tag]:
+        return [{"name": "a", "weight": "heavy"}]
+
+    routes = [
+        Gateway(handler=tags),
+        Gateway(handler=items),
+        Gateway(handler=events),
+        Gateway(handler=mismatch),
+    ]
+
+    with create_client(routes=routes) as client:
+        assert client.get("/tags").json() == [
+            {"name": "a", "weight": 1.0},
+            {"name": "b", "weight": 2.0, "special": True},
+        ]
+        assert client.get("/items").json() == [{"name": "item", "price": 1.5}]
+        assert client.get("/events").json() == [
+            {"name": "event", "created_at": "2024-01-01T12:00:00"}
+        ]
+        assert client.get("/mismatch").json() == [{"name": "a", "weight": "heavy"}]
+
+
+def test_strict_responses() -> None:
+    @get("/tags")
+    async def tags() -> List[Tag]:
+        return [Tag(name="a", weight=1)]
+
+    @get("/items")
+    async def items() -> List[Item]:
+        return [{"name": "item"}]
+
+    @get("/mismatch")
+    async def mismatch() -> Dict[str, int]:
+        return {"value": "a"}
+
+    routes = [Gateway(handler=tags), Gateway(handler=items), Gateway(handler=mismatch)]
+
+    with override_settings(strict_responses=True):
+        with create_client(routes=routes) as client:
+            response = client.get("/tags")
+
+            assert response.status_code == HTTP_200_OK
+            assert response.json() == [{"name": "a", "weight": 1.0}]
+
+            response = client.get("/items")
+
+            assert response.status_code == HTTP_500_INTERNAL_SERVER_ERROR
+
+            response = client.get("/mismatch")
+
+            assert response.status_code == HTTP_500_INTERNAL_SERVER_ERROR
+            assert response.json()["detail"] == (
+                "The response does not match the return annotation."
+            )
+
+
+def test_strict_responses_of_contents_not_json_serializable() -> None:
+    @get("/native")
+    async def native() -> Tag:
+        return Native()
+
+    @get("/dates")
+    async def dates() -> Dict[str, int]:
+        return {"value": datetime(2024, 1, 1)}
+
+    routes = [Gateway(handler=native), Gateway(handler=dates)]
+
+    with override_settings(strict_responses=True):
+        with create_client(routes=routes) as client:
+            response = client.get("/native")
+
+            assert response.status_code == HTTP_500_INTERNAL_SERVER_ERROR
+            assert response.json() == {
+                "detail": "The response does not match the return annotation.",
+                "extra": [
+                    {
+                        "type": "model_type",
+                        "loc": [],
+                        "msg": "Input should be a valid dictionary or instance of Tag",
+                        "ctx": {"class_name": "Tag"},
+                    }
+                ],
+            }
+
+            response = client.get("/dates")
+
+            assert response.status_code == HTTP_500_INTERNAL_SERVER_ERROR
+            assert [error["type"] for error in response.json()["extra"]] == ["int_type"]
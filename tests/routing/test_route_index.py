@@ -0,0 +1,154 @@
+from uuid import UUID
+
+from lilya.enums import Match
+
+from esmerald import Esmerald, Gateway, Include, Request, get
+from esmerald.routing._index import IndexedRouter, RouteIndex
+from esmerald.testclient import create_client
+
+
+def make_handler(name: str):
+    @get()
+    async def handler(request: Request) -> str:
+        return name
+
+    handler.fn.__name__ = name
+    return handler
+
+
+@get()
+async def user(user_id: int) -> str:
+    return f"user {user_id}"
+
+
+@get()
+async def user_by_uuid(uid: UUID) -> str:
+    return f"uuid {uid}"
+
+
+@get()
+async def user_by_name(name: str) -> str:
+    return f"name {name}"
+
+
+@get()
+async def file_handler(name: str) -> str:
+    return f"file {name}"
+
+
+@get()
+async def catch_all(rest: str) -> str:
+    return f"rest {rest}"
+
+
+def linear_candidates(routes, scope):
+    return [route for route in routes if route.search(scope)[0] != Match.NONE]
+
+
+def index_candidates(index, scope):
+    return [
+        route for route in index.candidates(scope["path"]) if route.search(scope)[0] != Match.NONE
+    ]
+
+
+def get_routes():
+    return [
+        Gateway("/users/me", handler=make_handler("me")),
+        Gateway("/users/{user_id:int}", handler=user),
+        Gateway("/users/{uid:uuid}", handler=user_by_uuid),
+        Gateway("/users/{name}", handler=user_by_name),
+        Gateway("/files/{name}.txt", handler=file_handler),
+        Include(
+            "/api",
+            routes=[
+                Gateway(f"/items-{number}", handler=make_handler(f"item{number}"))
+                for number in range(50)
+            ],
+        ),
+        Gateway("/static/{rest:path}", handler=catch_all),
+    ]
+
+
+def test_index_matches_linear_scan():
+    routes = get_routes()
+    index = RouteIndex(routes)
+
+    paths = [
+        "/users/me",
+        "/users/1",
+        "/users/8a2a3e2c-7a6e-4a3b-9f7a-3c1a6ce0b0f2",
+        "/users/john",
+        "/users/john/",
+        "/files/readme.txt",
+        "/files/readme.md",
+        "/api/items-10",
+        "/api/",
+        "/api",
+        "/static/css/main.css",
+        "/static/",
+        "/",
+        "/unknown/path",
+    ]
+    for path in paths:
+        scope = {"type": "http", "path": path, "method": "GET", "root_path": ""}
+        assert index_candidates(index, scope) == linear_candidates(routes, scope), path
+
+
+def test_index_keeps_declaration_order():
+    routes = get_routes()
+    index = RouteIndex(routes)
+
+    candidates = index.candidates("/users/me")
+
+    assert candidates[0] is routes[0]
+    assert routes[3] in candidates
+
+
+def test_static_paths_use_the_hash_table():
+    routes = get_routes()
+    index = RouteIndex(routes)
+
+    assert "/users/me" in index.static
+    assert "/users/{user_id}" not in index.static
+
+
+def test_exotic_patterns_fallback_to_regex():
+    routes = get_routes()
+    index = RouteIndex(routes)
+
+    assert index.fallback == [4]
+
+
+def test_index_is_rebuilt_when_routes_change():
+    app = Esmerald(routes=[Gateway("/one", handler=make_handler("one"))])
+    index = app.router.route_index
+
+    app.add_route("/two", handler=make_handler("two"))
+
+    assert app.router.route_index is not index
+    assert len(app.router.route_index.static) == 2
+
+
+def test_include_uses_indexed_router():
+    include = Include("/api", routes=[Gateway("/one", handler=make_handler("one"))])
+
+    assert isinstance(include.__base_app__, IndexedRouter)
+
+
+def test_requests_with_route_index():
+    with create_client(routes=get_routes()) as client:
+        assert client.get("/users/me").json() == "me"
+        assert client.get("/users/1").json() == "user 1"
+        assert client.get("/users/john").json() == "name john"
+        assert client.get("/files/readme.txt").json() == "file readme"
+        assert client.get("/api/items-42").json() == "item42"
+        assert client.get("/static/css/main.css").json() == "rest css/main.css"
+        assert client.get("/nothing").status_code == 404
+
+
+def test_redirect_slashes_with_route_index():
+    with create_client(routes=get_routes()) as client:
+        response = client.get("/users/me/", follow_redirects=False)
+
+        assert response.status_code == 307
+        assert response.headers["location"].endswith("/users/me")
@@ -0,0 +1,113 @@
+from typing import Dict, List
+
+import pytest
+from lilya.status import HTTP_304_NOT_MODIFIED, HTTP_403_FORBIDDEN, HTTP_503_SERVICE_UNAVAILABLE
+
+from esmerald import Conditional, Gateway, Request, get, post, route
+from esmerald.exceptions import ImproperlyConfigured
+from esmerald.permissions import BasePermission
+from esmerald.responses import Response
+from esmerald.testclient import create_client
+
+
+class VersionPermission(BasePermission):
+    def has_permission(self, request: Request, apiview) -> bool:
+        return request.headers.get("authorization") == "token"
+
+
+def test_static_handlers_run_once() -> None:
+    calls: List[str] = []
+
+    @get("/version", static=True)
+    async def version() -> Dict[str, str]:
+        calls.append("version")
+        return {"version": "1.0.0"}
+
+    @get("/manifest", static=True)
+    def manifest() -> Dict[str, List[str]]:
+        calls.append("manifest")
+        return {"features": [f"feature-{number}" for number in range(100)]}
+
+    routes = [Gateway(handler=version), Gateway(handler=manifest)]
+
+    with create_client(routes=routes) as client:
+        for _ in range(3):
+            response = client.get("/version")
+
+            assert response.json() == {"version": "1.0.0"}
+            assert response.headers["content-type"] == "application/json"
+            assert "vary" not in response.headers
+
+        response = client.get("/manifest", headers={"accept-encoding": "identity"})
+
+        assert "content-encoding" not in response.headers
+        assert response.headers["vary"] == "accept-encoding"
+
+        response = client.get("/manifest", headers={"accept-encoding": "br, gzip"})
+
+        assert response.headers["content-encoding"] == "gzip"
+        assert len(response.json()["features"]) == 100
+
+        response = client.get("/manifest", headers={"accept-encoding": "gzip;q=0"})
+
+        assert "content-encoding" not in response.headers
+
+    assert calls == ["version", "manifest"]
+
+
+def test_static_handlers_are_authorized_and_conditional() -> None:
+    calls: List[str] = []
+
+    @get("/version", static=True, permissions=[VersionPermission], conditional=Conditional())
+    async def version() -> str:
+        calls.append("version")
+        return "1.0.0"
+
+    with create_client(routes=[Gateway(handler=version)]) as client:
+        assert client.get("/version").status_code == HTTP_403_FORBIDDEN
+
+        response = client.get("/version", headers={"authorization": "token"})
+        etag = response.headers["etag"]
+
+        response = client.get(
+            "/version", headers={"authorization": "token", "if-none-match": etag}
+        )
+
+        assert response.status_code == HTTP_304_NOT_MODIFIED
+        assert client.get("/version").status_code == HTTP_403_FORBIDDEN
+
+    assert calls == ["version"]
+
+
+def test_only_successful_responses_are_replayed() -> None:
+    calls: List[str] = []
+
+    @get("/health", static=True)
+    async def health() -> Response:
+        calls.append("health")
+        if len(calls) < 3:
+            return Response({"status": "starting"}, status_code=HTTP_503_SERVICE_UNAVAILABLE)
+        return Response({"status": "ok"})
+
+    with create_client(routes=[Gateway(handler=health)]) as client:
+        status_codes = [client.get("/health").status_code for _ in range(5)]
+
+    assert status_codes == [503, 503, 200, 200, 200]
+    assert len(calls) == 3
+
+
+def test_static_handlers_cannot_depend_on_the_request() -> None:
+    with pytest.raises(ImproperlyConfigured):
+
+        @get("/version", static=True)
+        async def version(name: str) -> str: ...
+
+    with pytest.raises(ImproperlyConfigured):
+
+        @route("/version", methods=["GET", "POST"], static=True)
+        async def mixed() -> str: ...
+
+    @post("/version")
+    async def create() -> str: ...
+
+    assert not create.static
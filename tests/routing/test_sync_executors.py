@@ -0,0 +1,161 @@
+import os
+import threading
+import time
+from functools import partial
+from typing import Dict
+
+import anyio
+import pytest
+
+from esmerald import Esmerald, Gateway, ImproperlyConfigured, Include, Inject, Injects, get
+from esmerald.executors import (
+    ProcessExecutor,
+    SyncExecutor,
+    ThreadExecutor,
+    get_executor_metrics,
+    get_sync_executor,
+)
+from esmerald.testclient import EsmeraldTestClient, create_client
+
+
+def block(seconds: float) -> None:
+    time.sleep(seconds)
+
+
+def thread_name() -> str:
+    return threading.current_thread().name
+
+
+def current_process_id() -> int:
+    return os.getpid()
+
+
+@get(
+    "/pid",
+    sync_executor=ProcessExecutor("test-processes", total_tokens=1),
+    dependencies={"parent": Inject(current_process_id)},
+)
+def process_id(parent: int = Injects()) -> Dict[str, int]:
+    return {"parent": parent, "worker": os.getpid()}
+
+
+def test_sync_handlers_run_inline_by_default() -> None:
+    @get("/")
+    def home() -> str:
+        return thread_name()
+
+    @get("/async")
+    async def loop() -> str:
+        return thread_name()
+
+    with create_client(routes=[Gateway(handler=home), Gateway(handler=loop)]) as client:
+        assert client.get("/").json() == client.get("/async").json()
+
+
+def test_closest_sync_executor_applies() -> None:
+    handlers = ThreadExecutor("handlers", total_tokens=2)
+
+    @get("/include")
+    def from_include() -> str:
+        return thread_name()
+
+    @get("/handler", sync_executor=handlers)
+    def from_handler() -> str:
+        return thread_name()
+
+    @get("/inline", sync_executor="inline")
+    def inline() -> str:
+        return thread_name()
+
+    @get("/async")
+    async def loop() -> str:
+        return thread_name()
+
+    with create_client(
+        routes=[
+            Include(
+                "/api",
+                routes=[
+                    Gateway(handler=from_include),
+                    Gateway(handler=from_handler),
+                    Gateway(handler=inline),
+                    Gateway(handler=loop),
+                ],
+                sync_executor=ThreadExecutor("include", total_tokens=2),
+            )
+        ]
+    ) as client:
+        event_loop_thread = client.get("/api/async").json()
+
+        assert client.get("/api/include").json() != event_loop_thread
+        assert client.get("/api/handler").json() != event_loop_thread
+        assert client.get("/api/inline").json() == event_loop_thread
+
+    assert from_include.dispatch_plan.executor.name == "include"
+    assert from_handler.dispatch_plan.executor is handlers
+    assert handlers.metrics().completed == 1
+
+
+def test_application_sync_executor_runs_sync_dependencies() -> None:
+    def dependency() -> str:
+        return thread_name()
+
+    @get("/", dependencies={"name": Inject(dependency)})
+    async def home(name: str = Injects()) -> Dict[str, str]:
+        return {"dependency": name, "handler": thread_name()}
+
+    app = Esmerald(routes=[Gateway(handler=home)], sync_executor="thread")
+
+    with EsmeraldTestClient(app) as client:
+        data = client.get("/").json()
+
+        assert data["dependency"] != data["handler"]
+
+
+def test_process_executor() -> None:
+    with create_client(routes=[Gateway(handler=process_id)]) as client:
+        response = client.get("/pid")
+
+        assert response.status_code == 200
+        assert response.json()["parent"] == os.getpid()
+        assert response.json()["worker"] != os.getpid()
+
+
+def test_process_executor_rejects_local_functions() -> None:
+    @get("/local")
+    def local() -> int:
+        return os.getpid()
+
+    app = Esmerald(routes=[Gateway(handler=local)], sync_executor="process")
+
+    with pytest.raises(ImproperlyConfigured):
+        app.router.freeze()
+
+
+def test_unknown_sync_executor() -> None:
+    with pytest.raises(ImproperlyConfigured):
+        get_sync_executor("coroutine")
+
+    assert isinstance(get_sync_executor("inline"), SyncExecutor)
+    assert get_sync_executor("thread") is get_sync_executor("thread")
+
+
+@pytest.mark.anyio
+async def test_metrics_report_the_queue_depth_and_the_saturation() -> None:
+    executor = ThreadExecutor("saturated", total_tokens=1)
+    metrics = []
+
+    async def observe() -> None:
+        await anyio.sleep(0.05)
+        metrics.append(get_executor_metrics()["saturated"])
+
+    async with anyio.create_task_group() as group:
+        for _ in range(3):
+            group.start_soon(partial(executor.run, block, seconds=0.1))
+        group.start_soon(observe)
+
+    assert metrics[0].running == 1
+    assert metrics[0].queued == 2
+    assert metrics[0].saturation == 1.0
+    assert executor.metrics().completed == 3
+    assert executor.metrics().queued == 0
@@ -0,0 +1,106 @@
+import json
+from typing import Any, AsyncIterator, Dict, Iterator
+
+import anyio
+import msgspec
+import pytest
+from pydantic import BaseModel
+
+from esmerald import Gateway, get
+from esmerald.datastructures import JSONStream
+from esmerald.datastructures.stream import JSONChunker
+from esmerald.testclient import create_client
+
+
+class User(BaseModel):
+    id: int
+    name: str
+
+
+class Item(msgspec.Struct):
+    id: int
+
+
+def users(count: int) -> Iterator[User]:
+    for number in range(count):
+        yield User(id=number, name=f"user{number}")
+
+
+async def items(count: int) -> AsyncIterator[Item]:
+    for number in range(count):
+        yield Item(id=number)
+
+
+def test_chunks_of_items() -> None:
+    chunker = JSONChunker(ndjson=False, batch_size=2, chunk_size=1024)
+
+    assert chunker.add({"id": 1}) is None
+    assert chunker.add({"id": 2}) == b'[{"id":1},{"id":2}'
+    assert chunker.add({"id": 3}) is None
+    assert chunker.close() == b',{"id":3}]'
+
+    chunker = JSONChunker(ndjson=True, batch_size=10, chunk_size=8)
+
+    assert chunker.add({"id": 1}) == b'{"id":1}\n'
+    assert chunker.close() == b""
+
+    assert JSONChunker(ndjson=False, batch_size=1, chunk_size=1).close() == b"[]"
+
+
+def test_json_stream() -> None:
+    @get("/users")
+    def get_users(count: int) -> JSONStream:
+        return JSONStream(iterator=users(count), batch_size=10)
+
+    @get("/items")
+    async def get_items(count: int) -> JSONStream:
+        return JSONStream(iterator=items(count), ndjson=True, batch_size=10)
+
+    @get("/mixed")
+    async def mixed() -> JSONStream:
+        values: Any = [User(id=1, name="user"), Item(id=2), {"id": 3}]
+        return JSONStream(iterator=lambda: iter(values))
+
+    routes = [Gateway(handler=get_users), Gateway(handler=get_items), Gateway(handler=mixed)]
+
+    with create_client(routes=routes) as client:
+        response = client.get("/users?count=25")
+
+        assert response.headers["content-type"] == "application/json"
+        assert response.json() == [{"id": number, "name": f"user{number}"} for number in range(25)]
+        assert client.get("/users?count=0").json() == []
+
+        response = client.get("/items?count=25")
+        lines = response.text.splitlines()
+
+        assert response.headers["content-type"] == "application/x-ndjson"
+        assert [json.loads(line) for line in lines] == [{"id": number} for number in range(25)]
+
+        assert client.get("/mixed").json() == [{"id": 1, "name": "user"}, {"id": 2}, {"id": 3}]
+
+
+@pytest.mark.anyio
+async def test_json_stream_is_consumed_lazily() -> None:
+    pulled = []
+    sent = []
+
+    def counted() -> Iterator[Dict[str, int]]:
+        for number in range(1000):
+            pulled.append(number)
+            yield {"id": number}
+
+    stream = JSONStream(iterator=counted(), ndjson=True, batch_size=100)
+    response = stream.to_response(headers={}, media_type="", status_code=200, app=None)
+
+    async def receive() -> Dict[str, Any]:
+        await anyio.sleep_forever()
+
+    async def send(message: Dict[str, Any]) -> None:
+        if message["type"] == "http.response.body":
+            sent.append(len(pulled))
+
+    await response({"type": "http"}, receive, send)
+
+    # Every chunk of 100 items is sent before pulling the next items.
+    assert sent[:3] == [100, 200, 300]
+    assert len(pulled) == 1000
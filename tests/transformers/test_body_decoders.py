@@ -0,0 +1,102 @@
+from typing import Any, Dict, List, Optional
+
+from lilya.status import HTTP_201_CREATED, HTTP_400_BAD_REQUEST
+from msgspec import Struct
+from pydantic import BaseModel
+
+from esmerald import Gateway, Inject, Injects, Request, post
+from esmerald.testclient import create_client
+
+
+class User(BaseModel):
+    name: str
+    tags: List[str] = []
+
+
+class Item(Struct):
+    name: str
+    price: float
+
+
+def count_json(monkeypatch) -> List[str]:
+    parsed = []
+    json = Request.json
+
+    async def counted_json(self) -> Any:
+        parsed.append(self.url.path)
+        return await json(self)
+
+    monkeypatch.setattr(Request, "json", counted_json)
+    return parsed
+
+
+def test_bodies_are_decoded_from_the_raw_bytes(monkeypatch) -> None:
+    @post("/users")
+    async def create_user(data: User) -> Dict[str, Any]:
+        return {"type": type(data).__name__, **data.model_dump()}
+
+    @post("/items")
+    async def create_item(payload: Item) -> Dict[str, Any]:
+        return {"type": type(payload).__name__, "name": payload.name, "price": payload.price}
+
+    @post("/optional")
+    async def optional_user(data: Optional[User] = None) -> Dict[str, Any]:
+        return {"data": data.name if data else None}
+
+    routes = [
+        Gateway(handler=create_user),
+        Gateway(handler=create_item),
+        Gateway(handler=optional_user),
+    ]
+
+    with create_client(routes=routes) as client:
+        parsed = count_json(monkeypatch)
+
+        response = client.post("/users", json={"name": "esmerald", "tags": ["a"]})
+
+        assert response.status_code == HTTP_201_CREATED
+        assert response.json() == {"type": "User", "name": "esmerald", "tags": ["a"]}
+
+        response = client.post("/items", json={"name": "item", "price": "1.5"})
+
+        assert response.status_code == HTTP_400_BAD_REQUEST
+
+        response = client.post("/items", json={"name": "item", "price": 1.5})
+
+        assert response.json() == {"type": "Item", "name": "item", "price": 1.5}
+
+        assert client.post("/optional", json={"name": "lilya"}).json() == {"data": "lilya"}
+
+        assert parsed == ["/items"]
+
+
+def test_invalid_bodies_keep_the_validation_errors() -> None:
+    @post("/users")
+    async def create_user(data: User) -> None: ...
+
+    with create_client(routes=[Gateway(handler=create_user)]) as client:
+        response = client.post("/users", json={"tags": ["a"]})
+        handler = client.app.routes[0].handler
+
+        assert handler.dispatch_plan.body_decoder is not None
+
+        handler._dispatch_plan = handler.dispatch_plan._replace(body_decoder=None)
+        expected = client.post("/users", json={"tags": ["a"]})
+
+    assert response.status_code == HTTP_400_BAD_REQUEST
+    assert response.json() == expected.json()
+
+
+def test_bodies_read_by_dependencies_are_not_decoded() -> None:
+    def get_name(data: Dict[str, Any]) -> str:
+        return data["name"]
+
+    @post("/users", dependencies={"name": Inject(get_name)})
+    async def create_user(data: User, name: str = Injects()) -> Dict[str, Any]:
+        return {"name": name, "user": data.name}
+
+    with create_client(routes=[Gateway(handler=create_user)]) as client:
+        response = client.post("/users", json={"name": "esmerald"})
+
+        assert response.json() == {"name": "esmerald", "user": "esmerald"}
+        assert client.app.routes[0].handler.dispatch_plan.body_decoder is None
@@ -0,0 +1,61 @@
+from typing import Any, Dict
+
+from lilya.datastructures import State
+
+from esmerald import Cookie, Gateway, Header, Request, get
+from esmerald.testclient import create_client
+from esmerald.transformers.model import ConnectionSource
+
+
+def test_only_the_declared_sources_are_parsed(monkeypatch) -> None:
+    parsed = []
+    cookies = Request.cookies
+
+    def read_cookies(self) -> Dict[str, str]:
+        parsed.append(self.url.path)
+        return cookies.fget(self)
+
+    monkeypatch.setattr(Request, "cookies", property(read_cookies))
+
+    @get("/items/{item_id}")
+    async def item(item_id: int, q: str = "q") -> Dict[str, Any]:
+        return {"item_id": item_id, "q": q}
+
+    @get("/session")
+    async def session(
+        session: str = Cookie(value="session"), agent: str = Header(value="user-agent")
+    ) -> Dict[str, Any]:
+        return {"session": session, "agent": agent}
+
+    with create_client(routes=[Gateway(handler=item), Gateway(handler=session)]) as client:
+        response = client.get("/items/1", params={"q": "search"}, cookies={"session": "abc"})
+
+        assert response.json() == {"item_id": 1, "q": "search"}
+        assert parsed == []
+
+        response = client.get(
+            "/session", cookies={"session": "abc"}, headers={"user-agent": "esmerald"}
+        )
+
+        assert response.json() == {"session": "abc", "agent": "esmerald"}
+        assert parsed == ["/session"]
+
+    assert item.transformer.sources == (
+        ConnectionSource.QUERY_PARAMS | ConnectionSource.PATH_PARAMS
+    )
+    assert session.transformer.sources == ConnectionSource.HEADERS | ConnectionSource.COOKIES
+
+
+def test_state_is_a_view_of_the_application_state() -> None:
+    @get("/state")
+    async def read_state(state: State) -> Dict[str, Any]:
+        state.local = "request"
+        return {"name": state.name, "local": state.local}
+
+    with create_client(routes=[Gateway(handler=read_state)]) as client:
+        client.app.state.name = "esmerald"
+
+        response = client.get("/state")
+
+        assert response.json() == {"name": "esmerald", "local": "request"}
+        assert not hasattr(client.app.state, "local")
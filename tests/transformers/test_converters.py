@@ -0,0 +1,113 @@
+from typing import Any, Optional
+from uuid import UUID
+
+import pytest
+from lilya.status import HTTP_200_OK, HTTP_400_BAD_REQUEST
+from pydantic import TypeAdapter, ValidationError
+
+from esmerald import Gateway, Query, Request, get
+from esmerald.testclient import create_client
+from esmerald.transformers.converters import FALLBACK, get_converter
+from esmerald.transformers.signature import SignatureModel
+
+VALUES = [
+    "1",
+    "007",
+    "-1",
+    "+1",
+    " 1",
+    "1_000",
+    "1.5",
+    "1e3",
+    "inf",
+    "true",
+    "TRUE",
+    "off",
+    "2",
+    "",
+    "12345678-1234-5678-1234-567812345678",
+    "12345678123456781234567812345678",
+    "9" * 30,
+    1,
+    1.5,
+    True,
+    None,
+    UUID("12345678-1234-5678-1234-567812345678"),
+]
+
+
+@pytest.mark.parametrize("annotation", [int, str, float, bool, UUID, Optional[int], Any])
+def test_converters_match_the_validation(annotation) -> None:
+    converter = get_converter(annotation)
+    adapter = TypeAdapter(annotation)
+
+    for value in VALUES:
+        converted = converter(value)
+        if converted is FALLBACK:
+            continue
+
+        validated = adapter.validate_python(value)
+        assert converted == validated
+        assert type(converted) is type(validated)
+
+
+def test_converters_fall_back_on_invalid_values() -> None:
+    for annotation, value in [(int, "one"), (bool, "2"), (UUID, "uuid"), (str, 1)]:
+        assert get_converter(annotation)(value) is FALLBACK
+
+        with pytest.raises(ValidationError):
+            TypeAdapter(annotation).validate_python(value)
+
+
+def test_primitive_handlers_skip_the_signature_model(monkeypatch) -> None:
+    @get("/items/{item_id}")
+    async def item(
+        request: Request, item_id: int, q: Optional[str] = None, limit: int = 10
+    ) -> dict:
+        return {"item_id": item_id, "q": q, "limit": limit, "path": request.url.path}
+
+    @get("/bounded/{item_id}")
+    async def bounded(item_id: int, limit: int = Query(default=10, gt=0)) -> dict:
+        return {"item_id": item_id, "limit": limit}
+
+    with create_client(routes=[Gateway(handler=item), Gateway(handler=bounded)]) as client:
+        instances = []
+        init = SignatureModel.__init__
+
+        def counted_init(self, **kwargs):
+            instances.append(type(self))
+            init(self, **kwargs)
+
+        monkeypatch.setattr(SignatureModel, "__init__", counted_init)
+
+        response = client.get("/items/1", params={"limit": "5"})
+
+        assert response.status_code == HTTP_200_OK
+        assert response.json() == {"item_id": 1, "q": None, "limit": 5, "path": "/items/1"}
+        assert instances == []
+
+        response = client.get("/bounded/1", params={"limit": "5"})
+
+        assert response.json() == {"item_id": 1, "limit": 5}
+        assert instances == [bounded.signature_model]
+
+    assert item.signature_model.converters is not None
+    assert bounded.signature_model.converters is None
+
+
+def test_invalid_primitive_values_keep_the_validation_errors() -> None:
+    @get("/items/{item_id}")
+    async def item(item_id: int, limit: int = 10) -> dict:
+        return {"item_id": item_id, "limit": limit}
+
+    @get("/bounded/{item_id}")
+    async def bounded(item_id: int, limit: int = Query(default=10, ge=0)) -> dict:
+        return {"item_id": item_id, "limit": limit}
+
+    with create_client(routes=[Gateway(handler=item), Gateway(handler=bounded)]) as client:
+        response = client.get("/items/1", params={"limit": "many"})
+        expected = client.get("/bounded/1", params={"limit": "many"})
+
+    assert response.status_code == HTTP_400_BAD_REQUEST
+    assert response.json()["errors"] == expected.json()["errors"]
+    assert response.json()["errors"][0]["loc"] == ["limit"]
@@ -0,0 +1,13 @@
+from esmerald.transformers.signature import get_dependency_signature
+
+
+def get_repository(database: str) -> str:
+    return f"repository of {database}"
+
+
+def test_dependency_signatures_are_shared() -> None:
+    first = get_dependency_signature(get_repository, {"repository"})
+    second = get_dependency_signature(get_repository, {"repository"})
+
+    assert first is second
+    assert get_dependency_signature(get_repository, set()) is not first
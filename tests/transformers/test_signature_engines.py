@@ -0,0 +1,130 @@
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional
+
+import pytest
+from lilya.status import HTTP_200_OK, HTTP_201_CREATED, HTTP_400_BAD_REQUEST
+from pydantic import BaseModel
+
+from esmerald import Esmerald, Gateway, Include, Query, get, post
+from esmerald.exceptions import ImproperlyConfigured
+from esmerald.testclient import EsmeraldTestClient
+from esmerald.transformers.engines import SIGNATURE_ENGINES, get_signature_engine
+
+
+@dataclass
+class Item:
+    name: str
+    price: float
+
+
+class User(BaseModel):
+    name: str
+
+
+def get_routes() -> List[Gateway]:
+    @post("/items")
+    async def items(data: List[Item], limit: int = 10, q: Optional[str] = None) -> Dict[str, Any]:
+        return {
+            "names": [item.name for item in data],
+            "types": sorted({type(item).__name__ for item in data}),
+            "limit": limit,
+            "q": q,
+        }
+
+    @post("/users/{pk}")
+    async def users(pk: int, data: User, size: int = Query(default=1, gt=0)) -> Dict[str, Any]:
+        return {"pk": pk, "name": data.name, "type": type(data).__name__, "size": size}
+
+    @get("/tags")
+    async def tags(limit: int, tags: List[str] = None) -> Dict[str, Any]:
+        return {"limit": limit, "tags": tags}
+
+    return [Gateway(handler=items), Gateway(handler=users), Gateway(handler=tags)]
+
+
+def test_signature_engine_is_selected_per_include() -> None:
+    app = Esmerald(
+        routes=[
+            Include("/msgspec", routes=get_routes(), signature_engine="msgspec"),
+            Include("/pydantic", routes=get_routes()),
+        ]
+    )
+
+    with EsmeraldTestClient(app) as client:
+        response = client.post("/msgspec/items", json=[{"name": "esmerald", "price": 1}])
+
+        assert response.status_code == HTTP_201_CREATED
+
+    msgspec_include, pydantic_include = app.routes
+
+    assert msgspec_include.routes[0].handler.dispatch_plan.signature is not None
+    assert pydantic_include.routes[0].handler.dispatch_plan.signature is None
+
+
+def test_msgspec_engine_matches_the_signature_model() -> None:
+    payload = [{"name": "esmerald", "price": "1.5"}, {"name": "lilya", "price": 2}]
+
+    with EsmeraldTestClient(Esmerald(routes=get_routes())) as client:
+        expected = client.post("/items", params={"limit": "3"}, json=payload)
+        expected_user = client.post("/users/1", params={"size": "2"}, json={"name": "esmerald"})
+
+    app = Esmerald(routes=get_routes(), signature_engine="msgspec")
+    with EsmeraldTestClient(app) as client:
+        response = client.post("/items", params={"limit": "3"}, json=payload)
+        user = client.post("/users/1", params={"size": "2"}, json={"name": "esmerald"})
+
+    assert response.status_code == HTTP_201_CREATED
+    assert response.json() == expected.json()
+    assert response.json()["types"] == ["Item"]
+    assert user.json() == expected_user.json()
+    assert user.json() == {"pk": 1, "name": "esmerald", "type": "User", "size": 2}
+
+    signature = app.routes[1].handler.dispatch_plan.signature
+    assert signature.fallback_fields == ("data", "size")
+
+
+def test_list_query_params() -> None:
+    responses = []
+    for engine in SIGNATURE_ENGINES:
+        app = Esmerald(routes=get_routes(), signature_engine=engine)
+
+        with EsmeraldTestClient(app) as client:
+            response = client.get("/tags", params={"limit": "1", "tags": ["a", "b"]})
+
+            assert response.status_code == HTTP_200_OK
+            assert response.json()["limit"] == 1
+            assert {"a", "b"}.issubset(response.json()["tags"])
+            responses.append(response.json())
+
+    assert responses[0] == responses[1]
+
+
+def test_msgspec_engine_errors() -> None:
+    requests: List[Dict[str, Any]] = [
+        {"method": "POST", "url": "/items", "json": [{"name": "esmerald"}]},
+        {"method": "POST", "url": "/items", "params": {"limit": "many"}, "json": []},
+        {"method": "POST", "url": "/users/1", "params": {"size": "0"}, "json": {"name": "x"}},
+        {"method": "GET", "url": "/tags", "params": {"limit": "x", "tags": ["a"]}},
+    ]
+
+    with EsmeraldTestClient(Esmerald(routes=get_routes())) as client:
+        expected = [client.request(**request).json() for request in requests]
+
+    app = Esmerald(routes=get_routes(), signature_engine="msgspec")
+    with EsmeraldTestClient(app) as client:
+        for request, errors in zip(requests, expected):
+            response = client.request(**request)
+
+            assert response.status_code == HTTP_400_BAD_REQUEST
+            assert response.json() == errors
+
+    assert expected[0]["errors"][0]["type"] == "missing"
+    assert expected[1]["errors"][0]["type"] == "int_parsing"
+    assert expected[2]["errors"][0]["type"] == "greater_than"
+
+
+def test_unknown_signature_engine() -> None:
+    handler = get_routes()[0].handler
+
+    with pytest.raises(ImproperlyConfigured):
+        get_signature_engine("marshmallow", handler.signature_model)
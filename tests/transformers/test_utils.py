@@ -1,10 +1,18 @@
+from typing import Dict, List, Optional, Union
+
 import pytest
+from lilya.datastructures import URL, QueryParam
 from pydantic import BaseModel
 
-from esmerald import File, ImproperlyConfigured, Param, ValidationErrorException, get
+from esmerald import File, ImproperlyConfigured, Param, Query, ValidationErrorException, get
 from esmerald.enums import ParamType
 from esmerald.transformers.model import ParamSetting
-from esmerald.transformers.utils import get_request_params, get_signature
+from esmerald.transformers.utils import (
+    compile_request_params,
+    extract_request_params,
+    get_request_params,
+    get_signature,
+)
 
 
 def test_get_signature_improperly_configured():
@@ -54,3 +62,44 @@ def test_get_request_params_raise_validation_error_exception():  # pragma: no co
         get_request_params(
             params=set_params, expected=expected_params, url="http://testserver.com"
         )
+
+
+def make_param_setting(name: str, annotation, default=None) -> ParamSetting:
+    field_info = Query(default=default)
+    field_info.annotation = annotation
+    return ParamSetting(
+        default_value=default,
+        field_alias=name,
+        field_name=name,
+        is_required=False,
+        param_type=ParamType.QUERY,
+        field_info=field_info,
+    )
+
+
+def test_compiled_request_params():
+    expected = {
+        make_param_setting("name", str),
+        make_param_setting("limit", Optional[int], default=10),
+        make_param_setting("tags", List[str]),
+        make_param_setting("extra", Union[Dict[str, str], None]),
+    }
+    plan = compile_request_params(expected)
+    params = QueryParam("name=esmerald&tags=a&tags=b")
+
+    values = extract_request_params(params, plan, URL("/items"))
+
+    assert values["name"] == "esmerald"
+    assert values["limit"] == 10
+    assert list(values["tags"]) == list(params.values())
+    assert values["extra"] == dict(params.items())
+    assert values.keys() == get_request_params(params, expected, URL("/items")).keys()
+
+
+def test_compiled_request_params_missing_required():
+    param = make_param_setting("name", str)._replace(is_required=True)
+    plan = compile_request_params({param})
+
+    assert plan.required == ("name",)
+    with pytest.raises(ValidationErrorException):
+        extract_request_params(QueryParam(""), plan, URL("/items"))